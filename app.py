@@ -1,9 +1,21 @@
+import os
 from flask import Flask
-from routes.routes import main_bp
+from routes.routes import main_bp, aquecimento
 
-def create_app():
+# Aquecimento do jogo: 'segundo_plano' (padrão), 'sincrono' ou 'manual'
+MODO_AQUECIMENTO = os.environ.get("CONTEXTO_AQUECIMENTO", "segundo_plano")
+
+def create_app(aquecer=MODO_AQUECIMENTO):
     app = Flask(__name__)
     app.register_blueprint(main_bp)
+
+    # O carregamento pesado fica fora do import: /healthz responde na hora
+    # e /readyz só fica verde quando o modelo e o puzzle de hoje estão prontos
+    if aquecer == "sincrono":
+        aquecimento.iniciar(em_segundo_plano=False)
+    elif aquecer != "manual":
+        aquecimento.iniciar()
+
     return app
 
 app = create_app()
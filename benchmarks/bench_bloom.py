@@ -0,0 +1,83 @@
+"""
+Confere e mede o filtro de Bloom das palavras aceitáveis (routes/filtro_bloom.py).
+
+Para cada configuração de --bits (bits por palavra):
+    falsos neg.   palavras da lista que o filtro recusaria (precisa ser 0)
+    falsos pos.   fração de palavras aleatórias ("lixo") que o filtro deixa passar
+    memória       tamanho do filtro, comparado ao índice de palavras
+    consulta      tempo médio para recusar lixo, comparado a palavra_existe
+
+Sem base_palavras/com_acento.txt, usa uma lista sintética de --palavras palavras.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_bloom
+    python -m benchmarks.bench_bloom --bits 6 10 16 --lixo 200000
+"""
+import argparse
+import random
+import sys
+import time
+
+from routes import filtro_bloom
+from routes import indice_palavras
+from routes import input_filter
+
+LETRAS = "abcdefghijlmnopqrstuvxzáâãéêíóôõúç"
+
+
+def palavra_aleatoria(rng, minimo=3, maximo=12):
+    return "".join(rng.choice(LETRAS) for _ in range(rng.randint(minimo, maximo)))
+
+
+def tempo_medio(funcao, entradas):
+    inicio = time.perf_counter()
+    for palavra in entradas:
+        funcao(palavra)
+    return (time.perf_counter() - inicio) / len(entradas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bits", nargs="+", type=float, default=[4, 8, 10, 16])
+    parser.add_argument("--palavras", type=int, default=300000, help="tamanho da lista sintética")
+    parser.add_argument("--lixo", type=int, default=100000, help="palavras aleatórias consultadas")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    if len(input_filter.INDICE_PALAVRAS) == 0:
+        sinteticas = {palavra_aleatoria(rng) for _ in range(args.palavras)}
+        input_filter.INDICE_PALAVRAS = indice_palavras.IndicePalavras.a_partir_de_palavras(sinteticas)
+        print(f"📚 Lista sintética: {len(input_filter.INDICE_PALAVRAS)} palavras")
+    else:
+        print(f"📚 Lista real: {len(input_filter.INDICE_PALAVRAS)} palavras")
+
+    aceitaveis = [*input_filter.INDICE_PALAVRAS, *input_filter.TABELA_PALAVRAS_TECNOLOGIA]
+    lixo = [palavra_aleatoria(rng, 6, 14) for _ in range(args.lixo)]
+    lixo = [p for p in lixo if not input_filter.palavra_existe(p)]
+
+    memoria_indice = input_filter.INDICE_PALAVRAS.memoria_bytes()
+    tempo_indice = tempo_medio(input_filter.palavra_existe, lixo)
+    print(f"🔎 palavra_existe: {memoria_indice / 1e6:.1f} MB | {tempo_indice * 1e6:.2f} µs por consulta\n")
+
+    print(f"{'BITS':>5} | {'HASHES':>6} | {'FALSOS NEG.':>11} | {'FALSOS POS.':>11} | {'MEMÓRIA':>10} | {'CONSULTA':>9} | GANHO")
+    print("-" * 80)
+
+    falsos_negativos_total = 0
+    for bits in args.bits:
+        filtro = filtro_bloom.FiltroBloom.a_partir_de_palavras(aceitaveis, bits)
+        falsos_negativos = sum(p not in filtro for p in aceitaveis)
+        falsos_positivos = sum(p in filtro for p in lixo) / len(lixo)
+        tempo = tempo_medio(filtro.__contains__, lixo)
+        falsos_negativos_total += falsos_negativos
+
+        print(f"{bits:5.0f} | {filtro.k:>6} | {falsos_negativos:>11} | {falsos_positivos:11.3%} | "
+              f"{filtro.memoria_bytes() / 1e3:7.0f} KB | {tempo * 1e6:6.2f} µs | {tempo_indice / tempo:4.2f}x")
+
+    if falsos_negativos_total:
+        print(f"\n❌ {falsos_negativos_total} falsos negativos")
+        sys.exit(1)
+    print("\n✅ Nenhum falso negativo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark de memória do carregamento do modelo NILC.
+
+Cada modo roda em um processo novo e informa o tempo e o pico de RSS
+(ru_maxrss) do processo inteiro:
+
+    antigo     load_file() da matriz completa + matriz_inteira[indices_validos]
+               + KeyedVectors.add_vectors (código original)
+    seletivo   leitura em blocos só das linhas aprovadas (safe_open)
+    compilado  abertura do modelo compilado via mmap
+
+Uso (a partir da raiz do projeto, com o modelo no cache do Hugging Face):
+    python -m benchmarks.bench_carregamento
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def pico_rss_mb():
+    """Pico de memória residente do processo atual (Linux: ru_maxrss em KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def carregar_antigo():
+    """
+    Cópia fiel do carregamento original de routes/model_loader.py
+    (não usa o model_loader, que já lê só as linhas aprovadas)
+    """
+    import re
+    from spacy.lang.pt.stop_words import STOP_WORDS
+    from huggingface_hub import hf_hub_download
+    from safetensors.numpy import load_file
+    from gensim.models import KeyedVectors
+
+    def palavra_eh_valida(palavra):
+        if len(palavra) < 2: return False
+        if ' ' in palavra or '_' in palavra: return False
+        if palavra in STOP_WORDS: return False
+        if re.search(r'[^a-zááàâãéèêíïóôõöúçñ]', palavra): return False
+        return True
+
+    repo = "nilc-nlp/fasttext-skip-gram-300d"
+    emb_path = hf_hub_download(repo_id=repo, filename="embeddings.safetensors")
+    vocab_path = hf_hub_download(repo_id=repo, filename="vocab.txt")
+
+    indices_validos = []
+    palavras_validas = []
+    with open(vocab_path, "r", encoding="utf-8") as f_entrada:
+        for i, line in enumerate(f_entrada):
+            palavra = line.strip()
+            if palavra_eh_valida(palavra):
+                palavras_validas.append(palavra)
+                indices_validos.append(i)
+
+    matriz_inteira = load_file(emb_path)["embeddings"]
+    vetores_filtrados = matriz_inteira[indices_validos]
+
+    word2vec = KeyedVectors(vector_size=300)
+    word2vec.add_vectors(palavras_validas, vetores_filtrados)
+    return word2vec
+
+
+def executar_modo(modo):
+    """Roda dentro do processo filho e imprime 'tempo pico palavras'"""
+    inicio = time.perf_counter()
+
+    if modo == "antigo":
+        word2vec = carregar_antigo()
+    else:
+        # Seletivo ou compilado, conforme o conteúdo de CONTEXTO_ARTEFATOS
+        from routes.model_loader import carregar_modelo
+        word2vec = carregar_modelo()
+
+    print(f"{time.perf_counter() - inicio:.2f} {pico_rss_mb():.0f} {len(word2vec)}")
+
+
+def medir(modo, diretorio_artefatos):
+    ambiente = dict(os.environ, CONTEXTO_ARTEFATOS=diretorio_artefatos)
+    saida = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_carregamento", "--filho", modo],
+        capture_output=True, text=True, env=ambiente, check=True,
+    ).stdout.strip().splitlines()[-1]
+
+    tempo, pico, palavras = saida.split()
+    return float(tempo), float(pico), int(palavras)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filho", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        executar_modo(args.filho)
+        return
+
+    print(f"{'MODO':<12} | {'TEMPO':>8} | {'PICO RSS':>10} | PALAVRAS")
+    print("-" * 50)
+
+    with tempfile.TemporaryDirectory() as vazio, tempfile.TemporaryDirectory() as compilado:
+        # 'seletivo' roda sem modelo compilado e deixa o artefato pronto para 'compilado'
+        for modo, diretorio in [("antigo", vazio), ("seletivo", compilado), ("compilado", compilado)]:
+            tempo, pico, palavras = medir(modo, diretorio)
+            print(f"{modo:<12} | {tempo:7.2f}s | {pico:7.0f} MB | {palavras}")
+
+
+if __name__ == "__main__":
+    main()
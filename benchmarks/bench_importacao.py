@@ -0,0 +1,93 @@
+"""
+Custo de importação dos módulos do projeto (python -X importtime).
+
+Cada alvo é importado em um processo novo; a saída do -X importtime é
+agregada por pacote de topo (tempo próprio somado) e os módulos mais
+caros são listados. Também confere que as bibliotecas pesadas de NLP
+não são carregadas no import (só nos caminhos que as usam): se alguma
+aparecer, o script termina com código 1.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_importacao
+    python -m benchmarks.bench_importacao --alvos routes.jogo --top 20 --repeticoes 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ALVOS = ["app", "routes.routes", "routes.jogo", "routes.model_loader", "routes.dicionario"]
+
+# Não devem ser importadas junto com a aplicação
+BIBLIOTECAS_PESADAS = ["spacy", "gensim", "wordfreq", "spellchecker", "hunspell",
+                       "safetensors", "huggingface_hub"]
+
+
+def medir_importacao(alvo):
+    """Importa 'alvo' em um processo novo. Retorna {módulo: (próprio_us, acumulado_us)}"""
+    # 'manual': o create_app não dispara o aquecimento (que importaria o resto)
+    ambiente = dict(os.environ, CONTEXTO_AQUECIMENTO="manual")
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {alvo}"],
+        capture_output=True, text=True, env=ambiente, check=True,
+    )
+
+    modulos = {}
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        modulos[nome.strip()] = (int(proprio), int(acumulado))
+    return modulos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alvos", nargs="+", default=ALVOS)
+    parser.add_argument("--top", type=int, default=10, help="módulos mais caros listados por alvo")
+    parser.add_argument("--repeticoes", type=int, default=3, help="usa a mediana de N execuções")
+    args = parser.parse_args()
+
+    regressoes = []
+
+    for alvo in args.alvos:
+        try:
+            execucoes = [medir_importacao(alvo) for _ in range(args.repeticoes)]
+        except subprocess.CalledProcessError as e:
+            print(f"❌ {alvo}: falhou ao importar\n{e.stderr.strip().splitlines()[-1]}\n")
+            regressoes.append(alvo)
+            continue
+
+        # Mediana por módulo (o primeiro import também paga o cache de .pyc)
+        modulos = {}
+        for nome in execucoes[0]:
+            proprios = [ex[nome][0] for ex in execucoes if nome in ex]
+            acumulados = [ex[nome][1] for ex in execucoes if nome in ex]
+            modulos[nome] = (statistics.median(proprios), statistics.median(acumulados))
+
+        total = modulos.get(alvo, (0, 0))[1]
+        por_pacote = defaultdict(float)
+        for nome, (proprio, _) in modulos.items():
+            por_pacote[nome.split(".")[0]] += proprio
+
+        print(f"📦 {alvo}: {total / 1000:.1f} ms | {len(modulos)} módulos")
+        print(f"   {'PACOTE':<24} | {'PRÓPRIO':>10}")
+        for pacote, proprio in sorted(por_pacote.items(), key=lambda x: -x[1])[:args.top]:
+            print(f"   {pacote:<24} | {proprio / 1000:7.1f} ms")
+
+        pesadas = [b for b in BIBLIOTECAS_PESADAS if b in por_pacote]
+        if pesadas:
+            print(f"   ⚠️ Importadas no carregamento: {', '.join(pesadas)}")
+            regressoes.append(alvo)
+        print()
+
+    if regressoes:
+        print(f"❌ Import com bibliotecas pesadas (ou com erro): {', '.join(regressoes)}")
+        sys.exit(1)
+    print("✅ Nenhuma biblioteca pesada importada no carregamento")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Memória e consultas por segundo do índice de palavras do input_filter.
+
+    lista+bisect  lista de str ordenada + bisect (implementação anterior)
+    blob+hash     IndicePalavras (routes/indice_palavras.py), aberto via mmap
+    marisa-trie   marisa_trie.Trie, só para comparação (se estiver instalado)
+
+As consultas misturam palavras da lista e candidatos inexistentes gerados
+como os dos padronizar_* (troca de sufixo), meio a meio.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_indice_palavras                  # base_palavras/com_acento.txt
+    python -m benchmarks.bench_indice_palavras --sintetico 300000
+"""
+import argparse
+import bisect
+import os
+import random
+import sys
+import tempfile
+import time
+
+from routes import indice_palavras
+from routes import input_filter
+
+LETRAS = "abcdefghijklmnopqrstuvwxyzáàâãéêíóôõúç"
+SUFIXOS = ["ar", "er", "ir", "o", "a", "ão", "al", "el", "il", "m", "s", "es"]
+
+
+def memoria_lista(palavras):
+    """Lista + objetos str (o que a tabela antiga mantinha na memória)"""
+    return sys.getsizeof(palavras) + sum(sys.getsizeof(p) for p in palavras)
+
+
+def medir_consultas(existe, consultas, repeticoes):
+    """Consultas por segundo (melhor de N rodadas)"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for palavra in consultas:
+            existe(palavra)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return len(consultas) / melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sintetico", type=int, default=0, help="usa N palavras aleatórias em vez da lista real")
+    parser.add_argument("--consultas", type=int, default=200000)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    if args.sintetico:
+        palavras = sorted({"".join(rng.choice(LETRAS) for _ in range(rng.randint(3, 14)))
+                           for _ in range(args.sintetico)})
+    else:
+        with open(input_filter.CAMINHO_ARQUIVO, "r", encoding="utf-8") as f:
+            palavras = sorted({linha.strip() for linha in f if linha.strip()})
+
+    existentes = rng.choices(palavras, k=args.consultas // 2)
+    candidatos = [p[:-2] + rng.choice(SUFIXOS) for p in rng.choices(palavras, k=args.consultas - len(existentes))]
+    consultas = existentes + candidatos
+    rng.shuffle(consultas)
+
+    print(f"📚 {len(palavras)} palavras | {len(consultas)} consultas\n")
+    print(f"{'ESTRUTURA':<14} | {'MEMÓRIA':>10} | {'CONSULTAS/S':>12}")
+    print("-" * 44)
+
+    def existe_lista(palavra):
+        i = bisect.bisect_left(palavras, palavra)
+        return i < len(palavras) and palavras[i] == palavra
+
+    print(f"{'lista+bisect':<14} | {memoria_lista(palavras) / 1e6:7.1f} MB | "
+          f"{medir_consultas(existe_lista, consultas, args.repeticoes):12,.0f}")
+
+    with tempfile.TemporaryDirectory() as temporario:
+        diretorio = os.path.join(temporario, "indice")
+        indice_palavras.salvar(diretorio, indice_palavras.IndicePalavras.a_partir_de_palavras(palavras))
+        indice = indice_palavras.carregar(diretorio)
+
+        print(f"{'blob+hash':<14} | {indice.memoria_bytes() / 1e6:7.1f} MB | "
+              f"{medir_consultas(indice.__contains__, consultas, args.repeticoes):12,.0f}")
+
+        try:
+            import marisa_trie
+        except ImportError:
+            print(f"{'marisa-trie':<14} | {'(não instalado)':>27}")
+            return
+
+        caminho = os.path.join(temporario, "indice.marisa")
+        marisa_trie.Trie(palavras).save(caminho)
+        trie = marisa_trie.Trie().mmap(caminho)
+        print(f"{'marisa-trie':<14} | {os.path.getsize(caminho) / 1e6:7.1f} MB | "
+              f"{medir_consultas(trie.__contains__, consultas, args.repeticoes):12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Confere e mede o mapa forma -> lema (routes/mapa_lemas.py) contra o
+formatar_palavra calculado pelas regras.
+
+1. Resultados: para cada forma, MapaLemas.consultar precisa devolver o mesmo
+   que o pipeline (com inputUsuario True e False). Diferença termina com código 1.
+2. Vazão: palavras por segundo das regras (sem cache LRU) e do mapa aberto
+   via mmap, além do tamanho do mapa em disco.
+
+Sem base_palavras/com_acento.txt, usa o dicionário sintético do bench_sufixos.
+O mapa é gravado em um diretório temporário (não mexe em artefatos/).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_lemas
+    python -m benchmarks.bench_lemas --radicais 5000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks import bench_sufixos
+from routes import input_filter
+from routes import mapa_lemas
+
+
+def medir(funcao, entradas, repeticoes):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for palavra in entradas:
+            funcao(palavra)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return len(entradas) / melhor
+
+
+def tamanho_diretorio(diretorio):
+    return sum(os.path.getsize(os.path.join(raiz, nome)) for raiz, _, nomes in os.walk(diretorio) for nome in nomes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--radicais", type=int, default=2000)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    entradas = sorted(bench_sufixos.entradas_dos_testes() | set(bench_sufixos.gerar_corpus(rng, args.radicais)))
+
+    if len(input_filter.INDICE_PALAVRAS) == 0:
+        tamanho = bench_sufixos.instalar_dicionario_sintetico(rng, entradas)
+        print(f"📚 Dicionário sintético: {tamanho} palavras")
+    else:
+        print(f"📚 Dicionário real: {len(input_filter.INDICE_PALAVRAS)} palavras")
+
+    input_filter.instalar_mapa_lemas(None)
+    regras = input_filter.formatar_palavra.__wrapped__  # sem o cache LRU
+
+    inicio = time.perf_counter()
+    with tempfile.TemporaryDirectory() as temporario:
+        diretorio = os.path.join(temporario, "lemas")
+        mapa_lemas.salvar(diretorio, mapa_lemas.construir_mapa([*input_filter.INDICE_PALAVRAS, *entradas]))
+        mapa = mapa_lemas.carregar(diretorio)
+        print(f"🔤 Mapa: {len(mapa)} formas | {tamanho_diretorio(diretorio) / 1e6:.1f} MB em disco | "
+              f"construído em {time.perf_counter() - inicio:.2f}s\n")
+
+        diferencas = 0
+        for inputUsuario in (True, False):
+            erradas = [p for p in entradas if mapa.consultar(p, inputUsuario) != regras(p, inputUsuario)]
+            diferencas += len(erradas)
+            for palavra in erradas[:5]:
+                print(f"   ⚠️ '{palavra}' (inputUsuario={inputUsuario}): "
+                      f"regras={regras(palavra, inputUsuario)!r} mapa={mapa.consultar(palavra, inputUsuario)!r}")
+
+        vazao_regras = medir(regras, entradas, args.repeticoes)
+        vazao_mapa = medir(mapa.consultar, entradas, args.repeticoes)
+        del mapa
+
+    print(f"{'CAMINHO':<24} | {'VAZÃO':>12} | GANHO")
+    print("-" * 50)
+    print(f"{'regras (pipeline)':<24} | {vazao_regras:10,.0f}/s | 1.00x")
+    print(f"{'mapa (mmap)':<24} | {vazao_mapa:10,.0f}/s | {vazao_mapa / vazao_regras:4.2f}x")
+
+    if diferencas:
+        print(f"\n❌ {diferencas} resultados diferentes")
+        sys.exit(1)
+    print(f"\n✅ Resultados idênticos ({len(entradas)} entradas)")
+
+
+if __name__ == "__main__":
+    main()
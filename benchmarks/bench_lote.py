@@ -0,0 +1,90 @@
+"""
+Confere e mede input_filter.normalizar_lote contra o laço palavra a palavra
+com formatar_palavra.
+
+1. Resultados: as formas do lote precisam ser iguais às do formatar_palavra
+   e as flags de validade iguais a palavra_existe. Diferença termina com código 1.
+2. Vazão: palavras por segundo do laço (caches LRU zerados a cada repetição,
+   como num passo offline), do lote em um processo e do lote com --processos.
+
+A entrada repete palavras (--repeticao) para simular listas com duplicadas.
+Sem base_palavras/com_acento.txt, usa o dicionário sintético do bench_sufixos.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_lote
+    python -m benchmarks.bench_lote --radicais 5000 --processos 4
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+from benchmarks import bench_sufixos
+from routes import cache_lru
+from routes import input_filter
+
+
+def laco(palavras):
+    cache_lru.limpar_caches()
+    formas = [input_filter.formatar_palavra(p) for p in palavras]
+    validas = [input_filter.palavra_existe(p) != False for p in palavras]
+    return formas, validas
+
+
+def medir(funcao, repeticoes):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return resultado, melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--radicais", type=int, default=2000)
+    parser.add_argument("--repeticao", type=float, default=2.0, help="tamanho da entrada / palavras distintas")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    distintas = sorted(bench_sufixos.entradas_dos_testes() | set(bench_sufixos.gerar_corpus(rng, args.radicais)))
+
+    if len(input_filter.INDICE_PALAVRAS) == 0:
+        tamanho = bench_sufixos.instalar_dicionario_sintetico(rng, distintas)
+        print(f"📚 Dicionário sintético: {tamanho} palavras")
+    else:
+        print(f"📚 Dicionário real: {len(input_filter.INDICE_PALAVRAS)} palavras")
+
+    palavras = distintas + rng.choices(distintas, k=int(len(distintas) * (args.repeticao - 1)))
+    rng.shuffle(palavras)
+    print(f"🔤 {len(palavras)} entradas ({len(distintas)} distintas)\n")
+
+    (formas_ref, validas_ref), tempo_ref = medir(lambda: laco(palavras), args.repeticoes)
+
+    cenarios = [("laço formatar_palavra", None, tempo_ref)]
+    diferencas = 0
+    for processos in sorted({1, args.processos}):
+        (formas, validas), tempo = medir(lambda: input_filter.normalizar_lote(palavras, processos=processos), args.repeticoes)
+        cenarios.append((f"lote ({processos} processo(s))", processos, tempo))
+
+        erradas = [i for i, forma in enumerate(formas) if forma != formas_ref[i] or validas[i] != validas_ref[i]]
+        diferencas += len(erradas)
+        for i in erradas[:5]:
+            print(f"   ⚠️ '{palavras[i]}': laço={formas_ref[i]!r} lote={formas[i]!r}")
+
+    print(f"{'CENÁRIO':<24} | {'TEMPO':>8} | {'VAZÃO':>12} | GANHO")
+    print("-" * 60)
+    for nome, _, tempo in cenarios:
+        print(f"{nome:<24} | {tempo:7.3f}s | {len(palavras) / tempo:10,.0f}/s | {tempo_ref / tempo:4.2f}x")
+
+    if diferencas:
+        print(f"\n❌ {diferencas} resultados diferentes")
+        sys.exit(1)
+    print("\n✅ Resultados idênticos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark da construção do ranking diário.
+
+Compara o laço antigo (most_similar com tuplas + filtro palavra a palavra +
+uma escrita por linha) com o construtor vetorizado de routes/ranking.py e
+confere se a ordem produzida é a mesma.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_ranking               # vocabulário sintético
+    python -m benchmarks.bench_ranking --modelo      # modelo NILC real
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from routes import ranking
+from routes import validade
+
+
+def gerar_dados_sinteticos(tamanho, dimensoes, proporcao_validas, semente=42):
+    """Vocabulário falso + matriz normalizada + conjunto de palavras 'do dicionário'"""
+    rng = np.random.default_rng(semente)
+    vocabulario = [f"palavra{i}" for i in range(tamanho)]
+    vetores = rng.standard_normal((tamanho, dimensoes), dtype=np.float32)
+    vetores /= np.linalg.norm(vetores, axis=1, keepdims=True)
+
+    sorteio = rng.random(tamanho) < proporcao_validas
+    dicionario = {p for p, ok in zip(vocabulario, sorteio) if ok}
+    return vocabulario, vetores, dicionario
+
+
+def most_similar_emulado(vetores, vocabulario, indice_secreto, topn):
+    """Mesmo trabalho do gensim: produto, ordenação e lista de tuplas (palavra, sim)"""
+    similaridades = vetores @ vetores[indice_secreto]
+    ordem = np.argsort(-similaridades, kind="stable")
+    resultado = []
+    for i in ordem.tolist():
+        if i == indice_secreto:
+            continue
+        resultado.append((vocabulario[i], float(similaridades[i])))
+        if len(resultado) >= topn:
+            break
+    return resultado
+
+
+def ranking_antigo(vetores, vocabulario, indice_secreto, validar, caminho, most_similar=None):
+    """Reproduz o laço original de inicializar_jogo"""
+    if most_similar is None:
+        pares = most_similar_emulado(vetores, vocabulario, indice_secreto, 720000)
+    else:
+        pares = most_similar(vocabulario[indice_secreto], topn=720000)
+
+    palavras = []
+    vistas = set()
+    max_sim = None
+    with open(caminho, "w", encoding="utf8") as f:
+        for palavra, similaridade in pares:
+            tentativa = validar(palavra)
+            if tentativa != False and tentativa not in vistas:
+                if max_sim is None:
+                    max_sim = similaridade
+                vistas.add(tentativa)
+                palavras.append(tentativa)
+                f.write(f"{tentativa}, {(similaridade / max_sim) * 100:.2f}\n")
+    return palavras
+
+
+def ranking_novo(vetores, vocabulario, indice_secreto, mascara, chave_para_indice, caminho):
+    """Construtor vetorizado"""
+    _, similaridades, ordem = ranking.construir_ranking(
+        vetores, indice_secreto, mascara, chave_para_indice, topn=720000
+    )
+    max_sim = float(similaridades[ordem[0]])
+    ranking.salvar_ranking(caminho, vocabulario, similaridades, ordem, max_sim)
+    return [vocabulario[i] for i in ordem.tolist()]
+
+
+def cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modelo", action="store_true", help="usa o modelo e os filtros reais do jogo")
+    parser.add_argument("--tamanho", type=int, default=300000, help="tamanho do vocabulário sintético")
+    parser.add_argument("--secretas", type=int, default=3, help="quantidade de palavras secretas testadas")
+    args = parser.parse_args()
+
+    if args.modelo:
+        from routes import jogo, dicionario
+        jogo.inicializar()
+        word2vec = jogo.word2vec
+        vocabulario, vetores = word2vec.index_to_key, word2vec.vectors
+        chave_para_indice = word2vec.key_to_index
+        validar = dicionario.validar_palavra  # dicionários ao vivo, como no laço antigo
+        most_similar = word2vec.most_similar
+        secretas = [chave_para_indice[p.lower()] for p in jogo.filtrar_palavras_no_modelo()
+                    if p.lower() in chave_para_indice][:args.secretas]
+    else:
+        vocabulario, vetores, dicionario = gerar_dados_sinteticos(args.tamanho, 300, 0.6)
+        chave_para_indice = {p: i for i, p in enumerate(vocabulario)}
+        validar = lambda p: p if p in dicionario else False
+        most_similar = None
+        secretas = list(range(args.secretas))
+
+    print(f"📐 Vocabulário: {len(vocabulario)} palavras x {vetores.shape[1]} dimensões")
+
+    (mascara, _), tempo_mascara = cronometrar(validade.calcular_validade, vocabulario, validar)
+    print(f"🧮 Máscara de validade (passo offline, salvo em disco): {tempo_mascara:.2f}s")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "saida.txt")
+        for indice_secreto in secretas:
+            antigo, tempo_antigo = cronometrar(
+                ranking_antigo, vetores, vocabulario, indice_secreto, validar, caminho, most_similar
+            )
+            novo, tempo_novo = cronometrar(
+                ranking_novo, vetores, vocabulario, indice_secreto, mascara, chave_para_indice, caminho
+            )
+
+            mesma_ordem = "✅ mesma ordem" if antigo == novo else "❌ ORDEM DIFERENTE"
+            print(f"{vocabulario[indice_secreto]:<20} | antigo {tempo_antigo:7.2f}s | "
+                  f"novo {tempo_novo:7.3f}s | {tempo_antigo / tempo_novo:6.1f}x | {mesma_ordem}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Confere e mede a resolução de tentativas pelo índice sem acento (routes/sem_acento.py).
+
+    dobrar        mesmo resultado do NFD + filtro de marcas (jogo.normalizar_texto
+                  antigo) em todas as tentativas, e o tempo de cada um
+    resolução     id no vocabulário: duas consultas com NFD (antigo) contra
+                  IndiceSemAcento.id_de. Diferenças esperadas: colisões em que
+                  a forma digitada existe e agora vence a forma sem acento, e
+                  palavras que só existem com outro acento ('memôria' -> 'memória'),
+                  antes não encontradas
+
+Usa um vocabulário sintético de --vocabulario palavras (com e sem acento).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_sem_acento
+    python -m benchmarks.bench_sem_acento --vocabulario 900000 --tentativas 200000
+"""
+import argparse
+import random
+import sys
+import time
+import unicodedata
+
+from routes import sem_acento
+
+LETRAS = "abcdefghijlmnopqrstuvxzáâãéêíóôõúç"
+
+
+def normalizar_nfd(texto):
+    """jogo.normalizar_texto antes do índice"""
+    texto = texto.lower().strip()
+    return "".join(c for c in unicodedata.normalize("NFD", texto) if unicodedata.category(c) != "Mn")
+
+
+def resolver_antigo(chave_para_indice, palavra):
+    """obter_vetor_word2vec antes do índice: forma sem acento, depois a digitada"""
+    for variante in (normalizar_nfd(palavra), palavra.lower().strip()):
+        if variante in chave_para_indice:
+            return chave_para_indice[variante]
+    return -1
+
+
+def palavra_aleatoria(rng, minimo=3, maximo=12):
+    return "".join(rng.choice(LETRAS) for _ in range(rng.randint(minimo, maximo)))
+
+
+def medir(funcao, entradas):
+    inicio = time.perf_counter()
+    resultados = [funcao(p) for p in entradas]
+    return resultados, (time.perf_counter() - inicio) / len(entradas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vocabulario", type=int, default=300000)
+    parser.add_argument("--tentativas", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vocabulario = list(dict.fromkeys(palavra_aleatoria(rng) for _ in range(args.vocabulario)))
+    chave_para_indice = {p: i for i, p in enumerate(vocabulario)}
+
+    inicio = time.perf_counter()
+    indice = sem_acento.construir_indice(vocabulario)
+    indice.chave_para_indice = chave_para_indice
+    print(f"🔡 {len(vocabulario)} palavras -> {len(indice)} formas sem acento "
+          f"({time.perf_counter() - inicio:.1f} s, {indice.indice.memoria_bytes() / 1e6:.1f} MB)")
+
+    # Metade do vocabulário (com maiúsculas/acentos trocados), metade desconhecida
+    tentativas = [rng.choice(vocabulario) for _ in range(args.tentativas // 2)]
+    tentativas = [p.upper() if rng.random() < 0.1 else p for p in tentativas]
+    tentativas += [palavra_aleatoria(rng) for _ in range(args.tentativas - len(tentativas))]
+    rng.shuffle(tentativas)
+
+    antigas, tempo_nfd = medir(normalizar_nfd, tentativas)
+    novas, tempo_dobrar = medir(sem_acento.dobrar, tentativas)
+    divergentes = sum(a != b for a, b in zip(antigas, novas))
+    print(f"✂️  dobrar: {tempo_nfd * 1e6:.2f} µs -> {tempo_dobrar * 1e6:.2f} µs ({tempo_nfd / tempo_dobrar:.1f}x), "
+          f"{divergentes} divergências")
+
+    ids_antigos, tempo_antigo = medir(lambda p: resolver_antigo(chave_para_indice, p), tentativas)
+    ids_novos, tempo_novo = medir(lambda p: indice.id_de(p.lower().strip()), tentativas)
+    diferentes = [(p, a, b) for p, a, b in zip(tentativas, ids_antigos, ids_novos) if a != b]
+    colisoes = sum(b == chave_para_indice.get(p.lower().strip()) for p, a, b in diferentes)
+    outro_acento = sum(a == -1 for p, a, b in diferentes)
+    print(f"🔎 resolução: {tempo_antigo * 1e6:.2f} µs -> {tempo_novo * 1e6:.2f} µs ({tempo_antigo / tempo_novo:.1f}x), "
+          f"{len(diferentes)} ids diferentes ({colisoes} colisões com a forma digitada no vocabulário, "
+          f"{outro_acento} encontradas por outro acento)")
+
+    if divergentes or colisoes + outro_acento != len(diferentes):
+        print("\n❌ Resultados divergentes")
+        sys.exit(1)
+    print("\n✅ Mesmos resultados (fora as diferenças esperadas)")
+
+
+if __name__ == "__main__":
+    main()
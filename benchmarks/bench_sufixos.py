@@ -0,0 +1,153 @@
+"""
+Confere e mede o motor de regras de sufixo (routes/regras_sufixos.py)
+contra os padronizar_* antigos (benchmarks/normalizacao_antiga.py).
+
+1. Resultados: as duas versões precisam devolver exatamente o mesmo para
+   todas as entradas dos testar_* de input_filter e para um corpus gerado
+   (radicais x todos os sufixos das tabelas). Qualquer diferença termina
+   com código 1.
+2. Vazão: palavras por segundo de cada padronizar_* (sem o cache LRU).
+
+Sem base_palavras/com_acento.txt, usa um dicionário sintético: metade
+(aleatória) de tudo o que as funções antigas consultam.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_sufixos
+    python -m benchmarks.bench_sufixos --radicais 5000 --repeticoes 5
+"""
+import argparse
+import ast
+import inspect
+import random
+import sys
+import time
+
+from benchmarks import normalizacao_antiga
+from routes import indice_palavras
+from routes import input_filter
+
+NORMALIZADORES = ["padronizar_plural", "padronizar_genero", "padronizar_grau",
+                  "padronizar_verbo", "padronizar_derivacoes"]
+LETRAS = "abcdefghijlmnoprstuvxzáâãéêíóôõúç"
+
+
+def entradas_dos_testes():
+    """Todas as strings literais dentro dos testar_* de input_filter"""
+    arvore = ast.parse(inspect.getsource(input_filter))
+    entradas = set()
+    for funcao in arvore.body:
+        if isinstance(funcao, ast.FunctionDef) and funcao.name.startswith("testar"):
+            for no in ast.walk(funcao):
+                if isinstance(no, ast.Constant) and isinstance(no.value, str) and no.value.strip():
+                    entradas.add(no.value)
+    return entradas
+
+
+def gerar_corpus(rng, quantidade):
+    """Radicais aleatórios combinados com todos os sufixos das tabelas (e mais alguns com hífen)"""
+    sufixos = {""}
+    for motor in (input_filter.REGRAS_PLURAL, input_filter.REGRAS_GENERO, input_filter.REGRAS_GRAU,
+                  input_filter.REGRAS_VERBO, input_filter.REGRAS_DERIVACOES):
+        for grupo in motor.grupos:
+            sufixos.update(grupo.sufixos)
+
+    radicais = ["".join(rng.choice(LETRAS) for _ in range(rng.randint(1, 7))) for _ in range(quantidade)]
+    corpus = {radical + sufixo for radical in radicais for sufixo in rng.sample(sorted(sufixos), 12)}
+    corpus.update(radical + "á-lo" for radical in radicais[:200])
+    corpus.update(radical + "ar-lhe-ei" for radical in radicais[:200])
+    return sorted(corpus)
+
+
+def instalar_dicionario_sintetico(rng, entradas):
+    """Metade de tudo o que as funções antigas consultam passa a existir"""
+    consultadas = set()
+
+    def registrar(palavra):
+        consultadas.add(palavra)
+        return False
+
+    normalizacao_antiga.palavra_existe = registrar
+    for palavra in entradas:
+        for nome in NORMALIZADORES:
+            getattr(normalizacao_antiga, nome)(palavra)
+
+    existentes = [p for p in sorted(consultadas) if rng.random() < 0.5]
+    input_filter.INDICE_PALAVRAS = indice_palavras.IndicePalavras.a_partir_de_palavras(existentes)
+    input_filter.TABELA_PALAVRAS_TECNOLOGIA = set()
+    return len(existentes)
+
+
+def medir(antiga, nova, entradas, repeticoes):
+    """
+    Vazão (palavras/s) das duas versões. As repetições se alternam entre
+    elas, então uma oscilação da máquina não cai toda em um lado só.
+    """
+    melhores = [float("inf"), float("inf")]
+    for _ in range(repeticoes):
+        for i, funcao in enumerate((antiga, nova)):
+            inicio = time.perf_counter()
+            for palavra in entradas:
+                funcao(palavra)
+            melhores[i] = min(melhores[i], time.perf_counter() - inicio)
+    return len(entradas) / melhores[0], len(entradas) / melhores[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--radicais", type=int, default=2000)
+    parser.add_argument("--repeticoes", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    entradas = sorted(entradas_dos_testes() | set(gerar_corpus(rng, args.radicais)))
+
+    if len(input_filter.INDICE_PALAVRAS) == 0:
+        tamanho = instalar_dicionario_sintetico(rng, entradas)
+        print(f"📚 Dicionário sintético: {tamanho} palavras")
+    else:
+        print(f"📚 Dicionário real: {len(input_filter.INDICE_PALAVRAS)} palavras")
+
+    normalizacao_antiga.palavra_existe = input_filter.palavra_existe
+    print(f"🔤 {len(entradas)} entradas\n")
+
+    print(f"{'NORMALIZADOR':<24} | {'DIFERENÇAS':>10} | {'ANTIGO':>12} | {'TABELA':>12} | GANHO")
+    print("-" * 78)
+
+    diferencas_total = 0
+    for nome in NORMALIZADORES:
+        antiga = getattr(normalizacao_antiga, nome)
+        nova = getattr(input_filter, nome).__wrapped__  # sem o cache LRU
+
+        diferencas = [p for p in entradas if antiga(p) != nova(p)]
+        diferencas_total += len(diferencas)
+        for palavra in diferencas[:5]:
+            print(f"   ⚠️ {nome}('{palavra}'): antigo={antiga(palavra)!r} tabela={nova(palavra)!r}")
+
+        vazao_antiga, vazao_nova = medir(antiga, nova, entradas, args.repeticoes)
+        print(f"{nome:<24} | {len(diferencas):>10} | {vazao_antiga:10,.0f}/s | {vazao_nova:10,.0f}/s | "
+              f"{vazao_nova / vazao_antiga:4.2f}x")
+
+    # Os cinco em sequência, como no formatar_palavra
+    antigas = [getattr(normalizacao_antiga, nome) for nome in NORMALIZADORES]
+    novas = [getattr(input_filter, nome).__wrapped__ for nome in NORMALIZADORES]
+
+    def encadear(funcoes):
+        def pipeline(palavra):
+            for funcao in funcoes:
+                palavra = funcao(palavra)
+            return palavra
+        return pipeline
+
+    vazao_antiga, vazao_nova = medir(encadear(antigas), encadear(novas), entradas, args.repeticoes)
+    print("-" * 78)
+    print(f"{'pipeline (5 etapas)':<24} | {'':>10} | {vazao_antiga:10,.0f}/s | {vazao_nova:10,.0f}/s | "
+          f"{vazao_nova / vazao_antiga:4.2f}x")
+
+    if diferencas_total:
+        print(f"\n❌ {diferencas_total} resultados diferentes")
+        sys.exit(1)
+    print("\n✅ Resultados idênticos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Memória total com N processos workers usando o modelo.
+
+Para cada N, cria N processos filhos por fork e soma o RSS e o PSS de todos
+(PSS divide as páginas compartilhadas entre quem as usa, então a soma é a
+memória real ocupada; a soma de RSS conta as páginas compartilhadas N vezes).
+
+    independente  cada worker carrega o jogo sozinho (gunicorn sem --preload)
+    compartilhado o processo mestre carrega e congela (preparar_processo_mestre)
+                  e os workers herdam tudo pelo fork (gunicorn.conf.py)
+
+Cada worker calcula um ranking (toca a matriz inteira) e faz consultas no
+vocabulário antes da medição.
+
+Uso (a partir da raiz do projeto, Linux):
+    python -m benchmarks.bench_workers
+    python -m benchmarks.bench_workers --workers 1 4 8 --modos compartilhado
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+
+
+def memoria_processo_mb(pid):
+    """(RSS, PSS) em MB lidos de /proc/<pid>/smaps_rollup"""
+    valores = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for linha in f:
+            partes = linha.split()
+            if partes[0] in ("Rss:", "Pss:"):
+                valores[partes[0]] = int(partes[1]) / 1024
+    return valores["Rss:"], valores["Pss:"]
+
+
+def trabalhar(carregar, pronto, liberar):
+    """Corpo do worker: usa o modelo como numa requisição e espera a medição"""
+    from routes import jogo
+    from routes import ranking
+
+    if carregar:
+        jogo.inicializar()
+
+    word2vec = jogo.word2vec
+    ranking.calcular_similaridades(jogo.vetores_jogo, 0)
+
+    amostra = random.Random(os.getpid()).sample(word2vec.index_to_key, min(10000, len(word2vec)))
+    for palavra in amostra:
+        jogo.validar_palavra(palavra)
+        word2vec.key_to_index.get(palavra)
+
+    pronto.release()
+    liberar.wait()
+
+
+def medir(modo, workers):
+    """Executa em um processo novo (mestre limpo) e imprime 'rss pss'"""
+    from routes import jogo
+    from routes.aquecimento import preparar_processo_mestre
+
+    compartilhado = modo == "compartilhado"
+    if compartilhado:
+        preparar_processo_mestre(jogo.inicializar)
+
+    contexto = multiprocessing.get_context("fork")
+    pronto = contexto.Semaphore(0)
+    liberar = contexto.Event()
+
+    processos = [
+        contexto.Process(target=trabalhar, args=(not compartilhado, pronto, liberar))
+        for _ in range(workers)
+    ]
+    for processo in processos:
+        processo.start()
+    for _ in processos:
+        pronto.acquire()
+
+    # O mestre também conta: no modo compartilhado é ele quem segura os dados
+    pids = [os.getpid()] + [processo.pid for processo in processos]
+    medidas = [memoria_processo_mb(pid) for pid in pids]
+
+    liberar.set()
+    for processo in processos:
+        processo.join()
+
+    print(f"{sum(m[0] for m in medidas):.0f} {sum(m[1] for m in medidas):.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4, 8])
+    parser.add_argument("--modos", nargs="+", default=["independente", "compartilhado"])
+    parser.add_argument("--filho", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        medir(args.filho[0], int(args.filho[1]))
+        return
+
+    print(f"{'MODO':<14} | {'WORKERS':>7} | {'SOMA RSS':>10} | {'SOMA PSS':>10}")
+    print("-" * 52)
+
+    for modo in args.modos:
+        for workers in args.workers:
+            saida = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_workers", "--filho", modo, str(workers)],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            rss, pss = saida.split()
+            print(f"{modo:<14} | {workers:>7} | {float(rss):7.0f} MB | {float(pss):7.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Relatório de fidelidade dos vetores comprimidos.
+
+Para uma amostra das palavras secretas (palavras_secretas.txt), monta o ranking
+do dia com os vetores float32 e com cada modo de compressão e compara as
+listas top-N:
+
+    sobreposição   fração das top-N palavras de referência que continuam no top-N
+    desloc. médio  média de |posição comprimida - posição float32| nas top-N
+    top-1          fração das secretas em que a palavra mais próxima não muda
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.fidelidade_compressao
+    python -m benchmarks.fidelidade_compressao --modos float16 int8 pca150 pca64 --top 100 500
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from routes import compressao
+from routes import ranking
+
+
+def comparar(referencia, candidato, n):
+    """Métricas de fidelidade entre duas ordens de ids (referência = float32)"""
+    top_ref = referencia[:n]
+    posicoes = {indice: pos for pos, indice in enumerate(candidato.tolist())}
+
+    sobreposicao = len(set(top_ref.tolist()) & set(candidato[:n].tolist())) / n
+    deslocamentos = [abs(posicoes.get(indice, len(candidato)) - pos) for pos, indice in enumerate(top_ref.tolist())]
+    return sobreposicao, float(np.mean(deslocamentos)), referencia[0] == candidato[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modos", nargs="+", default=["float16", "int8", "pca200", "pca128", "pca64"])
+    parser.add_argument("--top", nargs="+", type=int, default=[100, 1000])
+    parser.add_argument("--amostra", type=int, default=20, help="quantidade de palavras secretas")
+    args = parser.parse_args()
+
+    from routes import jogo
+    jogo.inicializar(dicionarios=False)
+    word2vec = jogo.word2vec
+    vetores = word2vec.vectors
+    mascara = jogo.mapa_validade.mascara
+
+    secretas = sorted({p.lower() for p in jogo.filtrar_palavras_no_modelo() if p.lower() in word2vec.key_to_index})
+    secretas = random.Random(0).sample(secretas, min(args.amostra, len(secretas)))
+    indices = [word2vec.key_to_index[p] for p in secretas]
+
+    referencias = {}
+    for indice in indices:
+        _, _, ordem = ranking.construir_ranking(vetores, indice, mascara, word2vec.key_to_index)
+        referencias[indice] = ordem
+
+    memoria_ref = vetores.shape[0] * vetores.shape[1] * 4
+    print(f"📐 {vetores.shape[0]} palavras | float32: {memoria_ref / 1e6:.0f} MB | {len(indices)} secretas\n")
+
+    cabecalho = f"{'MODO':<9} | {'MEMÓRIA':>9} | {'RANKING':>8} | {'TOP-1':>6}"
+    for n in args.top:
+        cabecalho += f" | {'sobrep@' + str(n):>11} | {'desloc@' + str(n):>11}"
+    print(cabecalho)
+    print("-" * len(cabecalho))
+
+    for texto_modo in args.modos:
+        modo, dimensoes = compressao.interpretar_modo(texto_modo)
+        comprimidos = compressao.comprimir(vetores, modo, dimensoes)
+
+        metricas = {n: [] for n in args.top}
+        acertos_top1 = 0
+        tempo = 0.0
+
+        for indice in indices:
+            inicio = time.perf_counter()
+            _, _, ordem = ranking.construir_ranking(comprimidos, indice, mascara, word2vec.key_to_index)
+            tempo += time.perf_counter() - inicio
+
+            for n in args.top:
+                sobreposicao, deslocamento, mesmo_top1 = comparar(referencias[indice], ordem, n)
+                metricas[n].append((sobreposicao, deslocamento))
+            acertos_top1 += mesmo_top1
+
+        linha = (f"{texto_modo:<9} | {comprimidos.memoria_bytes() / 1e6:6.0f} MB | "
+                 f"{tempo / len(indices):7.3f}s | {acertos_top1 / len(indices):6.0%}")
+        for n in args.top:
+            sobreposicao, deslocamento = np.mean(metricas[n], axis=0)
+            linha += f" | {sobreposicao:11.1%} | {deslocamento:11.1f}"
+        print(linha)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Configuração do gunicorn com vários workers compartilhando o modelo.
+
+    pip install gunicorn
+    gunicorn -c gunicorn.conf.py app:app
+    CONTEXTO_WORKERS=8 gunicorn -c gunicorn.conf.py app:app
+
+O processo mestre carrega modelo, vocabulário e mapa de validade uma vez
+(preload); os workers nascem por fork e herdam tudo sem copiar. Cada worker
+só abre o puzzle do dia (lido do armazém em disco) e inicia o seu agendador.
+As sessões dos jogadores ficam em um arquivo mmap comum a todos os workers
+(routes/sessoes.py), então qualquer worker atende qualquer jogador.
+"""
+import os
+from datetime import datetime
+
+# O aquecimento é controlado pelos hooks abaixo, não pelo create_app
+os.environ.setdefault("CONTEXTO_AQUECIMENTO", "manual")
+
+bind = os.environ.get("CONTEXTO_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("CONTEXTO_WORKERS", 4))
+preload_app = True
+timeout = 120
+
+
+def on_starting(server):
+    """Processo mestre, antes do primeiro fork"""
+    from routes import jogo
+    from routes.aquecimento import preparar_processo_mestre
+
+    def carregar():
+        jogo.inicializar()
+        # Deixa o puzzle de hoje no armazém: os workers só o leem do disco
+        jogo.construir_puzzle(datetime.now().date())
+
+    preparar_processo_mestre(carregar)
+
+
+def post_fork(server, worker):
+    """Em cada worker: puzzle de hoje + thread do agendador"""
+    from routes.routes import aquecimento
+
+    aquecimento.iniciar()
@@ -0,0 +1,144 @@
+import os
+import sys
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+from routes import indice_palavras
+from routes import input_filter
+from routes import dicionario
+
+
+
+# TABELA DE ACEITAÇÃO (wordfreq + pyspellchecker + hunspell pré-computados)
+class TabelaAceitacao:
+    """
+    Resposta de esta_em_dicionario já calculada para um universo de palavras
+    (listas do projeto, vocabulário do modelo e as palavras que wordfreq e
+    pyspellchecker conseguem listar):
+
+    indice   IndicePalavras com o universo (minúsculas, sem espaços nas pontas)
+    aceitas  bool: algum dos três dicionários aceita a palavra
+
+    Abertos via mmap; em tempo de execução nenhum dos três dicionários é carregado.
+    """
+
+    def __init__(self, indice, aceitas, chave=None):
+        self.indice = indice
+        self.aceitas = aceitas
+        self.chave = chave
+
+        self._aceitas = memoryview(aceitas)
+
+    def __len__(self):
+        return len(self.aceitas)
+
+    def consultar(self, palavra):
+        """A palavra (aceita), False (recusada) ou None se ela está fora do universo"""
+        id_palavra = self.indice.id_de(palavra)
+        if id_palavra < 0:
+            return None
+        return palavra if self._aceitas[id_palavra] else False
+
+def listar_universo(vocabulario=(), indice=None, tecnologia=None):
+    """
+    Palavras que a tabela vai responder (passo offline, carrega os dicionários).
+    indice/tecnologia: listas ainda não instaladas (recarga); padrão, as do input_filter.
+    """
+    dicionario.carregar_dicionarios()
+    from wordfreq import iter_wordlist
+
+    fontes = [
+        input_filter.INDICE_PALAVRAS if indice is None else indice,
+        input_filter.TABELA_PALAVRAS_TECNOLOGIA if tecnologia is None else tecnologia,
+        vocabulario,
+        iter_wordlist("pt"),
+        dicionario.spell.word_frequency.keys(),
+    ]
+    universo = {p.lower().strip() for fonte in fontes for p in fonte}
+    universo.discard("")
+    return sorted(universo)
+
+def construir_tabela(universo):
+    """Consulta os três dicionários ao vivo uma vez por palavra do universo"""
+    indice = indice_palavras.IndicePalavras.a_partir_de_palavras(universo)
+    aceitas = np.fromiter(
+        (dicionario.consultar_ao_vivo(p) != False for p in indice),
+        dtype=bool, count=len(indice),
+    )
+    return TabelaAceitacao(indice, aceitas)
+
+
+
+# PERSISTÊNCIA EM DISCO
+def chave_aceitacao(vocabulario):
+    """Hash dos dados dos três dicionários, das listas de palavras e do vocabulário"""
+    return artefatos.calcular_hash(
+        caminhos=[
+            input_filter.CAMINHO_ARQUIVO,
+            input_filter.CAMINHO_TECH,
+            input_filter.CAMINHO_DIC,
+            input_filter.CAMINHO_AFF,
+        ],
+        textos=[
+            "\n".join(vocabulario),
+            artefatos.versao_pacote("wordfreq"),
+            artefatos.versao_pacote("pyspellchecker"),
+            artefatos.versao_pacote("hunspell"),
+        ],
+    )
+
+def salvar(diretorio, tabela):
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    indice_palavras.salvar(os.path.join(temporario, "universo"), tabela.indice)
+    np.save(os.path.join(temporario, "aceitas.npy"), tabela.aceitas)
+
+    os.replace(temporario, diretorio)
+
+def carregar(diretorio, chave=None):
+    indice = indice_palavras.carregar(os.path.join(diretorio, "universo"))
+    aceitas = np.load(os.path.join(diretorio, "aceitas.npy"), mmap_mode="r")
+    return TabelaAceitacao(indice, aceitas, chave)
+
+def obter_tabela_aceitacao(vocabulario=(), indice=None, tecnologia=None):
+    """
+    Carrega a tabela do disco. Se ela não existir (ou se os dicionários, as
+    listas ou o vocabulário mudaram), consulta os três dicionários e salva.
+    """
+    chave = chave_aceitacao(vocabulario)
+    diretorio = artefatos.caminho_artefato("aceitacao", chave)
+
+    if os.path.isdir(diretorio):
+        tabela = carregar(diretorio, chave)
+        print(f"📖 Tabela de aceitação carregada: {int(np.count_nonzero(tabela.aceitas))} de {len(tabela)} palavras aceitas")
+        return tabela
+
+    print("📖 Calculando tabela de aceitação dos dicionários (passo único)...")
+    tabela = construir_tabela(listar_universo(vocabulario, indice, tecnologia))
+    tabela.chave = chave
+    dicionario.zerar_contadores()  # Os contadores medem só as consultas do jogo
+
+    try:
+        salvar(diretorio, tabela)
+        artefatos.remover_versoes_antigas("aceitacao", diretorio)
+        tabela = carregar(diretorio, chave)
+        print(f"💾 Tabela de aceitação salva em {diretorio}: {int(np.count_nonzero(tabela.aceitas))} de {len(tabela)} palavras aceitas")
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar a tabela de aceitação: {e}")
+
+    return tabela
+
+
+
+# PASSO OFFLINE: python -m routes.aceitacao
+if __name__ == "__main__":
+    from routes.model_loader import carregar_modelo
+    word2vec = carregar_modelo()
+
+    if word2vec is None:
+        print("❌ Modelo não carregado; nada a fazer.")
+        sys.exit(1)
+
+    obter_tabela_aceitacao(word2vec.index_to_key)
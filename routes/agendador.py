@@ -0,0 +1,126 @@
+import threading
+from datetime import datetime, timedelta
+
+
+
+# AGENDADOR DO PUZZLE DIÁRIO
+class AgendadorPuzzles:
+    """
+    Mantém o puzzle de hoje e prepara o de amanhã em segundo plano.
+
+    - construir(data) -> PuzzleDoDia é chamado sempre sob uma trava, então
+      duas construções nunca rodam ao mesmo tempo.
+    - 'antecedencia' antes da meia-noite, a thread constrói o puzzle de amanhã.
+    - Na virada do dia ele é publicado trocando uma única referência; quem
+      estava no meio de uma requisição continua com o objeto antigo.
+    """
+
+    def __init__(self, construir, antecedencia=timedelta(hours=1), ao_publicar=None):
+        self.construir = construir
+        self.antecedencia = antecedencia
+        self.ao_publicar = ao_publicar
+
+        self.atual = None
+        self.proximo = None
+
+        self.trava_construcao = threading.Lock()
+        self.trava_publicacao = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = None
+
+    def construir_com_trava(self, data, bloquear=True):
+        """Constrói o puzzle da data. Sem bloquear, desiste se já houver construção em andamento"""
+        if not self.trava_construcao.acquire(blocking=bloquear):
+            return None
+        try:
+            return self.construir(data)
+        finally:
+            self.trava_construcao.release()
+
+    def inicializar(self, hoje):
+        """Primeiro puzzle (síncrono: o processo precisa dele para atender)"""
+        self._publicar(self.construir_com_trava(hoje))
+
+    def obter_atual(self, hoje):
+        """
+        Puzzle a ser usado pela requisição. Se o dia virou e o próximo já está
+        pronto, publica-o; senão dispara a construção em segundo plano e segue
+        com o puzzle atual até ela terminar (a requisição nunca espera).
+        """
+        atual = self.atual
+        if atual is not None and atual.data == hoje:
+            return atual
+
+        proximo = self.proximo
+        if proximo is not None and proximo.data == hoje:
+            self._publicar(proximo)
+            return proximo
+
+        self._construir_em_segundo_plano(hoje)
+        return atual
+
+    def _publicar(self, puzzle):
+        if puzzle is None:
+            return
+
+        with self.trava_publicacao:
+            if self.proximo is puzzle:
+                self.proximo = None
+            if self.atual is not None and self.atual.data >= puzzle.data:
+                return
+            self.atual = puzzle
+
+        print(f"🔄 Puzzle publicado: {puzzle.palavra_secreta} (Data: {puzzle.data})")
+        if self.ao_publicar is not None:
+            threading.Thread(target=self.ao_publicar, args=(puzzle,), daemon=True).start()
+
+    def _construir_em_segundo_plano(self, data):
+        if self.trava_construcao.locked():
+            return
+
+        def tarefa():
+            puzzle = self.construir_com_trava(data, bloquear=False)
+            if puzzle is not None and datetime.now().date() == puzzle.data:
+                self._publicar(puzzle)
+
+        threading.Thread(target=tarefa, daemon=True).start()
+
+    def iniciar(self):
+        """Inicia a thread que prepara e publica os próximos puzzles"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._laco, name="agendador-puzzles", daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+
+    def _laco(self):
+        while not self._parar.is_set():
+            agora = datetime.now()
+            hoje = agora.date()
+            amanha = hoje + timedelta(days=1)
+            meia_noite = datetime.combine(amanha, datetime.min.time())
+
+            proximo = self.proximo
+            if proximo is not None and proximo.data <= hoje:
+                # Virou o dia: publica o puzzle preparado
+                self._publicar(proximo)
+                continue
+
+            if proximo is None:
+                # Ainda não preparou o de amanhã: espera até 'antecedencia' antes da meia-noite
+                espera = (meia_noite - self.antecedencia - agora).total_seconds()
+                if espera <= 0:
+                    try:
+                        self.proximo = self.construir_com_trava(amanha)
+                        print(f"🌙 Puzzle de {amanha} pronto: aguardando a meia-noite")
+                    except Exception as e:
+                        print(f"❌ Erro ao preparar o puzzle de {amanha}: {e}")
+                        self._parar.wait(60)
+                    continue
+            else:
+                # Já preparado: acorda na meia-noite para publicar
+                espera = (meia_noite - agora).total_seconds()
+
+            # Acorda periodicamente para tolerar ajustes no relógio
+            self._parar.wait(min(max(espera, 0.5), 300))
@@ -0,0 +1,88 @@
+import gc
+import threading
+import time
+
+
+
+# AQUECIMENTO (carregamento pesado fora do import)
+class Aquecimento:
+    """
+    Executa a tarefa de aquecimento (modelo, dicionários, puzzle de hoje)
+    uma única vez, em segundo plano ou de forma síncrona.
+
+    estado: 'pendente' -> 'aquecendo' -> 'pronto' ou 'erro'
+    """
+
+    def __init__(self, tarefa):
+        self.tarefa = tarefa
+        self.estado = "pendente"
+        self.erro = None
+        self.inicio = None
+        self.duracao = None
+
+        self.trava = threading.Lock()
+        self._concluido = threading.Event()
+
+    @property
+    def pronto(self):
+        return self.estado == "pronto"
+
+    def iniciar(self, em_segundo_plano=True):
+        """Dispara o aquecimento. Chamadas repetidas não fazem nada"""
+        with self.trava:
+            if self.estado != "pendente":
+                return
+            self.estado = "aquecendo"
+            self.inicio = time.monotonic()
+
+        if em_segundo_plano:
+            threading.Thread(target=self._executar, name="aquecimento", daemon=True).start()
+        else:
+            self._executar()
+
+    def aguardar(self, timeout=None):
+        """Bloqueia até o aquecimento terminar. Retorna True se ficou pronto"""
+        self._concluido.wait(timeout)
+        return self.pronto
+
+    def _executar(self):
+        print("🔥 Aquecimento iniciado...")
+        try:
+            self.tarefa()
+            self.estado = "pronto"
+            print(f"✅ Aquecimento concluído em {time.monotonic() - self.inicio:.1f}s")
+        except Exception as e:
+            self.erro = str(e)
+            self.estado = "erro"
+            print(f"❌ Erro no aquecimento: {e}")
+        finally:
+            self.duracao = time.monotonic() - self.inicio
+            self._concluido.set()
+
+    def resumo(self):
+        decorrido = self.duracao
+        if decorrido is None and self.inicio is not None:
+            decorrido = time.monotonic() - self.inicio
+
+        return {
+            "estado": self.estado,
+            "erro": self.erro,
+            "segundos": round(decorrido, 2) if decorrido is not None else None,
+        }
+
+
+
+# PROCESSO MESTRE DE UM SERVIDOR COM PRÉ-FORK (gunicorn --preload)
+def preparar_processo_mestre(carregar):
+    """
+    Carrega os dados no processo mestre, antes do fork dos workers.
+
+    As matrizes já são mmap de arquivos (page cache compartilhado); o que
+    sobra são objetos Python (vocabulário, índices). gc.freeze() os tira do
+    coletor de lixo para que os workers não sujem as páginas herdadas e
+    elas continuem compartilhadas (copy-on-write).
+    Nenhuma thread é iniciada aqui: threads não sobrevivem ao fork.
+    """
+    carregar()
+    gc.collect()
+    gc.freeze()
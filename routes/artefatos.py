@@ -0,0 +1,90 @@
+import hashlib
+import os
+import shutil
+from contextlib import contextmanager
+
+try:
+    import fcntl  # Trava entre processos (gunicorn); no Windows só há um processo
+except ImportError:
+    fcntl = None
+
+
+
+# DEFININDO O DIRETÓRIO DOS ARTEFATOS PRÉ-COMPUTADOS
+# (pode ser trocado pela variável de ambiente CONTEXTO_ARTEFATOS)
+DIRETORIO_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+DIRETORIO_ARTEFATOS = os.environ.get(
+    "CONTEXTO_ARTEFATOS",
+    os.path.normpath(os.path.join(DIRETORIO_SCRIPT, "..", "artefatos"))
+)
+
+def calcular_hash(caminhos=(), textos=()):
+    """
+    Gera uma chave curta a partir do conteúdo dos arquivos e de textos extras
+    (versões de bibliotecas, vocabulário...). Se qualquer entrada mudar, a chave muda.
+    """
+    sha = hashlib.sha256()
+
+    for caminho in caminhos:
+        sha.update(os.path.basename(caminho).encode())
+        try:
+            with open(caminho, "rb") as f:
+                for bloco in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(bloco)
+        except FileNotFoundError:
+            sha.update(b"<ausente>")
+
+    for texto in textos:
+        sha.update(str(texto).encode())
+        sha.update(b"\0")
+
+    return sha.hexdigest()[:16]
+
+def caminho_artefato(prefixo, chave, extensao=None):
+    """
+    Caminho do artefato '<prefixo>_<chave>.<extensao>' (cria o diretório se preciso).
+    Sem extensão, o caminho é usado como diretório.
+    """
+    os.makedirs(DIRETORIO_ARTEFATOS, exist_ok=True)
+    nome = f"{prefixo}_{chave}" + (f".{extensao}" if extensao else "")
+    return os.path.join(DIRETORIO_ARTEFATOS, nome)
+
+def remover_versoes_antigas(prefixo, manter):
+    """Apaga artefatos com o mesmo prefixo que não sejam o caminho atual"""
+    if not os.path.isdir(DIRETORIO_ARTEFATOS):
+        return
+
+    for nome in os.listdir(DIRETORIO_ARTEFATOS):
+        caminho = os.path.join(DIRETORIO_ARTEFATOS, nome)
+        if nome.startswith(prefixo + "_") and caminho != manter:
+            try:
+                if os.path.isdir(caminho):
+                    shutil.rmtree(caminho)
+                else:
+                    os.remove(caminho)
+            except OSError:
+                pass
+
+@contextmanager
+def travar(nome):
+    """
+    Um processo por vez (flock em '<nome>.lock'): quando vários workers
+    precisam do mesmo artefato, o primeiro calcula e salva e os outros,
+    ao entrar, já o encontram no disco.
+    """
+    os.makedirs(DIRETORIO_ARTEFATOS, exist_ok=True)
+    arquivo = os.open(os.path.join(DIRETORIO_ARTEFATOS, f"{nome}.lock"), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(arquivo, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(arquivo)  # Fechar solta o flock
+
+def versao_pacote(nome):
+    """Versão instalada de um pacote (entra na chave dos artefatos)"""
+    try:
+        from importlib.metadata import version
+        return f"{nome}=={version(nome)}"
+    except Exception:
+        return f"{nome}==?"
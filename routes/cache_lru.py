@@ -0,0 +1,107 @@
+import functools
+import os
+import threading
+from collections import OrderedDict
+
+
+
+# CONFIGURAÇÃO (pode ser trocada por variável de ambiente)
+MAX_ITENS = int(os.environ.get("CONTEXTO_CACHE_NORMALIZACAO", 20000))
+
+_SEM_VALOR = object()
+
+
+
+# CACHE LRU COM CONTADORES
+class CacheLRU:
+    """
+    Cache limitado a 'maximo' itens em um OrderedDict usado como LRU:
+    o item consultado vai para o fim; quando enche, sai o do começo.
+    Conta acertos, faltas e remoções para acompanhar em produção.
+    """
+
+    def __init__(self, nome, maximo=MAX_ITENS):
+        self.nome = nome
+        self.maximo = maximo
+        self.itens = OrderedDict()
+        self.trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+        self.removidos = 0
+
+    def __len__(self):
+        return len(self.itens)
+
+    def obter(self, chave, padrao=_SEM_VALOR):
+        """Valor guardado ou 'padrao' (_SEM_VALOR se não informado)"""
+        with self.trava:
+            valor = self.itens.get(chave, _SEM_VALOR)
+            if valor is _SEM_VALOR:
+                self.faltas += 1
+                return padrao
+            else:
+                self.acertos += 1
+                self.itens.move_to_end(chave)
+            return valor
+
+    def guardar(self, chave, valor):
+        with self.trava:
+            self.itens[chave] = valor
+            self.itens.move_to_end(chave)
+            while len(self.itens) > self.maximo:
+                self.itens.popitem(last=False)
+                self.removidos += 1
+
+    def limpar(self):
+        with self.trava:
+            self.itens.clear()
+
+    def estatisticas(self):
+        with self.trava:
+            consultas = self.acertos + self.faltas
+            return {
+                "itens": len(self.itens),
+                "maximo": self.maximo,
+                "acertos": self.acertos,
+                "faltas": self.faltas,
+                "removidos": self.removidos,
+                "taxa_acerto": round(self.acertos / consultas, 4) if consultas else None,
+            }
+
+# Todos os caches criados por memorizar(), para estatísticas e invalidação
+CACHES = {}
+
+def novo_cache(nome, maximo=MAX_ITENS):
+    """CacheLRU registrado em CACHES (aparece nas estatísticas e é limpo com os demais)"""
+    cache = CacheLRU(nome, maximo)
+    CACHES[nome] = cache
+    return cache
+
+def memorizar(nome, maximo=MAX_ITENS):
+    """
+    Decorador: guarda o resultado da função por argumentos (que precisam
+    ser hasheáveis). O cache fica em funcao.cache e em CACHES[nome].
+    """
+    def decorador(funcao):
+        cache = novo_cache(nome, maximo)
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            chave = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            valor = cache.obter(chave)
+            if valor is _SEM_VALOR:
+                valor = funcao(*args, **kwargs)
+                cache.guardar(chave, valor)
+            return valor
+
+        envoltorio.cache = cache
+        return envoltorio
+    return decorador
+
+def limpar_caches():
+    """Invalida todos os caches (ex.: as listas de palavras foram recarregadas)"""
+    for cache in CACHES.values():
+        cache.limpar()
+
+def estatisticas_caches():
+    return {nome: cache.estatisticas() for nome, cache in CACHES.items()}
@@ -0,0 +1,197 @@
+import os
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+
+
+
+TAMANHO_BLOCO = 16384   # Linhas convertidas para float32 por vez no produto
+AMOSTRA_PCA = 100000    # Linhas usadas para estimar a projeção PCA
+
+MODOS = ("float16", "int8", "pca")
+
+def interpretar_modo(texto):
+    """
+    Converte o texto da configuração em (modo, dimensões).
+    Ex: 'float16' -> ('float16', None), 'pca128' -> ('pca', 128), '' -> (None, None)
+    """
+    texto = (texto or "").lower().strip()
+    if not texto:
+        return None, None
+
+    if texto.startswith("pca"):
+        dimensoes = int(texto[3:] or 100)
+        return "pca", dimensoes
+
+    if texto not in MODOS:
+        raise ValueError(f"Modo de compressão desconhecido: '{texto}' (use float16, int8 ou pcaN)")
+    return texto, None
+
+
+
+# REPRESENTAÇÃO COMPRIMIDA DOS VETORES
+class VetoresComprimidos:
+    """
+    Matriz de vetores (norma 1) guardada em formato compacto:
+
+    float16  metade da memória, erro desprezível
+    int8     um quarto da memória + uma escala float32 por linha
+    pca      projeção para menos dimensões (float32), memória proporcional a k;
+             cada linha projetada volta a ter norma 1 (produto = cosseno)
+
+    O produto com um vetor de consulta é feito em blocos de TAMANHO_BLOCO
+    linhas, convertidos para float32 (BLAS), sem descomprimir a matriz toda.
+    """
+
+    def __init__(self, modo, dados, escalas=None, projecao=None):
+        self.modo = modo
+        self.dados = dados
+        self.escalas = escalas
+        self.projecao = projecao
+
+    def __len__(self):
+        return len(self.dados)
+
+    @property
+    def shape(self):
+        return self.dados.shape
+
+    def memoria_bytes(self):
+        total = self.dados.nbytes
+        if self.escalas is not None:
+            total += self.escalas.nbytes
+        if self.projecao is not None:
+            total += self.projecao.nbytes
+        return total
+
+    def preparar_consulta(self, vetor):
+        """Leva um vetor do espaço original (300d) para o espaço da matriz comprimida"""
+        vetor = np.asarray(vetor, dtype=np.float32)
+        if self.modo == "pca":
+            return vetor @ self.projecao
+        return vetor
+
+    def linha(self, indice):
+        """Vetor da linha já no espaço de consulta (float32)"""
+        vetor = self.dados[indice].astype(np.float32)
+        if self.modo == "int8":
+            vetor *= self.escalas[indice]
+        return vetor
+
+    def produto(self, consulta):
+        """Produto de todas as linhas com a consulta (já preparada), em blocos"""
+        consulta = np.asarray(consulta, dtype=np.float32)
+        resultado = np.empty(len(self.dados), dtype=np.float32)
+
+        for inicio in range(0, len(self.dados), TAMANHO_BLOCO):
+            fim = min(inicio + TAMANHO_BLOCO, len(self.dados))
+            bloco = self.dados[inicio:fim].astype(np.float32)
+            np.dot(bloco, consulta, out=resultado[inicio:fim])
+
+        if self.modo == "int8":
+            resultado *= self.escalas
+
+        return resultado
+
+    def similaridades_com(self, indice):
+        """Similaridade de todas as palavras com a palavra de id 'indice'"""
+        return self.produto(self.linha(indice))
+
+    def similaridade(self, vetor1, vetor2):
+        """Cosseno entre dois vetores do espaço original, medido no espaço da matriz (projetado no PCA)"""
+        a = self.preparar_consulta(vetor1)
+        b = self.preparar_consulta(vetor2)
+        normas = np.linalg.norm(a) * np.linalg.norm(b)
+        return float(np.dot(a, b) / normas) if normas else 0.0
+
+def comprimir(vetores, modo, dimensoes=None):
+    """Cria a representação comprimida a partir da matriz float32 normalizada"""
+    if modo == "float16":
+        return VetoresComprimidos(modo, _converter_em_blocos(vetores, lambda b: b.astype(np.float16)))
+
+    if modo == "int8":
+        escalas = np.empty(len(vetores), dtype=np.float32)
+        dados = np.empty(vetores.shape, dtype=np.int8)
+        for inicio in range(0, len(vetores), TAMANHO_BLOCO):
+            fim = min(inicio + TAMANHO_BLOCO, len(vetores))
+            bloco = np.asarray(vetores[inicio:fim], dtype=np.float32)
+            maximo = np.abs(bloco).max(axis=1)
+            maximo[maximo == 0] = 1
+            escalas[inicio:fim] = maximo / 127
+            dados[inicio:fim] = np.rint(bloco / escalas[inicio:fim, None]).astype(np.int8)
+        return VetoresComprimidos(modo, dados, escalas=escalas)
+
+    if modo == "pca":
+        # Direções principais (sem centralizar: preserva o produto escalar)
+        rng = np.random.default_rng(0)
+        tamanho = min(AMOSTRA_PCA, len(vetores))
+        amostra = np.asarray(vetores[np.sort(rng.choice(len(vetores), tamanho, replace=False))], dtype=np.float32)
+        _, _, vt = np.linalg.svd(amostra, full_matrices=False)
+        projecao = np.ascontiguousarray(vt[:dimensoes].T, dtype=np.float32)
+
+        dados = _converter_em_blocos(vetores, lambda b: _normalizar_linhas(np.asarray(b, dtype=np.float32) @ projecao))
+        return VetoresComprimidos(modo, dados, projecao=projecao)
+
+    raise ValueError(f"Modo de compressão desconhecido: {modo}")
+
+def _normalizar_linhas(bloco):
+    """A projeção encurta as linhas (norma < 1): sem renormalizar, o produto não seria um cosseno"""
+    normas = np.linalg.norm(bloco, axis=1, keepdims=True)
+    normas[normas == 0] = 1
+    return bloco / normas
+
+def _converter_em_blocos(vetores, converter):
+    """Aplica a conversão bloco a bloco (a matriz original pode ser um mmap)"""
+    partes = [converter(vetores[i:i + TAMANHO_BLOCO]) for i in range(0, len(vetores), TAMANHO_BLOCO)]
+    return np.ascontiguousarray(np.concatenate(partes))
+
+
+
+# PERSISTÊNCIA EM DISCO (aberta via mmap nas próximas inicializações)
+def salvar(diretorio, comprimidos):
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    np.save(os.path.join(temporario, "dados.npy"), comprimidos.dados)
+    if comprimidos.escalas is not None:
+        np.save(os.path.join(temporario, "escalas.npy"), comprimidos.escalas)
+    if comprimidos.projecao is not None:
+        np.save(os.path.join(temporario, "projecao.npy"), comprimidos.projecao)
+
+    os.replace(temporario, diretorio)
+
+def carregar(diretorio, modo):
+    def abrir(nome):
+        caminho = os.path.join(diretorio, nome)
+        return np.load(caminho, mmap_mode="r") if os.path.exists(caminho) else None
+
+    return VetoresComprimidos(modo, abrir("dados.npy"), abrir("escalas.npy"), abrir("projecao.npy"))
+
+def obter_vetores_comprimidos(vetores, texto_modo, chave_modelo):
+    """
+    Devolve a matriz comprimida conforme a configuração (ou None se desligada).
+    O resultado fica salvo em artefatos/ junto da chave do modelo compilado.
+    """
+    modo, dimensoes = interpretar_modo(texto_modo)
+    if modo is None:
+        return None
+
+    nome = modo + (str(dimensoes) if dimensoes else "")
+    chave = artefatos.calcular_hash(caminhos=[__file__], textos=[chave_modelo])  # Muda se o formato mudar
+    diretorio = artefatos.caminho_artefato(f"compressao_{nome}", chave)
+
+    if os.path.isdir(diretorio):
+        comprimidos = carregar(diretorio, modo)
+    else:
+        print(f"🗜️ Comprimindo vetores ({nome})...")
+        comprimidos = comprimir(vetores, modo, dimensoes)
+        try:
+            salvar(diretorio, comprimidos)
+            artefatos.remover_versoes_antigas(f"compressao_{nome}", diretorio)
+            comprimidos = carregar(diretorio, modo)
+        except OSError as e:
+            print(f"⚠️ Não foi possível salvar os vetores comprimidos: {e}")
+
+    print(f"🗜️ Vetores comprimidos ({nome}): {comprimidos.memoria_bytes() / 1e6:.0f} MB")
+    return comprimidos
@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+
+# Arquivos auxiliares
+from routes import input_filter
+
+
+
+# CARREGANDO OS DICIONÁRIOS (no aquecimento ou na primeira consulta)
+zipf_frequency = None
+spell = None
+h = None
+trava_dicionarios = threading.Lock()
+
+def carregar_dicionarios():
+    """Importa e constrói os dicionários (só quando uma palavra precisa deles)"""
+    global spell, h, zipf_frequency
+
+    from wordfreq import zipf_frequency
+    from spellchecker import SpellChecker
+    import hunspell
+
+    with trava_dicionarios:
+        if spell is None:
+            spell = SpellChecker(language="pt")
+        if h is None:
+            h = hunspell.HunSpell(input_filter.CAMINHO_DIC, input_filter.CAMINHO_AFF)
+
+# TABELA PRÉ-COMPUTADA (ver aceitacao.py) + DICIONÁRIOS AO VIVO COMO RESERVA
+# CONTEXTO_DICIONARIOS_AO_VIVO=0: palavras fora da tabela são recusadas sem
+# carregar wordfreq, pyspellchecker e hunspell
+AO_VIVO = os.environ.get("CONTEXTO_DICIONARIOS_AO_VIVO", "1") != "0"
+TABELA_ACEITACAO = None
+
+BACKENDS = ("tabela", "wordfreq", "pyspellchecker", "hunspell")
+contadores = {nome: {"consultas": 0, "aceitas": 0, "segundos": 0.0} for nome in BACKENDS}
+trava_contadores = threading.Lock()
+
+def instalar_tabela_aceitacao(tabela):
+    global TABELA_ACEITACAO
+    TABELA_ACEITACAO = tabela
+
+def _contar(nome, inicio, aceita):
+    decorrido = time.perf_counter() - inicio
+    with trava_contadores:
+        contador = contadores[nome]
+        contador["consultas"] += 1
+        contador["aceitas"] += bool(aceita)
+        contador["segundos"] += decorrido
+
+def zerar_contadores():
+    with trava_contadores:
+        for contador in contadores.values():
+            contador.update(consultas=0, aceitas=0, segundos=0.0)
+
+def estatisticas_dicionarios():
+    """Consultas, aceitas e tempo (total e médio) de cada backend"""
+    with trava_contadores:
+        backends = {
+            nome: {
+                **contador,
+                "segundos": round(contador["segundos"], 6),
+                "media_us": round(contador["segundos"] / contador["consultas"] * 1e6, 2) if contador["consultas"] else None,
+            }
+            for nome, contador in contadores.items()
+        }
+    return {
+        "tabela_carregada": TABELA_ACEITACAO is not None,
+        "tabela_palavras": len(TABELA_ACEITACAO) if TABELA_ACEITACAO is not None else 0,
+        "ao_vivo": AO_VIVO,
+        "backends": backends,
+    }
+
+def esta_em_dicionario(palavra, tabela=None):
+    """tabela: TabelaAceitacao a consultar no lugar da instalada (recarga das listas)"""
+    p = palavra.lower().strip()
+
+    if tabela is None:
+        tabela = TABELA_ACEITACAO
+    if tabela is not None:
+        inicio = time.perf_counter()
+        resultado = tabela.consultar(p)
+        _contar("tabela", inicio, resultado)
+        if resultado is not None:
+            return resultado
+        if not AO_VIVO:
+            return False
+
+    return consultar_ao_vivo(p)
+
+def consultar_ao_vivo(p):
+    """Os três dicionários em sequência, com o tempo de cada um nos contadores"""
+    if h is None:
+        carregar_dicionarios()
+
+    # 1. wordfreq: aparece em corpora?
+    inicio = time.perf_counter()
+    aceita = zipf_frequency(p, "pt") > 0
+    _contar("wordfreq", inicio, aceita)
+    if aceita:
+        return p
+
+    # 2. pyspellchecker: está no dicionário interno?
+    inicio = time.perf_counter()
+    aceita = p in spell.word_frequency
+    _contar("pyspellchecker", inicio, aceita)
+    if aceita:
+        return p
+
+    # 3. hunspell: verificação ortográfica completa
+    inicio = time.perf_counter()
+    aceita = h.spell(p)
+    _contar("hunspell", inicio, aceita)
+    if aceita:
+        return p
+
+    return False
+
+def validar_palavra(palavra):
+    """Aplica o filtro de entrada e os dicionários. Retorna a forma aceita ou False"""
+    tentativa = input_filter.palavra_existe(palavra)
+    if tentativa != False:
+        tentativa = esta_em_dicionario(tentativa)
+    return tentativa
+
+def validar_lote(palavras, existe=None, tabela=None):
+    """
+    validar_palavra para uma lista de palavras: o filtro de entrada roda em
+    lote (input_filter.consultar_lote) e cada forma distinta que passou
+    consulta os dicionários uma vez só. Retorna as formas aceitas ou False.
+    existe e tabela trocam as tabelas instaladas pelas de uma recarga.
+    """
+    tentativas = input_filter.consultar_lote(palavras, existe)
+
+    aceitas = {}
+    for tentativa in tentativas:
+        if tentativa != False and tentativa not in aceitas:
+            aceitas[tentativa] = esta_em_dicionario(tentativa, tabela)
+
+    return [aceitas[t] if t != False else False for t in tentativas]
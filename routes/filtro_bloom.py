@@ -0,0 +1,110 @@
+import math
+import os
+import zlib
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+
+
+
+# CONFIGURAÇÃO (pode ser trocada por variável de ambiente)
+# Memória = palavras x BITS_POR_PALAVRA / 8 bytes; 10 bits -> ~1% de falsos positivos
+BITS_POR_PALAVRA = float(os.environ.get("CONTEXTO_BLOOM_BITS_POR_PALAVRA", 10))
+
+SEMENTE_2 = 0x9E3779B9  # Valor inicial do segundo crc32 (outro hash da mesma palavra)
+
+
+
+# FILTRO DE BLOOM (só bits, sem as palavras)
+class FiltroBloom:
+    """
+    'palavra in filtro' é False só se a palavra com certeza não foi
+    adicionada; True pode ser falso positivo (taxa em estatisticas()).
+
+    bits  uint8 com m bits; cada palavra liga k bits nas posições
+          (h1 + i * h2) mod m, com h1 e h2 dois crc32 da palavra
+    """
+
+    def __init__(self, bits, m, k, quantidade=0):
+        self.bits = bits
+        self.m = m
+        self.k = k
+        self.quantidade = quantidade
+        self._bits = memoryview(bits)
+
+    @staticmethod
+    def _hashes(chave):
+        return zlib.crc32(chave), zlib.crc32(chave, SEMENTE_2) | 1
+
+    def __contains__(self, palavra):
+        h1, h2 = self._hashes(palavra.encode("utf-8"))
+        bits, m = self._bits, self.m
+        for i in range(self.k):
+            posicao = (h1 + i * h2) % m
+            if not bits[posicao >> 3] & (1 << (posicao & 7)):
+                return False
+        return True
+
+    def memoria_bytes(self):
+        return self.bits.nbytes
+
+    def estatisticas(self):
+        taxa = (1 - math.exp(-self.k * self.quantidade / self.m)) ** self.k if self.quantidade else 0.0
+        return {
+            "palavras": self.quantidade,
+            "bytes": self.memoria_bytes(),
+            "hashes": self.k,
+            "taxa_falsos_positivos": round(taxa, 6),
+        }
+
+    @classmethod
+    def a_partir_de_palavras(cls, palavras, bits_por_palavra=BITS_POR_PALAVRA):
+        """k ótimo para a memória pedida: k = bits_por_palavra * ln 2"""
+        hashes = np.array([cls._hashes(p.encode("utf-8")) for p in set(palavras)], dtype=np.int64).reshape(-1, 2)
+        quantidade = len(hashes)
+
+        m = max(64, int(quantidade * bits_por_palavra))
+        k = max(1, round(bits_por_palavra * math.log(2)))
+
+        posicoes = (hashes[:, :1] + np.arange(k) * hashes[:, 1:]) % m
+        ligados = np.zeros(m, dtype=bool)
+        ligados[posicoes.ravel()] = True
+
+        return cls(np.packbits(ligados, bitorder="little"), m, k, quantidade)
+
+
+
+# PERSISTÊNCIA EM DISCO
+def salvar(diretorio, filtro):
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    np.save(os.path.join(temporario, "bits.npy"), filtro.bits)
+    np.save(os.path.join(temporario, "parametros.npy"), np.array([filtro.m, filtro.k, filtro.quantidade], dtype=np.int64))
+
+    os.replace(temporario, diretorio)
+
+def carregar(diretorio):
+    m, k, quantidade = np.load(os.path.join(diretorio, "parametros.npy")).tolist()
+    return FiltroBloom(np.load(os.path.join(diretorio, "bits.npy"), mmap_mode="r"), m, k, quantidade)
+
+def obter_filtro(prefixo, caminhos, palavras, bits_por_palavra=BITS_POR_PALAVRA):
+    """
+    Filtro das palavras geradas por palavras() (chamada só se precisar
+    construir). Fica em artefatos/, com chave nos arquivos de origem e na
+    memória pedida.
+    """
+    diretorio = artefatos.caminho_artefato(prefixo, artefatos.calcular_hash(caminhos=caminhos, textos=[bits_por_palavra]))
+    if os.path.isdir(diretorio):
+        return carregar(diretorio)
+
+    filtro = FiltroBloom.a_partir_de_palavras(palavras(), bits_por_palavra)
+    try:
+        salvar(diretorio, filtro)
+        artefatos.remover_versoes_antigas(prefixo, diretorio)
+        filtro = carregar(diretorio)
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar o filtro de Bloom: {e}")
+
+    return filtro
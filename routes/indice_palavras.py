@@ -0,0 +1,143 @@
+import mmap
+import os
+import zlib
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+
+
+
+# ÍNDICE COMPACTO DE PALAVRAS (blob de bytes + offsets + tabela hash, via mmap)
+CARGA_MAXIMA = 0.7  # Ocupação máxima da tabela hash
+
+class IndicePalavras:
+    """
+    Conjunto imutável de palavras, sem um objeto str por palavra:
+
+    blob     todas as palavras em UTF-8, concatenadas em ordem (bytes)
+    offsets  uint32 com o início de cada palavra no blob (+ o fim da última)
+    tabela   hash aberto (sondagem linear): crc32 da palavra -> id + 1 (0 = vazio)
+
+    O crc32 não depende do processo (ao contrário do hash() do Python), então
+    a tabela pode ser gravada em disco. Os três arquivos são abertos via mmap
+    e ficam compartilhados entre processos.
+    """
+
+    def __init__(self, blob, offsets, tabela):
+        self.blob = blob
+        self.offsets = offsets
+        self.tabela = tabela
+        self.mascara = len(tabela) - 1
+
+        # memoryview: indexação devolve int do Python (sem escalar numpy)
+        self._inicios = memoryview(offsets)
+        self._tabela = memoryview(tabela)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __contains__(self, palavra):
+        chave = palavra.encode("utf-8")
+        blob, inicios, tabela, mascara = self.blob, self._inicios, self._tabela, self.mascara
+
+        posicao = zlib.crc32(chave) & mascara
+        while True:
+            id_mais_um = tabela[posicao]
+            if not id_mais_um:
+                return False
+            if blob[inicios[id_mais_um - 1]:inicios[id_mais_um]] == chave:
+                return True
+            posicao = (posicao + 1) & mascara
+
+    def id_de(self, palavra):
+        """Posição da palavra na ordem do índice, ou -1 se ela não existir"""
+        chave = palavra.encode("utf-8")
+        blob, inicios, tabela, mascara = self.blob, self._inicios, self._tabela, self.mascara
+
+        posicao = zlib.crc32(chave) & mascara
+        while True:
+            id_mais_um = tabela[posicao]
+            if not id_mais_um:
+                return -1
+            if blob[inicios[id_mais_um - 1]:inicios[id_mais_um]] == chave:
+                return id_mais_um - 1
+            posicao = (posicao + 1) & mascara
+
+    def palavra(self, id_palavra):
+        return self.blob[self._inicios[id_palavra]:self._inicios[id_palavra + 1]].decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.palavra(i)
+
+    def memoria_bytes(self):
+        return len(self.blob) + self.offsets.nbytes + self.tabela.nbytes
+
+    @classmethod
+    def a_partir_de_palavras(cls, palavras):
+        """Monta o índice em memória (ordena e remove duplicadas)"""
+        codificadas = sorted({p.encode("utf-8") for p in palavras if p})
+
+        offsets = np.zeros(len(codificadas) + 1, dtype=np.uint32)
+        np.cumsum([len(p) for p in codificadas], out=offsets[1:])
+
+        capacidade = 1 << max(3, int(len(codificadas) / CARGA_MAXIMA).bit_length())
+        mascara = capacidade - 1
+        tabela = [0] * capacidade
+        for i, chave in enumerate(codificadas):
+            posicao = zlib.crc32(chave) & mascara
+            while tabela[posicao]:
+                posicao = (posicao + 1) & mascara
+            tabela[posicao] = i + 1
+
+        return cls(b"".join(codificadas), offsets, np.array(tabela, dtype=np.uint32))
+
+
+
+# PERSISTÊNCIA EM DISCO
+def salvar(diretorio, indice):
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    with open(os.path.join(temporario, "palavras.bin"), "wb") as f:
+        f.write(indice.blob)
+    np.save(os.path.join(temporario, "offsets.npy"), indice.offsets)
+    np.save(os.path.join(temporario, "tabela.npy"), indice.tabela)
+
+    os.replace(temporario, diretorio)
+
+def carregar(diretorio):
+    offsets = np.load(os.path.join(diretorio, "offsets.npy"), mmap_mode="r")
+    tabela = np.load(os.path.join(diretorio, "tabela.npy"), mmap_mode="r")
+
+    with open(os.path.join(diretorio, "palavras.bin"), "rb") as f:
+        # mmap não aceita arquivo vazio
+        blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if offsets[-1] else b""
+
+    return IndicePalavras(blob, offsets, tabela)
+
+def obter_indice(caminho_lista):
+    """
+    Índice da lista de palavras (uma por linha). Na primeira vez lê o texto
+    e grava o índice em artefatos/; depois só abre os arquivos via mmap.
+    Levanta FileNotFoundError se a lista não existir.
+    """
+    if not os.path.exists(caminho_lista):
+        raise FileNotFoundError(caminho_lista)
+
+    diretorio = artefatos.caminho_artefato("dicionario", artefatos.calcular_hash(caminhos=[caminho_lista]))
+    if os.path.isdir(diretorio):
+        return carregar(diretorio)
+
+    with open(caminho_lista, "r", encoding="utf-8") as f:
+        indice = IndicePalavras.a_partir_de_palavras(linha.strip() for linha in f)
+
+    try:
+        salvar(diretorio, indice)
+        artefatos.remover_versoes_antigas("dicionario", diretorio)
+        indice = carregar(diretorio)
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar o índice de palavras: {e}")
+
+    return indice
@@ -1,5 +1,12 @@
-import bisect
 import os
+import numpy as np
+
+# Arquivos auxiliares
+from routes import medicao
+from routes import indice_palavras
+from routes import cache_lru
+from routes import regras_sufixos
+from routes import filtro_bloom
 
 
 
@@ -7,50 +14,255 @@ import os
 DIRETORIO_SCRIPT = os.path.dirname(os.path.abspath(__file__))
 CAMINHO_ARQUIVO = os.path.join(DIRETORIO_SCRIPT, "..", "base_palavras", "com_acento.txt")
 CAMINHO_TECH = os.path.normpath(os.path.join(DIRETORIO_SCRIPT, "..", "base_palavras", "palavras_tecnologia.txt"))
-
-# CARREGANDO TABELA DE PALAVRAS ORDENADAS
-try:
-    with open(CAMINHO_ARQUIVO, "r", encoding="utf-8") as f:
-        # Carrega removendo espaços e quebras de linha
-        TABELA_PALAVRAS_ORDENADAS = [linha.strip() for linha in f]
-    print(f"📚 Tabela de dados carregada: {len(TABELA_PALAVRAS_ORDENADAS)} palavras.")
-except FileNotFoundError:
-    print(f"❌ ERRO CRÍTICO: Arquivo não encontrado no caminho:\n{CAMINHO_ARQUIVO}")
-    TABELA_PALAVRAS_ORDENADAS = []
+CAMINHO_DIC = os.path.normpath(os.path.join(DIRETORIO_SCRIPT, "..", "base_palavras", "pt_BR.dic"))
+CAMINHO_AFF = os.path.normpath(os.path.join(DIRETORIO_SCRIPT, "..", "base_palavras", "pt_BR.aff"))
+
+# CARREGANDO O ÍNDICE DE PALAVRAS (blob + offsets via mmap, ver indice_palavras.py)
+def carregar_indice_palavras():
+    try:
+        with medicao.fase("input_filter.tabela_palavras"):
+            indice = indice_palavras.obter_indice(CAMINHO_ARQUIVO)
+        print(f"📚 Tabela de dados carregada: {len(indice)} palavras.")
+        return indice
+    except FileNotFoundError:
+        print(f"❌ ERRO CRÍTICO: Arquivo não encontrado no caminho:\n{CAMINHO_ARQUIVO}")
+        return indice_palavras.IndicePalavras.a_partir_de_palavras([])
 
 # CARREGANDO TABELA DE PALAVRAS DE TECNOLOGIA
-try:
-    with open(CAMINHO_TECH, "r", encoding="utf-8") as f:
-        TABELA_PALAVRAS_TECNOLOGIA = {linha.strip().lower() for linha in f if linha.strip()}
-except FileNotFoundError:
-    TABELA_PALAVRAS_TECNOLOGIA = set()
+def carregar_palavras_tecnologia():
+    try:
+        with open(CAMINHO_TECH, "r", encoding="utf-8") as f:
+            return {linha.strip().lower() for linha in f if linha.strip()}
+    except FileNotFoundError:
+        return set()
+
+INDICE_PALAVRAS = carregar_indice_palavras()
+TABELA_PALAVRAS_TECNOLOGIA = carregar_palavras_tecnologia()
+
+# Mapa forma -> lema pré-computado (ver mapa_lemas.py), instalado na inicialização
+MAPA_LEMAS = None
+
+# FILTRO DE BLOOM DAS PALAVRAS ACEITÁVEIS (ver filtro_bloom.py), criado na inicialização
+FILTRO_PALAVRAS = None
+
+def construir_filtro_palavras(indice, tecnologia):
+    """Bloom de tudo o que palavra_existe pode aceitar (lista de palavras + tecnologia)"""
+    with medicao.fase("input_filter.filtro_bloom"):
+        filtro = filtro_bloom.obter_filtro(
+            "bloom", [CAMINHO_ARQUIVO, CAMINHO_TECH],
+            lambda: [*indice, *tecnologia],
+        )
+    estatisticas = filtro.estatisticas()
+    print(f"🌸 Filtro de Bloom: {estatisticas['palavras']} palavras em {estatisticas['bytes'] / 1e3:.0f} KB "
+          f"(~{estatisticas['taxa_falsos_positivos']:.2%} de falsos positivos)")
+    return filtro
+
+def carregar_filtro_palavras():
+    global FILTRO_PALAVRAS
+
+    FILTRO_PALAVRAS = construir_filtro_palavras(INDICE_PALAVRAS, TABELA_PALAVRAS_TECNOLOGIA)
+
+def pode_existir(palavra):
+    """
+    False: palavra_existe com certeza recusa a palavra (sem falsos negativos).
+    True: pode existir, siga com a validação completa.
+    """
+    if FILTRO_PALAVRAS is None:
+        return True
+    return palavra.lower().strip() in FILTRO_PALAVRAS
+
+def instalar_mapa_lemas(mapa):
+    global MAPA_LEMAS
+
+    MAPA_LEMAS = mapa
+    cache_lru.limpar_caches()
+
+def ler_tabelas():
+    """
+    Índice, palavras de tecnologia e filtro lidos dos arquivos atuais, sem
+    instalá-los (a recarga monta o resto ao lado com eles, ver existe_em).
+    """
+    indice = carregar_indice_palavras()
+    tecnologia = carregar_palavras_tecnologia()
+    # Sem as palavras novas, o filtro antigo as recusaria
+    filtro = construir_filtro_palavras(indice, tecnologia) if FILTRO_PALAVRAS is not None else None
+    return indice, tecnologia, filtro
+
+def instalar_tabelas(indice, tecnologia, filtro, mapa_lemas=None):
+    """Troca as tabelas de uma vez e invalida os resultados memorizados das normalizações"""
+    global INDICE_PALAVRAS, TABELA_PALAVRAS_TECNOLOGIA, MAPA_LEMAS, FILTRO_PALAVRAS
+
+    FILTRO_PALAVRAS = filtro
+    INDICE_PALAVRAS = indice
+    TABELA_PALAVRAS_TECNOLOGIA = tecnologia
+    MAPA_LEMAS = mapa_lemas  # O antigo foi calculado com as listas antigas
+    cache_lru.limpar_caches()
+
+def recarregar_tabelas():
+    """Relê as listas de palavras e só então troca as tabelas (ler_tabelas + instalar_tabelas)"""
+    instalar_tabelas(*ler_tabelas())
 
 
 
 # INICIANDO FILTRAGEM E PADRONIZAÇÃO DE PALAVRAS
 def palavra_existe(palavra):
     """
-    Verifica se a palavra existe nas tabelas de dados usando busca binária.
-    Complexidade: O(log N) - Extremamente rápido.
+    Verifica se a palavra existe nas tabelas de dados usando a tabela hash
+    do índice compacto (crc32 + sondagem linear). Complexidade: O(1) em média.
     """
-    if not TABELA_PALAVRAS_ORDENADAS:
+    return _existe(palavra, INDICE_PALAVRAS, TABELA_PALAVRAS_TECNOLOGIA)
+
+def _existe(palavra, indice, tecnologia):
+    if not indice:
         return False
         
-    if palavra in TABELA_PALAVRAS_TECNOLOGIA:
+    if palavra in tecnologia:
         return palavra
     
     # Normaliza a entrada com tudo minúsculo e sem espaços nas pontas
     palavra = palavra.lower().strip()
     
-    # O bisect_left encontra a posição de inserção para manter a ordem
-    index = bisect.bisect_left(TABELA_PALAVRAS_ORDENADAS, palavra)
-    
-    # Se o índice retornado estiver dentro da lista e a palavra for igual, ACHAMOS!
-    if index < len(TABELA_PALAVRAS_ORDENADAS) and TABELA_PALAVRAS_ORDENADAS[index] == palavra:
+    # Consulta na tabela hash do índice compacto (crc32 -> id, compara os bytes no blob)
+    if palavra in indice:
         return palavra
         
     return False
 
+def existe_em(indice, tecnologia):
+    """palavra_existe sobre tabelas ainda não instaladas (recarga das listas)"""
+    return lambda palavra: _existe(palavra, indice, tecnologia)
+
+# REGRAS DE SUFIXO (compiladas uma vez em uma trie, ver regras_sufixos.py)
+# Cada grupo corresponde a um bloco 'if original.endswith(...)' e os grupos
+# são testados na ordem da lista. Dentro do grupo vale o sufixo mais longo:
+# {sufixo: [substituições]} -> candidato = palavra sem o sufixo + substituição
+
+# Acentos repostos em diminutivos/aumentativos (Pezinho -> Pe -> Pé / Pê)
+def _com_acentos(sufixo):
+    """'zinho' -> {'zinho': [''], 'azinho': ['a', 'á', 'â'], 'ezinho': [...], 'ozinho': [...]}"""
+    regras = {sufixo: ['']}
+    for vogal, agudo, circunflexo in (('a', 'á', 'â'), ('e', 'é', 'ê'), ('o', 'ó', 'ô')):
+        regras[vogal + sufixo] = [vogal, agudo, circunflexo]
+    return regras
+
+REGRAS_PLURAL = regras_sufixos.MotorSufixos([
+    {'ns': ['m']},                                      # REGRA 1: Nuvens -> Nuvem
+    {'ões': ['ão'], 'ães': ['ão'], 'ãos': ['ão']},      # REGRA 2: Corações -> Coração, Pães -> Pão
+    {'ais': ['al'], 'éis': ['el'], 'óis': ['ol']},      # REGRA 3: Animais -> Animal, Papéis -> Papel, Anzóis -> Anzol
+    {'is': ['il']},                                     #          Barris -> Barril
+    {'es': ['']},                                       # REGRA 4: Flores -> Flor, Luzes -> Luz
+    {'s': ['']},                                        # REGRA 5: Plural simples
+])
+
+# --- LISTA DE PROTEÇÃO (Falsos Femininos) ---
+# Palavras terminadas em 'a' que mudam de sentido se virarem 'o',
+# ou que simplesmente não têm masculino por flexão direta.
+PROTEGIDAS_GENERO = frozenset([
+    'casa',   # Evita 'caso'
+    'bola',   # Evita 'bolo'
+    'mala',   # Evita 'malo' (arcaico/espanhol)
+    'fala',   # Evita 'falo' (verbo/substantivo anatômico)
+    'bota',   # Evita 'boto' (animal)
+    'cola',   # Evita 'colo'
+    'mola',   # Evita 'molo'
+    'sola',   # Evita 'solo'
+    'lata',   # Evita 'lato' (amplo)
+    'mata',   # Evita 'mato' (grama)
+    'vela',   # Evita 'velo' (lã)
+    'pipa',   # Evita 'pipo'
+    'rosa',   # Evita 'roso'
+    'palha',  # Evita 'palho'
+    'folha',  # Evita 'folho'
+    'caixa',  # Evita 'caixo'
+    'cabra',  # Evita 'cabro'
+    'fera',   # Evita 'fero'
+    'brasa',  # Evita 'braso'
+    'tropa',  # Evita 'tropo'
+    'prata',  # Evita 'prato'
+    'cama',   # Evita 'camo'
+    'lama',   # Evita 'lamo'
+    'grama',  # Evita 'gramo'
+    'dama',   # Evita 'damo' (embora exista, raramente é o par desejado)
+    'baleia', # Evita 'baleio'
+    'aranha', # Evita 'aranho'
+    'faca'    # Evita 'faco' (se existir no banco)
+])
+
+REGRAS_GENERO = regras_sufixos.MotorSufixos([
+    {'esa': ['ês']},                                    # 1. Portuguesa -> Português
+    {'essa': ['e']},                                    #    Abadessa -> Abade, Condessa -> Conde
+    {'ona': ['ão']},                                    # 2. Valentona -> Valentão
+    {'ã': ['ão']},                                      # 3. Irmã -> Irmão
+    {'a': ['o']},                                       # 4. Menina -> Menino
+    regras_sufixos.GrupoRegras({'a': [''], 'ã': ['']}, base_minima=3),  # 5. Professora -> Professor
+], protegidas=PROTEGIDAS_GENERO)
+
+REGRAS_GRAU = regras_sufixos.MotorSufixos([
+    {**_com_acentos('zinho'), **_com_acentos('zinha')}, # REGRA 1: Pezinho -> Pé, Cafezinho -> Café
+    {'inho': ['o', 'a', 'e', ''], 'inha': ['o', 'a', 'e', '']},  # REGRA 2: Gatinho -> Gato, Casinha -> Casa
+    {**_com_acentos('zão'), **_com_acentos('zona')},    # REGRA 3: Pezão -> Pé
+    {'ão': ['o', '']},                                  # REGRA 4: Gatão -> Gato, Rapazão -> Rapaz
+    {'ona': ['a', '']},                                 #          Mulherona -> Mulher
+    {'ito': ['o', 'a'], 'ita': ['o', 'a']},             # REGRA 5: -ITO / -ITA
+], tamanho_minimo=4)
+
+REGRAS_VERBO = regras_sufixos.MotorSufixos([
+    {'ando': ['ar'], 'endo': ['er'], 'indo': ['ir']},   # 2. Gerúndio: Amando -> Amar
+    {'ado': ['ar'], 'ido': ['er', 'ir']},               # 3. Particípio: Amado -> Amar, Comido -> Comer
+    {'aram': ['ar'], 'eram': ['er'], 'iram': ['ir']},   # 4. Pretérito: Falaram -> Falar
+    {'ava': ['ar']},                                    #    Imperfeito 1ª conj: Amava -> Amar
+    {'ia': ['er', 'ir']},                               #    Imperfeito 2ª/3ª conj: Corria, Partia
+    {'ou': ['ar'], 'eu': ['er'], 'iu': ['ir']},         #    Falou, Correu, Partiu
+    {'ei': ['ar']},                                     #    Amei -> Amar
+    {'ão': ['r'], 'arão': ['ar', 'arr']},               #    Futuro: Terão -> Ter, Amarão -> Amar
+])
+
+# --- LISTA DE PROTEÇÃO DAS DERIVAÇÕES (Colisões Semânticas) ---
+# Palavras que parecem derivadas/aumentativos, mas se mudar o sufixo,
+# viram outra palavra com sentido totalmente errado.
+PROTEGIDAS_DERIVACOES = frozenset([
+    'coração', 'coracao', # Evita 'corar'
+    'nação', 'nacao',     # Evita 'nar' (se existisse) ou 'naça'
+    'ração', 'racao',     # Evita 'rar'
+    'fração', 'fracao',
+    'canção', 'cancao',
+    'feijão', 'feijao',
+    'violão', 'violao',   # Evita 'viola' (sentido diferente)
+    'avião', 'aviao',
+    'verão', 'verao',     # Evita 'ver'
+    'melão', 'melao',     # Evita 'melar'
+    'leão', 'leao',
+    'camaleão', 'camaleao',
+    'furacão', 'furacao', # Evita 'furar'
+    'tubarão', 'tubarao',
+    'mão', 'mao', 'pão', 'pao', 'chão', 'chao' # Curtas já barram no len, mas reforçando
+])
+
+REGRAS_DERIVACOES = regras_sufixos.MotorSufixos([
+    # 1. -ÃO / -ÇÃO: aumentativo (Portão -> Porta) ou ação (Criação -> Criar, Navegação -> Navegar).
+    # Se nada existir, a palavra fica como está (Balão não vira Bala)
+    regras_sufixos.GrupoRegras({'ão': ['o', 'a'], 'ção': ['ço', 'ça', 'r', 'ar']}, terminal=True),
+    {'mento': ['r', '']},                               # 2. Casamento -> Casar, Monitoramento -> Monitor
+    {'mente': [''], 'amente': ['a', 'o']},              # 3. Advérbios
+    {'eiro': ['a', 'o', 'e'], 'eira': ['a', 'o', 'e'],  # 4. Pedreiro -> Pedra, Livreiro -> Livro
+     'oeiro': ['oa', 'oo', 'oe', 'ão'], 'oeira': ['oa', 'oo', 'oe', 'ão']},  # Limoeiro -> Limão
+    {'ista': ['', 'a', 'o']},                           #    Jornalista -> Jornal
+    {'eza': ['o', ''], 'ez': ['o', '']},                # 5. Beleza -> Belo, Lucidez -> Lúcid(o)
+    {'dade': [''], 'idade': ['i', 'il'],                #    Leal-dade, Habilidade -> Hábil
+     'cidade': ['z', 'ci', 'cil'], 'ndade': ['m', 'n']},  # Felicidade -> Feliz, Bondade -> Bom
+    {'ismo': ['', 'o']},
+    {'ura': ['o', 'e']},
+    {'oso': ['o', 'a'], 'osa': ['o', 'a']},             # 6. Adjetivos
+    {'al': ['o']},
+    {'ável': ['ar', 'aer'], 'ível': ['ir', 'ier'], 'evel': ['er', 'eer']},  # Amável -> Amar
+], tamanho_minimo=4, protegidas=PROTEGIDAS_DERIVACOES)
+
+# Plural e gênero são os primeiros passos de toda palavra: quem não termina
+# em nenhum sufixo deles sai com um endswith, sem entrar no motor
+FINAIS_PLURAL = REGRAS_PLURAL.finais
+FINAIS_GENERO = REGRAS_GENERO.finais
+
+@cache_lru.memorizar("padronizar_plural")
 def padronizar_plural(palavra):
     """
     Tenta transformar plural em singular.
@@ -58,225 +270,39 @@ def padronizar_plural(palavra):
     Caso contrário, retorna a palavra original.
     """
     original = palavra.lower().strip()
-    
-    # Se a palavra original já não termina em 's', provavelmente é singular
-    # (Exceção: palavras que não seguem regra padrão, mas vamos focar no 's' final)
-    if not original.endswith('s'):
+    if not original.endswith(FINAIS_PLURAL):
         return original
+    return REGRAS_PLURAL.aplicar_normalizada(original, palavra_existe)
 
-    candidato_sing = "" # candidato_singidato a singular
-
-    # --- REGRA 1: Terminações em -NS (Nuvens -> Nuvem) ---
-    if original.endswith('ns'):
-        candidato_sing = original[:-2] + 'm'
-        if palavra_existe(candidato_sing): return candidato_sing
-
-    # --- REGRA 2: Terminações em -ÕES, -ÃES, -ÃOS ---
-    if original.endswith(('ões', 'ães', 'ãos')):
-        # Tenta trocar tudo por 'ão' (Corações -> Coração, Pães -> Pão)
-        candidato_sing = original[:-3] + 'ão' 
-        if palavra_existe(candidato_sing): return candidato_sing
-
-    # --- REGRA 3: Terminações em -IS (Complexo: animais, faróis, funis) ---
-    if original.endswith('is'):
-        # Caso -AIS -> -AL (Animais -> Animal)
-        if original.endswith('ais'):
-            candidato_sing = original[:-3] + 'al'
-            if palavra_existe(candidato_sing): return candidato_sing
-        
-        # Caso -ÉIS -> -EL (Papéis -> Papel) - Remove acento
-        if original.endswith('éis'):
-            candidato_sing = original[:-3] + 'el'
-            if palavra_existe(candidato_sing): return candidato_sing
-            
-        # Caso -ÓIS -> -OL (Anzóis -> Anzol) - Remove acento
-        if original.endswith('óis'):
-            candidato_sing = original[:-3] + 'ol'
-            if palavra_existe(candidato_sing): return candidato_sing
-        
-        # Caso -IS -> -IL (Barris -> Barril)
-        if original.endswith('is'):
-            candidato_sing = original[:-2] + 'il'
-            if palavra_existe(candidato_sing): return candidato_sing
-
-    # --- REGRA 4: Terminações em -ES (Flores -> Flor, Luzes -> Luz) ---
-    if original.endswith('es'):
-        # Tenta remover apenas o 'es' (Muitas vezes funciona para R e Z)
-        candidato_sing = original[:-2]
-        if palavra_existe(candidato_sing): return candidato_sing
-
-    # --- REGRA 5: Plural Simples (Remove apenas o 's') ---
-    if original.endswith('s'):
-        candidato_sing = original[:-1]
-        if palavra_existe(candidato_sing): return candidato_sing
-
-    # Se falhou em tudo (Ex: 'Ônibus' -> tira 's' vira 'Ônibu' que não existe),
-    # assume que a palavra já é a base ou é invariável.
-    return original
-
+@cache_lru.memorizar("padronizar_genero")
 def padronizar_genero(palavra):
     """
     Tenta converter feminino para masculino.
     Contém Lista de Proteção para evitar mudanças de sentido (Ex: Casa -> Caso).
     """
     original = palavra.lower().strip()
-    
-    # Se não termina em 'a' ou 'ã', provavelmente já é masculino ou invariável
-    if not original.endswith(('a', 'ã')):
+    if not original.endswith(FINAIS_GENERO):
         return original
+    return REGRAS_GENERO.aplicar_normalizada(original, palavra_existe)
 
-    # --- LISTA DE PROTEÇÃO (Falsos Femininos) ---
-    # Palavras terminadas em 'a' que mudam de sentido se virarem 'o',
-    # ou que simplesmente não têm masculino por flexão direta.
-    protegidas = [
-        'casa',   # Evita 'caso'
-        'bola',   # Evita 'bolo'
-        'mala',   # Evita 'malo' (arcaico/espanhol)
-        'fala',   # Evita 'falo' (verbo/substantivo anatômico)
-        'bota',   # Evita 'boto' (animal)
-        'cola',   # Evita 'colo'
-        'mola',   # Evita 'molo'
-        'sola',   # Evita 'solo'
-        'lata',   # Evita 'lato' (amplo)
-        'mata',   # Evita 'mato' (grama)
-        'vela',   # Evita 'velo' (lã)
-        'pipa',   # Evita 'pipo'
-        'rosa',   # Evita 'roso'
-        'palha',  # Evita 'palho'
-        'folha',  # Evita 'folho'
-        'caixa',  # Evita 'caixo'
-        'cabra',  # Evita 'cabro'
-        'fera',   # Evita 'fero'
-        'brasa',  # Evita 'braso'
-        'tropa',  # Evita 'tropo'
-        'prata',  # Evita 'prato'
-        'cama',   # Evita 'camo'
-        'lama',   # Evita 'lamo'
-        'grama',  # Evita 'gramo'
-        'dama',   # Evita 'damo' (embora exista, raramente é o par desejado)
-        'baleia', # Evita 'baleio'
-        'aranha', # Evita 'aranho'
-        'faca'    # Evita 'faco' (se existir no banco)
-    ]
-
-    if original in protegidas:
-        return original
-
-    # --- TENTATIVAS (Candidatos a Masculino) ---
-
-    # 1. Regra -ESA/-ESSA (Portuguesa -> Português)
-    if original.endswith('esa'):
-        candidato = original[:-3] + 'ês'
-        if palavra_existe(candidato): return candidato
-
-    if original.endswith('essa'):
-        candidato = original[:-4] + 'e' # Abadessa -> Abade, Condessa -> Conde
-        if palavra_existe(candidato): return candidato
-
-    # 2. Regra -ONA (Valentona -> Valentão)
-    if original.endswith('ona'):
-        candidato = original[:-3] + 'ão'
-        if palavra_existe(candidato): return candidato
-        
-    # 3. Regra -Ã (Irmã -> Irmão)
-    if original.endswith('ã'):
-        candidato = original[:-1] + 'ão'
-        if palavra_existe(candidato): return candidato
-
-    # 4. Regra Geral: Troca 'a' por 'o' (Menina -> Menino)
-    if original.endswith('a'):
-        candidato = original[:-1] + 'o'
-        if palavra_existe(candidato): return candidato
-
-    # 5. Regra de Corte: Apenas tira o 'a' (Professora -> Professor)
-    candidato = original[:-1]
-    if len(candidato) > 2 and palavra_existe(candidato): 
-        return candidato
-
-    return original
-
+@cache_lru.memorizar("padronizar_grau")
 def padronizar_grau(palavra):
     """
     Remove diminutivos/aumentativos e tenta restaurar acentos perdidos.
     Ex: Pezão -> Pé, Cafezinho -> Café.
     """
-    original = palavra.lower().strip()
-    
-    if len(original) < 4:
-        return original
-
-    # --- REGRA 1: Diminutivos com -ZINHO / -ZINHA ---
-    if original.endswith(('zinho', 'zinha')):
-        # Tenta remover o sufixo inteiro (Pezinho -> Pe)
-        base = original[:-5]
-        
-        if palavra_existe(base): return base
-        
-        # Tenta repor acentos (Pezinho -> Pe -> Pé / Cafezinho -> Cafe -> Café)
-        if base and base[-1] in 'aeo':
-            # Tenta Agudo (á, é, ó)
-            mapa_agudo = {'a': 'á', 'e': 'é', 'o': 'ó'}
-            candidato = base[:-1] + mapa_agudo[base[-1]]
-            if palavra_existe(candidato): return candidato
-            
-            # Tenta Circunflexo (â, ê, ô)
-            mapa_circ = {'a': 'â', 'e': 'ê', 'o': 'ô'}
-            candidato = base[:-1] + mapa_circ[base[-1]]
-            if palavra_existe(candidato): return candidato
-
-    # --- REGRA 2: Diminutivos com -INHO / -INHA ---
-    if original.endswith(('inho', 'inha')):
-        base = original[:-4]
-        # Ex: Gatinho -> Gato, Casinha -> Casa
-        for vogal in ['o', 'a', 'e']:
-            if palavra_existe(base + vogal): return base + vogal
-        if palavra_existe(base): return base
-
-    # --- REGRA 3: Aumentativos com -ZÃO / -ZONA ---
-    if original.endswith(('zão', 'zona')):
-        # Remove 'zão'/'zona' (Pezão -> Pe)
-        sufixo = 3 if original.endswith('zão') else 4
-        base = original[:-sufixo]
-
-        if palavra_existe(base): return base
-
-        # Tenta repor acentos (Pezão -> Pe -> Pé)
-        if base and base[-1] in 'aeo':
-            mapa_agudo = {'a': 'á', 'e': 'é', 'o': 'ó'}
-            candidato = base[:-1] + mapa_agudo[base[-1]]
-            if palavra_existe(candidato): return candidato
-            
-            mapa_circ = {'a': 'â', 'e': 'ê', 'o': 'ô'}
-            candidato = base[:-1] + mapa_circ[base[-1]]
-            if palavra_existe(candidato): return candidato
-
-    # --- REGRA 4: Aumentativos com -ÃO / -ONA ---
-    # (Rapazão -> Rapaz, Mulherona -> Mulher)
-    if original.endswith('ão'):
-        base = original[:-2]
-        # Gatão -> Gato
-        if palavra_existe(base + 'o'): return base + 'o'
-        # Rapazão -> Rapaz (base pura)
-        if palavra_existe(base): return base
-
-    if original.endswith('ona'):
-        base = original[:-3]
-        if palavra_existe(base + 'a'): return base + 'a'
-        if palavra_existe(base): return base
-
-    # --- REGRA 5: Sufixos -ITO / -ITA ---
-    if original.endswith(('ito', 'ita')):
-        base = original[:-3]
-        if palavra_existe(base + 'o'): return base + 'o'
-        if palavra_existe(base + 'a'): return base + 'a'
-
-    return original
+    return REGRAS_GRAU.aplicar(palavra, palavra_existe)
 
+@cache_lru.memorizar("padronizar_verbo")
 def padronizar_verbo(palavra):
     """
     Tenta converter verbos conjugados para o INFINITIVO.
     Retorna o infinitivo SE ele existir no banco.
     """
+    return _padronizar_verbo(palavra, palavra_existe)
+
+def _padronizar_verbo(palavra, existe):
+    """Corpo do padronizar_verbo com a função de consulta recebida (usada também pelo lote)"""
     original = palavra.lower().strip()
 
     # --- 1. Mesóclise e Ênclise (Hífens) ---
@@ -286,251 +312,143 @@ def padronizar_verbo(palavra):
         raiz = partes[0]
         
         # Caso simples: o verbo está inteiro antes do hífen (ex: mandar-lhe)
-        if palavra_existe(raiz): return raiz
+        if existe(raiz): return raiz
         
         # Caso com acento final (ex: amá-lo -> amar)
         # Remove acento da última letra e adiciona 'r'
         if raiz.endswith(('á', 'é')):
             mapa_acento = {'á': 'ar', 'é': 'er'}
             candidato = raiz[:-1] + mapa_acento[raiz[-1]]
-            if palavra_existe(candidato): return candidato
+            if existe(candidato): return candidato
 
         # Mesóclise (ex: falar-lhe-ei -> raiz é 'falar')
         # Tenta validar se a primeira parte + 'r' forma um verbo (dir-se-ia -> dir -> dizer é irregular, difícil pegar sem mapa)
-        if palavra_existe(raiz + 'r'): return raiz + 'r'
-
-    # --- 2. Gerúndio (-NDO) ---
-    if original.endswith('ando'): # Amando -> Amar
-        candidato = original[:-4] + 'ar'
-        if palavra_existe(candidato): return candidato
-
-    if original.endswith('endo'): # Correndo -> Correr
-        candidato = original[:-4] + 'er'
-        if palavra_existe(candidato): return candidato
-
-    if original.endswith('indo'): # Partindo -> Partir
-        candidato = original[:-4] + 'ir'
-        if palavra_existe(candidato): return candidato
-
-    # --- 3. Particípio (-DO) ---
-    if original.endswith('ado'): # Amado -> Amar
-        candidato = original[:-3] + 'ar'
-        if palavra_existe(candidato): return candidato
-
-    if original.endswith('ido'): # Comido/Partido -> Comer/Partir
-        # Tenta -er primeiro
-        candidato = original[:-3] + 'er'
-        if palavra_existe(candidato): return candidato
-        # Tenta -ir
-        candidato = original[:-3] + 'ir'
-        if palavra_existe(candidato): return candidato
-
-    # --- 4. Pretéritos e Futuros (Sufixos diversos) ---
-    
-    # Terminações em -RAM (Pretérito Perfeito/Mais-que-perfeito)
-    if original.endswith('aram'): # Falaram -> Falar
-        candidato = original[:-4] + 'ar'
-        if palavra_existe(candidato): return candidato
-        
-    if original.endswith('eram'): # Comeram -> Comer
-        candidato = original[:-4] + 'er'
-        if palavra_existe(candidato): return candidato
-        
-    if original.endswith('iram'): # Partiram -> Partir
-        candidato = original[:-4] + 'ir'
-        if palavra_existe(candidato): return candidato
-
-    # Terminações em -AVA (Imperfeito 1ª conj)
-    if original.endswith('ava'): # Amava -> Amar
-        candidato = original[:-3] + 'ar'
-        if palavra_existe(candidato): return candidato
-
-    # Terminações em -IA (Imperfeito 2ª/3ª conj)
-    if original.endswith('ia'): # Corria/Partia
-        if palavra_existe(original[:-2] + 'er'): return original[:-2] + 'er'
-        if palavra_existe(original[:-2] + 'ir'): return original[:-2] + 'ir'
-
-    # Terminações Curtas (-OU, -EU, -IU)
-    if original.endswith('ou'): # Falou -> Falar
-        candidato = original[:-2] + 'ar'
-        if palavra_existe(candidato): return candidato
-
-    if original.endswith('eu'): # Correu -> Correr
-        candidato = original[:-2] + 'er'
-        if palavra_existe(candidato): return candidato
-
-    if original.endswith('iu'): # Partiu -> Partir
-        candidato = original[:-2] + 'ir'
-        if palavra_existe(candidato): return candidato
-
-    # Terminação -EI (Pretérito Perfeito 1ª p.s.)
-    if original.endswith('ei'): # Amei -> Amar
-        candidato = original[:-2] + 'ar'
-        if palavra_existe(candidato): return candidato
-
-    # Terminação -ÃO (Futuro)
-    if original.endswith('ão'): 
-        # Tenta arão -> ar
-        if original.endswith('arão'):
-            if palavra_existe(original[:-4] + 'ar'): return original[:-4] + 'ar'
-        # Genérico (terão -> ter)
-        if palavra_existe(original[:-2] + 'r'): return original[:-2] + 'r' 
-
-    return original
+        if existe(raiz + 'r'): return raiz + 'r'
+
+    # --- 2 a 4. Sufixos verbais (ver REGRAS_VERBO) ---
+    return REGRAS_VERBO.aplicar(original, existe)
 
+@cache_lru.memorizar("padronizar_derivacoes")
 def padronizar_derivacoes(palavra):
     """
     Tenta remover sufixos nominais (profissão, qualidade, ação) para encontrar a palavra raiz.
     Contém proteção contra "falsos positivos" (ex: Coração não vira Corar).
     """
-    original = palavra.lower().strip()
-    
-    # Trava de segurança para palavras muito curtas (pão, mão, céu, lei)
-    if len(original) < 4:
-        return original
+    return REGRAS_DERIVACOES.aplicar(palavra, palavra_existe)
 
-    # --- 1. BLOCO DE TRATAMENTO DE -ÃO / -ÇÃO (O mais crítico) ---
-    if original.endswith('ão'):
-        # A. LISTA DE PROTEÇÃO (Colisões Semânticas)
-        # Palavras que parecem derivadas/aumentativos, mas se mudar o sufixo,
-        # viram outra palavra com sentido totalmente errado.
-        protegidas = [
-            'coração', 'coracao', # Evita 'corar'
-            'nação', 'nacao',     # Evita 'nar' (se existisse) ou 'naça'
-            'ração', 'racao',     # Evita 'rar'
-            'fração', 'fracao',
-            'canção', 'cancao',
-            'feijão', 'feijao',
-            'violão', 'violao',   # Evita 'viola' (sentido diferente)
-            'avião', 'aviao',
-            'verão', 'verao',     # Evita 'ver'
-            'melão', 'melao',     # Evita 'melar'
-            'leão', 'leao',
-            'camaleão', 'camaleao',
-            'furacão', 'furacao', # Evita 'furar'
-            'tubarão', 'tubarao',
-            'mão', 'mao', 'pão', 'pao', 'chão', 'chao' # Curtas já barram no len, mas reforçando
-        ]
-        
-        if original in protegidas:
-            return original
-
-        base_sem_ao = original[:-2]
-
-        # B. TENTATIVA: AUMENTATIVO MASCULINO (-ÃO -> -O)
-        # Prioridade: Substantivo (Portão -> Porta, Prato -> Pratão)
-        candidato = base_sem_ao + 'o'
-        if palavra_existe(candidato): return candidato
-
-        # C. TENTATIVA: AUMENTATIVO FEMININO (-ÃO -> -A)
-        # Prioridade: Substantivo (Muralhão -> Muralha)
-        candidato = base_sem_ao + 'a'
-        if palavra_existe(candidato): return candidato
-
-        # D. TENTATIVA: DERIVAÇÃO VERBAL (-ÇÃO -> -R / -AR)
-        # Só entra aqui se não for aumentativo de nada existente
-        if original.endswith('ção'):
-            base_sem_cao = original[:-3]
-            # Ex: Criação -> Criar
-            if palavra_existe(base_sem_cao + 'r'): return base_sem_cao + 'r'
-            # Ex: Navegação -> Navegar
-            if palavra_existe(base_sem_cao + 'ar'): return base_sem_cao + 'ar'
-
-        # Se falhou em tudo, retorna original (Ex: Balão -> Balo? Bala? Balar? Não.)
-        return original
 
-    # --- 2. AÇÃO E RESULTADO (-MENTO) ---
-    if original.endswith('mento'):
-        base = original[:-5]
-        if palavra_existe(base + 'r'): return base + 'r' # Casamento -> Casar
-        if palavra_existe(base): return base # Monitoramento -> Monitor
-
-    # --- 3. ADVÉRBIOS (-MENTE) ---
-    if original.endswith('mente'):
-        base = original[:-5]
-        if palavra_existe(base): return base
-        if base.endswith('a'):
-            candidato = base[:-1] + 'o'
-            if palavra_existe(candidato): return candidato
-
-    # --- 4. PROFISSÕES E ÁRVORES (-EIRO / -EIRA / -ISTA) ---
-    if original.endswith(('eiro', 'eira')):
-        base = original[:-4]
-        if palavra_existe(base + 'a'): return base + 'a' # Pedr-a
-        if palavra_existe(base + 'o'): return base + 'o' # Livr-o
-        if palavra_existe(base + 'e'): return base + 'e' # Leit-e
-        if base.endswith('o') and palavra_existe(base[:-1] + 'ão'): 
-            return base[:-1] + 'ão' # Limão -> Limoeiro
-
-    if original.endswith('ista'):
-        base = original[:-4]
-        if palavra_existe(base): return base # Jornal
-        if palavra_existe(base + 'a'): return base + 'a' 
-        if palavra_existe(base + 'o'): return base + 'o'
-
-    # --- 5. QUALIDADE E ESTADO (-EZ / -EZA / -DADE / -URA / -ISMO) ---
-    if original.endswith(('eza', 'ez')):
-        tamanho = 3 if original.endswith('eza') else 2
-        base = original[:-tamanho]
-        if palavra_existe(base + 'o'): return base + 'o' # Bel-o
-        if palavra_existe(base): return base # Lucid-ez
-
-    if original.endswith('dade'):
-        base = original[:-4]
-        if base.endswith('ci'): # Felicidade -> Feliz
-            if palavra_existe(base[:-2] + 'z'): return base[:-2] + 'z'
-        if base.endswith('n'): # Bondade -> Bom
-             if palavra_existe(base[:-1] + 'm'): return base[:-1] + 'm'
-        if palavra_existe(base): return base # Leal
-        if base.endswith('i') and palavra_existe(base[:-1] + 'il'): return base[:-1] + 'il' # Habilidade
-
-    if original.endswith('ismo'):
-        base = original[:-4]
-        if palavra_existe(base): return base
-        if palavra_existe(base + 'o'): return base + 'o'
-
-    if original.endswith('ura'):
-        base = original[:-3]
-        if palavra_existe(base + 'o'): return base + 'o'
-        if palavra_existe(base + 'e'): return base + 'e'
-
-    # --- 6. ADJETIVOS (-OSO / -AL / -VEL) ---
-    if original.endswith(('oso', 'osa')):
-        base = original[:-3]
-        if palavra_existe(base + 'o'): return base + 'o'
-        if palavra_existe(base + 'a'): return base + 'a'
-
-    if original.endswith('al'):
-        base = original[:-2]
-        if palavra_existe(base + 'o'): return base + 'o'
-
-    if original.endswith('vel'): # Amável -> Amar
-        base = original[:-3]
-        if base.endswith(('á', 'í', 'e')): 
-             mapa = {'á': 'a', 'í': 'i', 'é': 'e'}
-             sem_acento = base[:-1] + mapa.get(base[-1], base[-1])
-             if palavra_existe(sem_acento + 'r'): return sem_acento + 'r'
-             if palavra_existe(sem_acento + 'er'): return sem_acento + 'er'
-
-    return original
+
+# ORDEM DO PIPELINE (definida só aqui): (passo com a consulta recebida, versão memorizada)
+PASSOS = (
+    (REGRAS_PLURAL.aplicar, padronizar_plural),
+    (REGRAS_GENERO.aplicar, padronizar_genero),
+    (REGRAS_GRAU.aplicar, padronizar_grau),
+    (_padronizar_verbo, padronizar_verbo),
+    (REGRAS_DERIVACOES.aplicar, padronizar_derivacoes),
+)
+
+def _normalizar(palavra, inputUsuario, existe, memorizados=False):
+    """
+    Núcleo do formatar_palavra e do normalizar_lote. memorizados=True usa os
+    padronizar_* (caches LRU das requisições); senão cada passo recebe 'existe'.
+    """
+    if not(existe(palavra)) and inputUsuario:
+        return False
+
+    for passo, passo_memorizado in PASSOS:
+        palavra = passo_memorizado(palavra) if memorizados else passo(palavra, existe)
+
+    return palavra
 
 
 
 # FORMATANDO PALAVRA PARA EXIBIÇÃO NO FRONTEND
+@cache_lru.memorizar("formatar_palavra")
 def formatar_palavra(palavra, inputUsuario = True):
     """
     Formata a palavra para exibição (primeira letra maiúscula).
     """
-    if not(palavra_existe(palavra)) and inputUsuario:
-        return False
-    
-    palavra = padronizar_plural(palavra)
-    palavra = padronizar_genero(palavra)
-    palavra = padronizar_grau(palavra)
-    palavra = padronizar_verbo(palavra)
-    palavra = padronizar_derivacoes(palavra)
+    # Forma conhecida: o resultado já foi calculado offline
+    if MAPA_LEMAS is not None:
+        lema = MAPA_LEMAS.consultar(palavra, inputUsuario)
+        if lema is not None:
+            return lema
 
-    return palavra
+    return _normalizar(palavra, inputUsuario, palavra_existe, memorizados=True)
+
+
+
+# NORMALIZAÇÃO EM LOTE (passos offline: vocabulário, ranking do dia)
+MIN_PALAVRAS_POR_PROCESSO = 20000  # Abaixo disso o custo do pool não compensa
+
+def sondas_compartilhadas(consultar=None):
+    """
+    palavra_existe (ou consultar) com memória própria, para um lote: candidatos
+    repetidos entre palavras do lote (gatinhas/gatinha/gata -> gato) são
+    consultados uma vez só. Não passa pelos caches LRU, que ficam para as requisições.
+    """
+    if consultar is None:
+        consultar = palavra_existe
+    sondas = {}
+
+    def existe(palavra):
+        resultado = sondas.get(palavra)
+        if resultado is None:
+            resultado = sondas[palavra] = consultar(palavra)
+        return resultado
+
+    return existe
+
+def _normalizar_bloco(argumentos):
+    """Executado em cada processo (ou direto, sem pool): [(forma, válida), ...]"""
+    palavras, inputUsuario = argumentos
+    existe = sondas_compartilhadas()
+    return [(_normalizar(p, inputUsuario, existe), existe(p) != False) for p in palavras]
+
+def _como_lista(palavras):
+    return palavras.tolist() if hasattr(palavras, "tolist") else list(palavras)
+
+def consultar_lote(palavras, consultar=None):
+    """
+    palavra_existe (ou consultar, ver existe_em) para muitas palavras: formas
+    encontradas (ou False), alinhadas com a entrada
+    """
+    existe = sondas_compartilhadas(consultar)
+    return [existe(p) for p in _como_lista(palavras)]
+
+def normalizar_lote(palavras, inputUsuario = True, processos = 1):
+    """
+    formatar_palavra para muitas palavras de uma vez (lista, iterável ou array numpy).
+
+    Retorna (formas, validas), alinhados com a entrada:
+        formas  lista com a forma canônica de cada palavra (False se inválida e inputUsuario)
+        validas array booleano: a palavra existe nas tabelas (palavra_existe)
+
+    Palavras repetidas são processadas uma vez. Com processos > 1 e lotes
+    grandes, as palavras distintas são divididas entre processos criados por
+    fork (o índice de palavras é mmap e fica compartilhado).
+    """
+    palavras = _como_lista(palavras)
+    unicas = list(dict.fromkeys(palavras))
+
+    processos = min(processos, len(unicas) // MIN_PALAVRAS_POR_PROCESSO)
+    if processos > 1:
+        import multiprocessing
+
+        metodos = multiprocessing.get_all_start_methods()
+        contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+
+        tamanho = -(-len(unicas) // processos)
+        blocos = [(unicas[i:i + tamanho], inputUsuario) for i in range(0, len(unicas), tamanho)]
+        with contexto.Pool(processes=processos) as pool:
+            resultados = [r for bloco in pool.map(_normalizar_bloco, blocos) for r in bloco]
+    else:
+        resultados = _normalizar_bloco((unicas, inputUsuario))
+
+    por_palavra = dict(zip(unicas, resultados))
+    formas = [por_palavra[p][0] for p in palavras]
+    validas = np.fromiter((por_palavra[p][1] for p in palavras), dtype=bool, count=len(palavras))
+    return formas, validas
 
 
 
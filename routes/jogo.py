@@ -0,0 +1,543 @@
+import os
+import numpy as np
+from datetime import datetime
+import hashlib
+import threading
+import zlib
+
+# Arquivos auxiliares
+from routes import model_loader
+from routes import artefatos
+from routes import ranking
+from routes import dicionario
+from routes import aceitacao
+from routes import validade
+from routes import medicao
+from routes import cache_lru
+from routes import input_filter
+from routes import mapa_lemas
+from routes import subpalavras
+from routes import sem_acento
+from routes import listas_palavras
+from routes.puzzle import PuzzleDoDia, ArmazemPuzzles
+
+"""
+===========================================================
+🔍 COMO O WORD2VEC É USADO NESTE JOGO (EXPLICAÇÃO TÉCNICA)
+===========================================================
+
+Este jogo funciona comparando a palavra que o jogador digita
+com a palavra secreta usando vetores gerados pelo modelo
+Word2Vec especializado em TECNOLOGIA.
+
+📌 1. VETORIZAÇÃO DAS PALAVRAS
+--------------------------------
+Quando uma palavra é enviada pelo jogador, chamamos a função:
+
+    obter_vetor_word2vec(palavra)
+
+Essa função tenta encontrar o vetor da palavra dentro do modelo
+Word2Vec (word2vec_tecnologia.kv).
+
+• Se a palavra existe no modelo → retornamos o vetor real treinado
+• Se NÃO existe → compomos o vetor pelos n-gramas de caracteres
+  (como o fastText faz), sempre o mesmo para a mesma palavra
+
+Cada palavra vira um vetor de 300 dimensões, por exemplo:
+[0.12, -0.88, 0.03, ..., 0.54]
+
+Esses vetores representam o *significado* das palavras com base
+nos textos de tecnologia usados durante o treinamento.
+
+📌 2. COMPARAÇÃO ENTRE AS PALAVRAS
+------------------------------------
+A similaridade é calculada por:
+
+    calcular_similaridade_cosseno(vetor_tentativa, vetor_secreto)
+
+Esse cálculo gera um valor entre 0% e 100%, baseado no quanto
+os vetores apontam para a mesma direção no espaço vetorial.
+
+Quanto mais parecidas no "contexto tecnológico", maior a
+similaridade.
+
+Exemplos:
+• “computador” x “processador” → alta similaridade
+• “computador” x “bluetooth”   → média
+• “computador” x “ransomware”  → baixa
+
+📌 3. PALAVRA DO DIA
+-----------------------
+A função:
+
+    obter_palavra_do_dia()
+
+usa um seed baseado na data atual para escolher SEMPRE a mesma
+palavra durante aquele dia, impedindo que o jogador reinicie a
+partida.
+
+📌 4. FILTRO DE PALAVRAS
+---------------------------
+A função:
+
+    filtrar_palavras_no_modelo()
+
+garante que só usamos:
+    ✔ palavras únicas (sem espaço)
+    ✔ palavras que EXISTEM dentro do Word2Vec
+
+Isso melhora a qualidade do jogo, pois só comparamos vetores reais.
+
+📌 5. POR QUE ISSO TUDO?
+---------------------------
+Porque o jogo funciona como o famoso “Contexto”: o jogador não
+recebe letras, e sim um grau de proximidade semântica.
+
+Exemplo:
+Se a palavra secreta é "python" e você tenta “programação”,
+o Word2Vec calcula que esses vetores são próximos → similaridade
+alta. Isso orienta o jogador até acertar a palavra.
+
+============================================================
+RESUMO TÉCNICO FINAL
+------------------------------------------------------------
+• Word2Vec gera vetores que representam significados.
+• A tentativa e a palavra secreta são convertidas em vetores.
+• A similaridade entre eles diz o "quão perto" o jogador está.
+• O jogo usa apenas palavras únicas e válidas do modelo.
+• O desafio só reinicia à meia-noite (não pode reiniciar antes).
+
+============================================================
+"""
+
+# 📚 Palavras secretas: lidas de base_palavras/palavras_secretas.txt (ver listas_palavras.py)
+lista_secretas = listas_palavras.ListaSecretas.carregar()
+
+# ⏳ Estado carregado no aquecimento (inicializar), não no import
+word2vec = None
+vetores_jogo = None
+mapa_validade = None    # 🧮 Validade do vocabulário (calculada offline e lida do disco)
+vetores_subpalavras = None  # 🧩 N-gramas de caracteres para palavras fora do vocabulário
+indice_sem_acento = None    # 🔡 Forma sem acento -> id no vocabulário (uma consulta por tentativa)
+armazem_puzzles = None  # 🗄️ Puzzles pré-calculados (um arquivo por data)
+inicializado = False
+trava_inicializacao = threading.Lock()
+
+def inicializar(dicionarios=True):
+    """
+    Carrega modelo, mapa de validade (e o de lemas, se gerado offline) e armazém de puzzles (uma única vez).
+    dicionarios=False pula a tabela de aceitação (processos que só leem dados
+    pré-calculados). Em nenhum dos casos wordfreq/spellchecker/hunspell são
+    carregados aqui: só na primeira palavra que precisar deles.
+    """
+    global word2vec, vetores_jogo, mapa_validade, vetores_subpalavras, indice_sem_acento, lista_secretas
+    global armazem_puzzles, inicializado
+
+    with trava_inicializacao:
+        if inicializado:
+            return
+
+        with medicao.fase("modelo"):
+            word2vec = model_loader.carregar_modelo()
+            vetores_jogo = model_loader.vetores_jogo
+
+        if dicionarios:
+            with medicao.fase("dicionarios"):
+                vocabulario = word2vec.index_to_key if word2vec is not None else ()
+                # Tudo o que passa por palavra_existe está na tabela: os dicionários
+                # ao vivo só são importados se uma consulta cair fora dela
+                dicionario.instalar_tabela_aceitacao(aceitacao.obter_tabela_aceitacao(vocabulario))
+
+        input_filter.carregar_filtro_palavras()
+
+        if word2vec is not None:
+            with medicao.fase("sem_acento"):
+                indice_sem_acento = sem_acento.obter_indice_sem_acento(
+                    word2vec.index_to_key, word2vec.key_to_index, model_loader.chave_modelo_compilado()
+                )
+            with medicao.fase("mapa_validade"):
+                mapa_validade = validade.obter_mapa_validade(word2vec.index_to_key, word2vec.key_to_index)
+            with medicao.fase("mapa_lemas"):
+                # Só abre o mapa gerado offline (python -m routes.mapa_lemas); nenhuma rota depende dele
+                input_filter.instalar_mapa_lemas(mapa_lemas.obter_mapa_lemas(word2vec.index_to_key, construir=False))
+            with medicao.fase("subpalavras"):
+                # Só abre a matriz gerada offline (python -m routes.subpalavras); sem ela,
+                # palavras fora do vocabulário recebem o vetor derivado do crc
+                vetores_subpalavras = subpalavras.obter_vetores_subpalavras(
+                    word2vec.index_to_key, word2vec.vectors, model_loader.chave_modelo_compilado(), construir=False
+                )
+            with medicao.fase("lista_secretas"):
+                lista_secretas = ler_lista_secretas()
+                if not lista_secretas.candidatas:
+                    print(f"❌ Nenhuma palavra secreta está no modelo ({listas_palavras.CAMINHO_SECRETAS})")
+            armazem_puzzles = ArmazemPuzzles(artefatos.caminho_artefato("puzzles", chave_puzzles()))
+
+        inicializado = True
+
+# 🚫 Palavras recusadas recentemente (digitação errada, robôs), limitado em LRU
+MAX_RECUSADAS = int(os.environ.get("CONTEXTO_CACHE_RECUSADAS", 10000))
+palavras_recusadas = cache_lru.novo_cache("palavras_recusadas", MAX_RECUSADAS)
+
+# 🧩 Vetores já compostos para palavras fora do vocabulário
+MAX_VETORES_OOV = int(os.environ.get("CONTEXTO_CACHE_OOV", 5000))
+
+def validar_palavra(palavra):
+    """
+    Valida a palavra: filtro de Bloom (recusa lixo sem consultar nada),
+    mapa de validade pré-computado, cache de recusas e, por último, os dicionários
+    """
+    if not input_filter.pode_existir(palavra):
+        return False
+
+    if mapa_validade is not None:
+        resultado = mapa_validade.consultar(palavra)
+        if resultado is not None:
+            return resultado
+
+    if palavras_recusadas.obter(palavra) is True:
+        return False
+
+    # Fora do vocabulário: consulta os dicionários ao vivo
+    resultado = dicionario.validar_palavra(palavra)
+    if resultado == False:
+        palavras_recusadas.guardar(palavra, True)
+    return resultado
+
+def normalizar_texto(texto):
+    """Remove acentos e normaliza o texto para comparação"""
+    return sem_acento.dobrar(texto)
+
+def id_no_vocabulario(palavra):
+    """
+    Id da palavra no vocabulário do modelo (a forma digitada ou, se ela não
+    existir, a forma sem acento), ou -1 se nenhuma das duas existir
+    """
+    palavra = palavra.lower().strip()
+    if indice_sem_acento is not None:
+        return indice_sem_acento.id_de(palavra)
+
+    if word2vec is None:
+        return -1
+    indice = word2vec.key_to_index.get(palavra)
+    return indice if indice is not None else word2vec.key_to_index.get(normalizar_texto(palavra), -1)
+
+def obter_vetor_word2vec(palavra):
+    """Obtém o vetor de uma palavra usando Word2Vec"""
+    if word2vec is None:
+        # Retorna vetor aleatório se modelo não carregou
+        vetor = np.random.randn(300)
+        return vetor / np.linalg.norm(vetor)
+    
+    # Forma digitada ou sem acento: uma consulta no índice sem acento
+    indice = id_no_vocabulario(palavra)
+    if indice >= 0:
+        return word2vec.vectors[indice]
+    
+    # Se não encontrar no modelo, compõe o vetor pelos n-gramas de caracteres
+    return vetor_fora_do_vocabulario(palavra.lower().strip())
+
+@cache_lru.memorizar("vetores_oov", MAX_VETORES_OOV)
+def vetor_fora_do_vocabulario(palavra):
+    """
+    Vetor de uma palavra fora do modelo (fastText: soma dos vetores dos
+    n-gramas). Memorizado por palavra: a mesma tentativa tem sempre a mesma nota.
+    """
+    vetor = vetores_subpalavras.vetor(palavra) if vetores_subpalavras is not None else None
+
+    if vetor is None:
+        # Sem n-gramas conhecidos: vetor aleatório, mas fixo para a palavra
+        print(f"⚠️ Palavra '{palavra}' sem n-gramas conhecidos no modelo")
+        gerador = np.random.default_rng(zlib.crc32(palavra.encode("utf-8")))
+        vetor = gerador.standard_normal(word2vec.vector_size).astype(np.float32)
+        vetor /= np.linalg.norm(vetor)
+
+    vetor.setflags(write=False)  # Compartilhado pelo cache
+    return vetor
+
+def preparar_consulta(vetor):
+    """
+    Vetor de norma 1 no espaço usado na similaridade (projetado, com PCA).
+    A secreta é preparada uma vez, ao montar o puzzle.
+    """
+    if hasattr(vetores_jogo, "preparar_consulta"):
+        vetor = vetores_jogo.preparar_consulta(vetor)
+        norma = np.linalg.norm(vetor)
+        return vetor / norma if norma else vetor
+
+    # Vetores do modelo, dos n-gramas e aleatórios já têm norma 1
+    return np.asarray(vetor, dtype=np.float32)
+
+def consulta_da_palavra(palavra):
+    """Vetor de consulta de uma tentativa que não está no ranking (sem cópia nos vetores float32)"""
+    return preparar_consulta(obter_vetor_word2vec(palavra))
+
+def calcular_similaridade_cosseno(consulta1, consulta2, max_sim):
+    """Cosseno entre dois vetores de consulta (norma 1): um produto escalar"""
+    return converter_para_porcentagem(float(np.dot(consulta1, consulta2)), max_sim)
+
+def calcular_similaridades_lote(consultas, consulta_secreta, max_sim):
+    """Porcentagens de várias consultas (matriz n x D) com um único produto matriz-vetor"""
+    similaridades = np.asarray(consultas, dtype=np.float32) @ consulta_secreta
+    return [converter_para_porcentagem(s, max_sim) for s in similaridades.tolist()]
+
+def converter_para_porcentagem(similaridade, max_sim):
+    """Normaliza pela maior similaridade do dia e converte para porcentagem (0 a 100)"""
+    if not max_sim:
+        max_sim = 1.0
+    similaridade = (similaridade / max_sim)
+    # Converte para porcentagem e limita entre 0 e 100
+    similaridade_pct = max(0, min(100, similaridade * 100))
+    
+    return round(float(similaridade_pct), 2)
+
+def filtrar_palavras_no_modelo():
+    """Palavras ÚNICAS que existem no modelo Word2Vec (calculadas na carga da lista)"""
+    return list(lista_secretas.candidatas)
+
+def ler_lista_secretas():
+    """Lê as palavras secretas e calcula as candidatas (sem espaço e no modelo)"""
+    no_modelo = (lambda p: id_no_vocabulario(p) >= 0) if word2vec is not None else None
+    return listas_palavras.ListaSecretas.carregar(listas_palavras.CAMINHO_SECRETAS, no_modelo)
+
+def caminhos_listas():
+    """Arquivos vigiados para a recarga a quente"""
+    return [input_filter.CAMINHO_ARQUIVO, input_filter.CAMINHO_TECH, listas_palavras.CAMINHO_SECRETAS]
+
+def recarregar_listas():
+    """
+    Relê as listas de palavras sem reiniciar o processo. Tudo o que sai
+    delas (índice, filtro, tabela de aceitação, mapa de validade com a
+    máscara do ranking, mapa de lemas e palavras secretas) é montado ao
+    lado e trocado no fim (atribuições por referência): requisições em
+    andamento terminam com as listas antigas. Os puzzles já salvos não
+    mudam (chave_puzzles não depende das listas); as listas novas valem
+    para as datas ainda não calculadas.
+    """
+    global lista_secretas, mapa_validade
+
+    # Um worker por vez: o primeiro calcula os artefatos novos, os outros os leem do disco
+    with artefatos.travar("recarga_listas"):
+        nova_lista = ler_lista_secretas()
+        if not nova_lista.candidatas:
+            raise ValueError(f"nenhuma palavra secreta em {listas_palavras.CAMINHO_SECRETAS}")
+
+        indice, tecnologia, filtro = input_filter.ler_tabelas()
+        existe = input_filter.existe_em(indice, tecnologia)
+        vocabulario = word2vec.index_to_key if word2vec is not None else ()
+
+        # Só se o processo usa a tabela (inicializar(dicionarios=True))
+        tabela = dicionario.TABELA_ACEITACAO
+        if tabela is not None:
+            tabela = aceitacao.obter_tabela_aceitacao(vocabulario, indice, tecnologia)
+
+        novo_mapa_validade, novo_mapa_lemas = mapa_validade, None
+        if word2vec is not None:
+            novo_mapa_validade = validade.obter_mapa_validade(
+                vocabulario, word2vec.key_to_index,
+                validar_lote=lambda palavras: dicionario.validar_lote(palavras, existe, tabela),
+            )
+            novo_mapa_lemas = mapa_lemas.obter_mapa_lemas(vocabulario, construir=False)
+
+    # Troca; instalar_tabelas vem por último porque limpa os caches (recusadas inclusive)
+    dicionario.instalar_tabela_aceitacao(tabela)
+    mapa_validade = novo_mapa_validade
+    lista_secretas = nova_lista
+    input_filter.instalar_tabelas(indice, tecnologia, filtro, novo_mapa_lemas)
+
+def obter_palavra_do_dia(hoje=None):
+    """Gera a palavra do dia baseada na data (por padrão, a data atual)"""
+    # Obtém a data de hoje
+    if hoje is None:
+        hoje = datetime.now().date()
+    
+    # Cria um seed determinístico baseado na data
+    seed_str = f"{hoje.year}-{hoje.month:02d}-{hoje.day:02d}"
+    seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
+    
+    # Usa o seed para escolher a palavra (lista lida uma vez: a recarga troca a referência)
+    palavras_validas = lista_secretas.candidatas
+    if not palavras_validas:
+        raise ValueError(f"nenhuma palavra secreta no modelo em {listas_palavras.CAMINHO_SECRETAS}")
+    indice = seed_hash % len(palavras_validas)
+    
+    return palavras_validas[indice], hoje
+
+
+# 🗄️ Puzzles pré-calculados (um arquivo por data)
+def chave_puzzles():
+    """
+    Muda só se o modelo ou a compressão mudarem. Não depende das listas de
+    palavras: uma recarga mantém os puzzles já salvos (publicados ou
+    pré-calculados) e as listas novas valem para as datas ainda não salvas.
+    """
+    return artefatos.calcular_hash(textos=[
+        model_loader.chave_modelo_compilado(),
+        model_loader.MODO_COMPRESSAO,
+        indice_sem_acento.chave if indice_sem_acento else "",
+    ])
+
+
+def carregar_puzzle_salvo(data):
+    """Puzzle da data lido do disco (None se não foi pré-calculado)"""
+    if armazem_puzzles is None:
+        return None
+    return armazem_puzzles.carregar(data, word2vec.key_to_index, word2vec.vectors, preparar_consulta)
+
+def construir_puzzle(data, refazer=False):
+    """Puzzle de uma data: lê do disco se já existir, senão calcula e salva"""
+    if data is None:
+        data = datetime.now().date()
+
+    with medicao.fase("puzzle.ler_disco"):
+        puzzle = None if refazer else carregar_puzzle_salvo(data)
+    if puzzle is not None:
+        print(f"🗄️ Puzzle de {data} carregado do disco: {puzzle.palavra_secreta}")
+        return puzzle
+
+    with medicao.fase("puzzle.ranking"):
+        puzzle = calcular_puzzle(data)
+    if armazem_puzzles is not None and puzzle.indice_ranking is not None:
+        try:
+            with medicao.fase("puzzle.salvar_disco"):
+                armazem_puzzles.salvar(puzzle)
+        except OSError as e:
+            print(f"⚠️ Não foi possível salvar o puzzle de {data}: {e}")
+    return puzzle
+
+def calcular_puzzle(data):
+    """Calcula o puzzle (palavra secreta + ranking) de uma data"""
+    palavra_secreta, data = obter_palavra_do_dia(data)
+    print(f"🎮 Palavra do dia: {palavra_secreta} (Data: {data})")
+
+    if word2vec is None:
+        vetor_secreto = obter_vetor_word2vec(palavra_secreta)
+        return PuzzleDoDia(palavra_secreta, data, vetor_secreto=vetor_secreto,
+                           consulta_secreta=preparar_consulta(vetor_secreto))
+
+    # Id da palavra secreta no vocabulário (forma original ou sem acento)
+    indice_secreto = id_no_vocabulario(palavra_secreta)
+    if indice_secreto < 0:
+        raise ValueError(f"palavra secreta fora do modelo: {palavra_secreta!r}")
+
+    # Ranking do dia: um produto matriz-vetor + máscara de palavras válidas.
+    # A palavra secreta ocupa a posição 1.
+    indice_ranking, similaridades, ordem = ranking.construir_ranking(
+        vetores_jogo, indice_secreto, mapa_validade.mascara,
+        word2vec.key_to_index, topn=720000
+    )
+
+    max_sim = float(similaridades[ordem[0]]) if len(ordem) > 0 else None
+
+    print(f"🏁 Ranking de {data}: {len(indice_ranking)} palavras ({indice_ranking.memoria_bytes() / 1e6:.1f} MB)")
+
+    return PuzzleDoDia(
+        palavra_secreta, data,
+        indice_secreto=indice_secreto,
+        vetor_secreto=word2vec.vectors[indice_secreto],
+        consulta_secreta=preparar_consulta(word2vec.vectors[indice_secreto]),
+        indice_ranking=indice_ranking,
+        ordem=ordem,
+        max_sim=max_sim,
+    )
+
+def pontuar_tentativa(puzzle, tentativa):
+    """
+    Compara uma tentativa (já validada) com o puzzle.
+    Retorna (posição ou None, similaridade em %, venceu).
+    """
+    posicao = None
+    indice_ranking = puzzle.indice_ranking
+    consulta = indice_ranking.consultar_id(id_no_vocabulario(tentativa)) if indice_ranking else None
+
+    if consulta is not None:
+        posicao, similaridade = consulta
+        similaridade = converter_para_porcentagem(similaridade, puzzle.max_sim)
+    else:
+        # Palavra fora do ranking: calcula a similaridade diretamente
+        similaridade = calcular_similaridade_cosseno(consulta_da_palavra(tentativa), puzzle.consulta_secreta, puzzle.max_sim)
+
+    # Verifica vitória
+    venceu = normalizar_texto(tentativa) == puzzle.secreta_sem_acento
+    if venceu:
+        posicao = 1
+
+    return posicao, similaridade, venceu
+
+def validar_palavras(palavras):
+    """
+    validar_palavra para várias palavras: {palavra: forma aceita ou False}.
+    Filtro de Bloom, mapa de validade e cache de recusas por palavra distinta;
+    as que sobram vão juntas para dicionario.validar_lote (filtro de entrada em
+    lote e cada forma consultada uma vez nos dicionários).
+    """
+    resultados = {}
+    pendentes = []
+    for palavra in dict.fromkeys(palavras):
+        resultado = None
+        if not input_filter.pode_existir(palavra):
+            resultado = False
+        elif mapa_validade is not None:
+            resultado = mapa_validade.consultar(palavra)
+        if resultado is None and palavras_recusadas.obter(palavra) is True:
+            resultado = False
+
+        if resultado is None:
+            pendentes.append(palavra)
+        else:
+            resultados[palavra] = resultado
+
+    for palavra, resultado in zip(pendentes, dicionario.validar_lote(pendentes)):
+        if resultado == False:
+            palavras_recusadas.guardar(palavra, True)
+        resultados[palavra] = resultado
+
+    return resultados
+
+def pontuar_tentativas(puzzle, tentativas):
+    """
+    pontuar_tentativa para várias tentativas (já validadas), na ordem recebida:
+    o ranking é consultado em arrays e as palavras fora dele são pontuadas
+    juntas, com um único produto matriz-vetor.
+    """
+    posicoes = [None] * len(tentativas)
+    similaridades = [None] * len(tentativas)
+    fora = list(range(len(tentativas)))
+
+    indice_ranking = puzzle.indice_ranking
+    if indice_ranking:
+        # Forma recebida ou sem acento, já resolvida para o id no vocabulário
+        ids = np.fromiter((id_no_vocabulario(t) for t in tentativas), dtype=np.int64, count=len(tentativas))
+        pos, sims = indice_ranking.consultar_ids(ids)
+        fora = []
+        for i, (posicao, similaridade) in enumerate(zip(pos.tolist(), sims.tolist())):
+            if posicao == indice_ranking.SEM_POSICAO:
+                fora.append(i)
+            else:
+                posicoes[i] = posicao
+                similaridades[i] = converter_para_porcentagem(similaridade, puzzle.max_sim)
+
+    if fora:
+        consultas = np.stack([consulta_da_palavra(tentativas[i]) for i in fora])
+        for i, similaridade in zip(fora, calcular_similaridades_lote(consultas, puzzle.consulta_secreta, puzzle.max_sim)):
+            similaridades[i] = similaridade
+
+    resultados = []
+    for tentativa, posicao, similaridade in zip(tentativas, posicoes, similaridades):
+        venceu = normalizar_texto(tentativa) == puzzle.secreta_sem_acento
+        resultados.append((1 if venceu else posicao, similaridade, venceu))
+    return resultados
+
+def gravar_saida(puzzle):
+    """Grava o ranking do puzzle publicado em saida.txt (fora da requisição)"""
+    if puzzle.indice_ranking is None:
+        return
+
+    for i in puzzle.ordem[:100].tolist():
+        print(f'{puzzle.indice_ranking.similaridades[i]} - {word2vec.index_to_key[i]}')
+
+    with medicao.fase("saida_txt"):
+        ranking.salvar_ranking(
+            "saida.txt", word2vec.index_to_key, puzzle.indice_ranking.similaridades,
+            puzzle.ordem, puzzle.max_sim
+        )
+
@@ -0,0 +1,141 @@
+import os
+import threading
+
+
+
+# CONFIGURAÇÃO (pode ser trocada por variáveis de ambiente)
+DIRETORIO_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+CAMINHO_SECRETAS = os.environ.get(
+    "CONTEXTO_PALAVRAS_SECRETAS",
+    os.path.normpath(os.path.join(DIRETORIO_SCRIPT, "..", "base_palavras", "palavras_secretas.txt"))
+)
+
+# Segundos entre duas verificações dos arquivos de palavras (0 desliga a vigia)
+INTERVALO_VIGIA = float(os.environ.get("CONTEXTO_LISTAS_INTERVALO", 10))
+
+
+
+# LEITURA DAS LISTAS (uma palavra por linha, '#' comenta)
+def ler_lista(caminho):
+    """Palavras do arquivo na ordem em que aparecem, sem repetidas (sem diferenciar maiúsculas)"""
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            linhas = [linha.strip() for linha in f]
+    except FileNotFoundError:
+        print(f"❌ Lista de palavras não encontrada: {caminho}")
+        return []
+
+    palavras = {}
+    for linha in linhas:
+        if linha and not linha.startswith("#"):
+            palavras.setdefault(linha.lower(), linha)
+    return list(palavras.values())
+
+def carimbo(caminhos):
+    """(mtime, tamanho) de cada arquivo, None se ausente: muda quando algum arquivo muda"""
+    estados = []
+    for caminho in caminhos:
+        try:
+            estado = os.stat(caminho)
+            estados.append((estado.st_mtime_ns, estado.st_size))
+        except FileNotFoundError:
+            estados.append(None)
+    return tuple(estados)
+
+
+
+# LISTA DE PALAVRAS SECRETAS (substituída inteira a cada recarga, nunca alterada)
+class ListaSecretas:
+    """
+    palavras     as do arquivo, sem repetidas (cada uma com a mesma chance no sorteio)
+    candidatas   as que podem ser sorteadas: sem espaço e existentes no modelo,
+                 calculadas uma vez na carga (não a cada obter_palavra_do_dia)
+    """
+
+    def __init__(self, palavras, candidatas, carimbo=None):
+        self.palavras = tuple(palavras)
+        self.candidatas = tuple(candidatas)
+        self.carimbo = carimbo
+
+    def __len__(self):
+        return len(self.candidatas)
+
+    @classmethod
+    def carregar(cls, caminho=CAMINHO_SECRETAS, no_modelo=None):
+        """no_modelo(palavra) -> bool; sem ele (modelo não carregado) vale qualquer palavra sem espaço"""
+        estado = carimbo([caminho])
+        palavras = ler_lista(caminho)
+        simples = [p for p in palavras if " " not in p]
+
+        if no_modelo is None:
+            return cls(palavras, simples, estado)
+
+        # Sem recorrer às palavras fora do modelo: lista vazia = nada sorteável
+        candidatas = [p for p in simples if no_modelo(p)]
+        print(f"📊 {len(candidatas)} palavras únicas válidas no modelo")
+        return cls(palavras, candidatas, estado)
+
+
+
+# VIGIA DOS ARQUIVOS (recarga sem reiniciar os workers)
+class VigiaArquivos:
+    """
+    Thread que confere o carimbo dos arquivos a cada 'intervalo' segundos.
+    Quando ele muda e se repete na verificação seguinte (arquivo já escrito
+    por inteiro), chama ao_mudar() nessa mesma thread: a recarga monta tudo
+    ao lado e troca as referências no fim, então as requisições nunca esperam.
+    Se ao_mudar() falhar, as listas antigas continuam valendo.
+    """
+
+    def __init__(self, caminhos, ao_mudar, intervalo=INTERVALO_VIGIA):
+        self.caminhos = list(caminhos)
+        self.ao_mudar = ao_mudar
+        self.intervalo = intervalo
+
+        self.carimbo = carimbo(self.caminhos)
+        self._pendente = None
+        self.recargas = 0
+        self.erro = None
+
+        self._parar = threading.Event()
+        self._thread = None
+
+    def verificar(self):
+        """Uma verificação. Retorna True se recarregou"""
+        atual = carimbo(self.caminhos)
+        if atual == self.carimbo:
+            self._pendente = None
+            return False
+
+        if atual != self._pendente:
+            # Mudou agora: espera a próxima verificação para ter certeza
+            self._pendente = atual
+            return False
+
+        print("📝 Listas de palavras alteradas: recarregando...")
+        try:
+            self.ao_mudar()
+        except Exception as e:
+            self.erro = str(e)
+            print(f"❌ Erro ao recarregar as listas (as antigas continuam valendo): {e}")
+        else:
+            self.erro = None
+            self.recargas += 1
+            print("✅ Listas de palavras recarregadas")
+
+        # Com ou sem erro, só tenta de novo na próxima mudança
+        self.carimbo = atual
+        self._pendente = None
+        return self.erro is None
+
+    def iniciar(self):
+        if self._thread is None and self.intervalo > 0:
+            self._thread = threading.Thread(target=self._laco, name="vigia-listas", daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+
+    def _laco(self):
+        while not self._parar.wait(self.intervalo):
+            self.verificar()
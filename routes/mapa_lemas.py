@@ -0,0 +1,154 @@
+import os
+import sys
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+from routes import indice_palavras
+from routes import input_filter
+from routes import regras_sufixos
+
+
+
+# MAPA FORMA -> LEMA (resultado do formatar_palavra pré-computado)
+class MapaLemas:
+    """
+    formatar_palavra já aplicado a todas as formas conhecidas (lista de
+    palavras + palavras de tecnologia + vocabulário do modelo):
+
+    indice  IndicePalavras com as formas e os lemas (id = posição no índice)
+    lemas   int32: id da forma -> id do lema
+    validas bool: a forma passa em palavra_existe (senão, com inputUsuario,
+            formatar_palavra devolve False)
+
+    Os três ficam em disco e são abertos via mmap.
+    """
+
+    def __init__(self, indice, lemas, validas, chave=None):
+        self.indice = indice
+        self.lemas = lemas
+        self.validas = validas
+        self.chave = chave
+
+        self._lemas = memoryview(lemas)
+        self._validas = memoryview(validas)
+
+    def __len__(self):
+        return len(self.lemas)
+
+    def consultar(self, palavra, inputUsuario=True):
+        """
+        Mesmo retorno de formatar_palavra (lema ou False), ou None se a
+        palavra não é uma forma conhecida (precisa passar pelas regras).
+        """
+        id_forma = self.indice.id_de(palavra)
+        if id_forma < 0:
+            return None
+
+        if inputUsuario and not self._validas[id_forma]:
+            return False
+
+        return self.indice.palavra(self._lemas[id_forma])
+
+def construir_mapa(formas, processos=1):
+    """Roda o pipeline em lote sobre todas as formas (passo offline)"""
+    formas = [f for f in dict.fromkeys(formas) if f.strip()]
+    lemas, validas = input_filter.normalizar_lote(formas, inputUsuario=False, processos=processos)
+
+    # Lemas que não eram formas (ex.: 'Brasil' -> 'brasil') também viram formas,
+    # para que o índice seja fechado: o lema de um lema está no próprio mapa
+    conhecidas = set(formas)
+    novas = list(dict.fromkeys(l for l in lemas if l not in conhecidas))
+    if novas:
+        lemas_novas, validas_novas = input_filter.normalizar_lote(novas, inputUsuario=False)
+        formas += novas
+        lemas += lemas_novas
+        validas = np.concatenate([validas, validas_novas])
+
+    indice = indice_palavras.IndicePalavras.a_partir_de_palavras(formas + lemas)
+    ids_formas = np.fromiter((indice.id_de(f) for f in formas), dtype=np.int64, count=len(formas))
+    ids_lemas = np.fromiter((indice.id_de(l) for l in lemas), dtype=np.int64, count=len(lemas))
+
+    tabela_lemas = np.arange(len(indice), dtype=np.int32)
+    tabela_validas = np.zeros(len(indice), dtype=bool)
+    tabela_lemas[ids_formas] = ids_lemas
+    tabela_validas[ids_formas] = validas
+
+    return MapaLemas(indice, tabela_lemas, tabela_validas)
+
+
+
+# PERSISTÊNCIA EM DISCO
+def chave_lemas(vocabulario):
+    """Hash das listas de palavras, das regras e do vocabulário do modelo"""
+    return artefatos.calcular_hash(
+        caminhos=[
+            input_filter.CAMINHO_ARQUIVO,
+            input_filter.CAMINHO_TECH,
+            input_filter.__file__,
+            regras_sufixos.__file__,
+        ],
+        textos=["\n".join(vocabulario)],
+    )
+
+def salvar(diretorio, mapa):
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    indice_palavras.salvar(os.path.join(temporario, "formas"), mapa.indice)
+    np.save(os.path.join(temporario, "lemas.npy"), mapa.lemas)
+    np.save(os.path.join(temporario, "validas.npy"), mapa.validas)
+
+    os.replace(temporario, diretorio)
+
+def carregar(diretorio, chave=None):
+    indice = indice_palavras.carregar(os.path.join(diretorio, "formas"))
+    lemas = np.load(os.path.join(diretorio, "lemas.npy"), mmap_mode="r")
+    validas = np.load(os.path.join(diretorio, "validas.npy"), mmap_mode="r")
+    return MapaLemas(indice, lemas, validas, chave)
+
+def obter_mapa_lemas(vocabulario=(), processos=1, construir=True):
+    """
+    Carrega o mapa do disco. Se ele não existir (ou se as listas, as regras
+    ou o vocabulário mudaram), roda o pipeline em todas as formas e salva.
+    Com construir=False só abre um mapa já gerado (None se não houver):
+    o jogo não paga o passo offline na inicialização.
+    """
+    chave = chave_lemas(vocabulario)
+    diretorio = artefatos.caminho_artefato("lemas", chave)
+
+    if os.path.isdir(diretorio):
+        mapa = carregar(diretorio, chave)
+        print(f"🔤 Mapa de lemas carregado: {len(mapa)} formas")
+        return mapa
+
+    if not construir:
+        return None
+
+    print("🔤 Calculando mapa forma -> lema (passo único)...")
+    formas = [*input_filter.INDICE_PALAVRAS, *sorted(input_filter.TABELA_PALAVRAS_TECNOLOGIA), *vocabulario]
+    mapa = construir_mapa(formas, processos)
+    mapa.chave = chave
+
+    try:
+        salvar(diretorio, mapa)
+        artefatos.remover_versoes_antigas("lemas", diretorio)
+        mapa = carregar(diretorio, chave)
+        print(f"💾 Mapa de lemas salvo em {diretorio}: {len(mapa)} formas")
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar o mapa de lemas: {e}")
+
+    return mapa
+
+
+
+# PASSO OFFLINE: python -m routes.mapa_lemas
+if __name__ == "__main__":
+    from routes.model_loader import carregar_modelo
+    word2vec = carregar_modelo()
+
+    if word2vec is None:
+        print("❌ Modelo não carregado; nada a fazer.")
+        sys.exit(1)
+
+    obter_mapa_lemas(word2vec.index_to_key, processos=os.cpu_count() or 1)
@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import resource  # Só existe em sistemas Unix
+except ImportError:
+    resource = None
+
+
+
+# MEMÓRIA DO PROCESSO
+def rss_atual_mb():
+    """RSS atual (Linux: /proc/self/statm). Em outros Unix, o pico (ru_maxrss); no Windows, None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        if resource is None:
+            return None
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _arredondar(valor):
+    return round(valor, 1) if valor is not None else None
+
+
+
+# RELATÓRIO DAS FASES DE INICIALIZAÇÃO
+MAX_FASES_POSTERIORES = 100  # Fases medidas depois de concluir() (puzzles, recargas), só as últimas
+
+class RelatorioInicializacao:
+    """
+    Tempo de parede, tempo de CPU e variação de RSS de cada fase da
+    inicialização (carregamento do modelo, dicionários, puzzle do dia...).
+
+    O tempo de CPU é do processo inteiro (inclui as threads do BLAS) e a
+    variação de RSS de arquivos abertos via mmap só aparece quando as
+    páginas são tocadas.
+
+    Depois de concluir(), as fases (puzzle de um novo dia, recarga das
+    listas...) não entram mais no relatório da inicialização: vão para
+    'posteriores', limitado às MAX_FASES_POSTERIORES mais recentes.
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.fases = []
+        self.posteriores = deque(maxlen=MAX_FASES_POSTERIORES)
+        self.concluido_em = None
+        self.trava = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def fase(self, nome):
+        """Mede o bloco 'with'. Fases dentro de fases ficam com o nível indicado"""
+        nivel = getattr(self._local, "nivel", 0)
+        self._local.nivel = nivel + 1
+
+        parede = time.perf_counter()
+        cpu = time.process_time()
+        rss = rss_atual_mb()
+        erro = None
+        try:
+            yield
+        except BaseException as e:
+            erro = type(e).__name__
+            raise
+        finally:
+            self._local.nivel = nivel
+            registro = {
+                "fase": nome,
+                "nivel": nivel,
+                "inicio_s": round(parede - self.inicio, 3),
+                "parede_s": round(time.perf_counter() - parede, 3),
+                "cpu_s": round(time.process_time() - cpu, 3),
+                "rss_delta_mb": _arredondar(rss_atual_mb() - rss) if rss is not None else None,
+            }
+            if erro:
+                registro["erro"] = erro
+            with self.trava:
+                (self.fases if self.concluido_em is None else self.posteriores).append(registro)
+
+    def concluir(self):
+        """Marca o fim da inicialização e imprime o relatório em uma linha (JSON)"""
+        self.concluido_em = time.perf_counter()
+        print(f"📊 Inicialização: {json.dumps(self.registro(), ensure_ascii=False)}")
+
+    def registro(self):
+        with self.trava:
+            fases = sorted(self.fases, key=lambda f: (f["inicio_s"], f["nivel"]))
+            posteriores = sorted(self.posteriores, key=lambda f: (f["inicio_s"], f["nivel"]))
+
+        return {
+            "pid": os.getpid(),
+            "concluida": self.concluido_em is not None,
+            "total_s": round((self.concluido_em or time.perf_counter()) - self.inicio, 3),
+            "rss_mb": _arredondar(rss_atual_mb()),
+            "fases": fases,
+            "fases_posteriores": posteriores,
+        }
+
+# Um relatório por processo (começa a contar no primeiro import do pacote)
+relatorio = RelatorioInicializacao()
+
+def fase(nome):
+    return relatorio.fase(nome)
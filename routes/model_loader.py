@@ -1,45 +1,155 @@
+import os
 import re
-from spacy.lang.pt.stop_words import STOP_WORDS 
-from huggingface_hub import hf_hub_download
-from safetensors.numpy import load_file
-from gensim.models import KeyedVectors
+import inspect
+import threading
+from functools import lru_cache
+import numpy as np
 
-print("📚 Iniciando carregamento inteligente (Smart Load)...")
+# Arquivos auxiliares
+from routes import artefatos
+from routes import compressao
+from routes import medicao
+
+REPO_MODELO = "nilc-nlp/fasttext-skip-gram-300d"
+DIMENSOES = 300
+TAMANHO_BLOCO = 65536  # Linhas da matriz original lidas por vez
+
+# Compressão opcional dos vetores usados na similaridade: float16, int8 ou pcaN
+MODO_COMPRESSAO = os.environ.get("CONTEXTO_COMPRESSAO", "")
+
+# Bibliotecas pesadas são importadas só no caminho que as usa:
+# spaCy/HF/safetensors apenas ao compilar o modelo, gensim ao montar o KeyedVectors
+@lru_cache(maxsize=None)
+def stop_words():
+    from spacy.lang.pt.stop_words import STOP_WORDS
+    return STOP_WORDS
 
 # Filtra palavras inúteis do vocabulário
 def palavra_eh_valida(palavra):
     """Retorna True se a palavra for útil para o jogo."""
-    
+
     # Tamanho mínimo
     if len(palavra) < 2: return False
 
     # Sem espaços ou underscores
     if ' ' in palavra or '_' in palavra: return False
-    
+
     # Preposições e artigos comuns
-    if palavra in STOP_WORDS: return False
+    if palavra in stop_words(): return False
 
     # Caracteres inválidos (apenas letras minúsculas e acentuadas)
     if re.search(r'[^a-zááàâãéèêíïóôõöúçñ]', palavra): return False
-    
+
     return True
 
-# Carregamento e processamento
-word2vec = None
 
-try:
+
+# MODELO COMPILADO (vocabulário filtrado + matriz normalizada em disco)
+def chave_modelo_compilado():
+    """
+    Chave do modelo compilado: muda se o repositório do modelo, o filtro do
+    vocabulário ou a lista de stop words (versão do spaCy) mudarem.
+    Não acessa a rede nem importa nada pesado.
+    """
+    return artefatos.calcular_hash(textos=[
+        REPO_MODELO,
+        inspect.getsource(palavra_eh_valida),
+        artefatos.versao_pacote("spacy"),
+    ])
+
+def caminho_modelo_compilado():
+    return artefatos.caminho_artefato("modelo", chave_modelo_compilado())
+
+def salvar_modelo_compilado(diretorio, palavras, vetores):
+    """Grava vocab.txt + vetores.npy (float32 contíguo) de forma atômica"""
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    with open(os.path.join(temporario, "vocab.txt"), "w", encoding="utf-8") as f:
+        f.write("\n".join(palavras))
+    np.save(os.path.join(temporario, "vetores.npy"), np.ascontiguousarray(vetores, dtype=np.float32))
+
+    os.replace(temporario, diretorio)
+    artefatos.remover_versoes_antigas("modelo", diretorio)
+
+def carregar_modelo_compilado(diretorio):
+    """
+    Abre o modelo compilado sem copiar a matriz: np.load com mmap_mode='r'
+    (as páginas vêm do page cache e são compartilhadas entre processos).
+    """
+    with open(os.path.join(diretorio, "vocab.txt"), "r", encoding="utf-8") as f:
+        palavras = f.read().split("\n")
+
+    vetores = np.load(os.path.join(diretorio, "vetores.npy"), mmap_mode="r")
+    return palavras, vetores
+
+def montar_keyed_vectors(palavras, vetores):
+    """
+    Cria o KeyedVectors apontando para a matriz recebida (sem add_vectors,
+    que copiaria tudo). Os vetores já devem estar normalizados (norma 1).
+    """
+    from gensim.models import KeyedVectors
+
+    modelo = KeyedVectors(vector_size=vetores.shape[1], count=0, dtype=vetores.dtype)
+    modelo.index_to_key = palavras
+    modelo.key_to_index = {palavra: i for i, palavra in enumerate(palavras)}
+    modelo.vectors = vetores
+    modelo.norms = np.ones(len(palavras), dtype=vetores.dtype)
+    return modelo
+
+
+
+# CARREGAMENTO A PARTIR DO HUGGING FACE (primeira execução)
+def ler_linhas_selecionadas(emb_path, indices):
+    """
+    Lê do safetensors APENAS as linhas em 'indices' (ordenados), em blocos de
+    TAMANHO_BLOCO linhas, e já normaliza cada vetor (norma 1).
+    A matriz completa nunca fica inteira na memória: o pico é a matriz
+    filtrada + um bloco.
+    """
+    from safetensors import safe_open
+
+    indices = np.asarray(indices, dtype=np.int64)
+
+    with safe_open(emb_path, framework="np") as f:
+        tensor = f.get_slice("embeddings")
+        total, dimensoes = tensor.get_shape()
+        vetores = np.empty((len(indices), dimensoes), dtype=np.float32)
+
+        for inicio in range(0, total, TAMANHO_BLOCO):
+            fim = min(inicio + TAMANHO_BLOCO, total)
+            a, b = np.searchsorted(indices, [inicio, fim])
+            if a == b:
+                continue
+
+            # Lê só até a última linha necessária do bloco
+            bloco = tensor[inicio:int(indices[b - 1]) + 1]
+            destino = vetores[a:b]
+            destino[:] = bloco[indices[a:b] - inicio]
+
+            normas = np.linalg.norm(destino, axis=1, keepdims=True)
+            normas[normas == 0] = 1
+            destino /= normas
+
+    return vetores
+
+def carregar_modelo_original():
+    """Baixa (ou usa o cache do HF), filtra o vocabulário e lê só as linhas aprovadas"""
+    from huggingface_hub import hf_hub_download
+
     # Verifica se os arquivos do modelo estão no cache ou faz o download
-    emb_path = hf_hub_download(repo_id="nilc-nlp/fasttext-skip-gram-300d", filename="embeddings.safetensors")
-    vocab_path = hf_hub_download(repo_id="nilc-nlp/fasttext-skip-gram-300d", filename="vocab.txt")
+    with medicao.fase("modelo.download"):
+        emb_path = hf_hub_download(repo_id=REPO_MODELO, filename="embeddings.safetensors")
+        vocab_path = hf_hub_download(repo_id=REPO_MODELO, filename="vocab.txt")
 
     indices_validos = []
     palavras_validas = []
-    
+
     # Abre APENAS o vocabulário para leitura (sem criar arquivo de log)
-    with open(vocab_path, "r", encoding="utf-8") as f_entrada:
+    with medicao.fase("modelo.filtro_vocabulario"), open(vocab_path, "r", encoding="utf-8") as f_entrada:
         for i, line in enumerate(f_entrada):
             palavra = line.strip()
-            
+
             # Verifica se a palavra serve para o jogo
             if palavra_eh_valida(palavra):
                 palavras_validas.append(palavra)
@@ -47,19 +157,75 @@ try:
 
     print(f"✅ Filtro concluído! {len(palavras_validas)} palavras aprovadas.")
 
-    # Carrega a matriz gigante de números
-    dados_completos = load_file(emb_path)
-    matriz_inteira = dados_completos["embeddings"]
-    
-    # Pega APENAS as linhas que correspondem às palavras aprovadas
-    vetores_filtrados = matriz_inteira[indices_validos]
+    # Pega APENAS as linhas que correspondem às palavras aprovadas (já normalizadas)
+    with medicao.fase("modelo.leitura_linhas"):
+        vetores_filtrados = ler_linhas_selecionadas(emb_path, indices_validos)
+
+    # Cria o objeto final limpo, sem copiar a matriz de novo
+    with medicao.fase("modelo.keyed_vectors"):
+        return montar_keyed_vectors(palavras_validas, vetores_filtrados)
+
+
+
+# Carregamento e processamento (chamado no aquecimento, não no import)
+word2vec = None
+vetores_jogo = None  # Matriz usada no ranking e na similaridade (float32 ou comprimida)
+carregado = False
+trava_carregamento = threading.Lock()
+
+def carregar_modelo():
+    """
+    Carrega o modelo uma única vez e preenche word2vec / vetores_jogo.
+    Chamadas seguintes (ou concorrentes) só esperam a primeira terminar.
+    """
+    global word2vec, vetores_jogo, carregado
+
+    with trava_carregamento:
+        if carregado:
+            return word2vec
+
+        print("📚 Iniciando carregamento inteligente (Smart Load)...")
+        try:
+            diretorio_compilado = caminho_modelo_compilado()
+
+            if os.path.isdir(diretorio_compilado):
+                # Caminho rápido: nada de rede, filtro ou cópia da matriz
+                with medicao.fase("modelo.abrir_compilado"):
+                    palavras, vetores = carregar_modelo_compilado(diretorio_compilado)
+                with medicao.fase("modelo.keyed_vectors"):
+                    word2vec = montar_keyed_vectors(palavras, vetores)
+                print(f"⚡ Modelo compilado aberto via mmap: {len(palavras)} palavras.")
+            else:
+                word2vec = carregar_modelo_original()
+
+                # Compila para as próximas inicializações e já passa a usar a
+                # cópia em disco (mmap): páginas compartilhadas entre processos
+                try:
+                    with medicao.fase("modelo.salvar_compilado"):
+                        salvar_modelo_compilado(diretorio_compilado, word2vec.index_to_key, word2vec.vectors)
+                        print(f"💾 Modelo compilado salvo em {diretorio_compilado}")
+                        palavras, vetores = carregar_modelo_compilado(diretorio_compilado)
+                        word2vec = montar_keyed_vectors(palavras, vetores)
+                except OSError as e:
+                    print(f"⚠️ Não foi possível salvar o modelo compilado: {e}")
+
+            print("✅ Modelo Word2Vec carregado e filtrado com sucesso!")
+
+            try:
+                with medicao.fase("modelo.compressao"):
+                    vetores_jogo = compressao.obter_vetores_comprimidos(
+                        word2vec.vectors, MODO_COMPRESSAO, chave_modelo_compilado()
+                    )
+            except ValueError as e:
+                print(f"⚠️ {e}. Usando vetores float32.")
 
-    # Cria o objeto final limpo
-    word2vec = KeyedVectors(vector_size=300)
-    word2vec.add_vectors(palavras_validas, vetores_filtrados)
+            if vetores_jogo is None:
+                vetores_jogo = word2vec.vectors
 
-    print("✅ Modelo Word2Vec carregado e filtrado com sucesso!")
+        except Exception as e:
+            print(f"❌ Erro crítico: {e}")
+            word2vec = None
+            vetores_jogo = None
 
-except Exception as e:
-    print(f"❌ Erro crítico: {e}")
-    word2vec = None
\ No newline at end of file
+        carregado = True
+        return word2vec
@@ -0,0 +1,83 @@
+"""
+Pré-calcula os puzzles de um intervalo de datas e grava no armazém em disco.
+
+Uso (a partir da raiz do projeto):
+    python -m routes.precomputar                                  # hoje + 30 dias
+    python -m routes.precomputar --inicio 2025-01-01 --fim 2025-12-31 --processos 4
+    python -m routes.precomputar --dias 7 --refazer
+
+Os puzzles salvos não mudam quando as listas de palavras mudam; para aplicar
+listas novas a datas já pré-calculadas, use --refazer com --inicio no dia seguinte.
+
+Os processos filhos são criados por fork depois que o modelo já foi carregado,
+então compartilham a mesma matriz (copy-on-write / mmap) em vez de recarregá-la.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# Arquivos auxiliares
+from routes import jogo
+
+
+def precomputar_data(argumentos):
+    """Executado em cada processo: calcula (ou pula) uma data"""
+    data, refazer = argumentos
+    inicio = time.perf_counter()
+
+    if not refazer and jogo.armazem_puzzles.existe(data):
+        return data, None, 0.0, "já existia"
+
+    puzzle = jogo.construir_puzzle(data, refazer=refazer)
+    return data, puzzle.palavra_secreta, time.perf_counter() - inicio, "calculado"
+
+
+def intervalo_de_datas(inicio, fim):
+    datas = []
+    atual = inicio
+    while atual <= fim:
+        datas.append(atual)
+        atual += timedelta(days=1)
+    return datas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inicio", type=date.fromisoformat, default=None, help="primeira data (AAAA-MM-DD), padrão: hoje")
+    parser.add_argument("--fim", type=date.fromisoformat, default=None, help="última data (AAAA-MM-DD)")
+    parser.add_argument("--dias", type=int, default=30, help="dias a partir do início, se --fim não for informado")
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--refazer", action="store_true", help="recalcula mesmo as datas já salvas")
+    args = parser.parse_args()
+
+    jogo.inicializar(dicionarios=False)
+    if jogo.armazem_puzzles is None:
+        print("❌ Modelo não carregado; nada a fazer.")
+        sys.exit(1)
+
+    inicio = args.inicio or datetime.now().date()
+    fim = args.fim or inicio + timedelta(days=args.dias)
+    datas = intervalo_de_datas(inicio, fim)
+
+    print(f"🗓️ {len(datas)} datas ({inicio} a {fim}) em {args.processos} processo(s)")
+    print(f"🗄️ Destino: {jogo.armazem_puzzles.diretorio}")
+
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+
+    tarefas = [(data, args.refazer) for data in datas]
+    inicio_total = time.perf_counter()
+
+    with contexto.Pool(processes=max(1, args.processos)) as pool:
+        for data, palavra, tempo, status in pool.imap_unordered(precomputar_data, tarefas):
+            detalhe = f"{palavra} ({tempo:.2f}s)" if palavra else ""
+            print(f"  {data} | {status:<10} | {detalhe}")
+
+    print(f"✅ Concluído em {time.perf_counter() - inicio_total:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import os
+from datetime import date
+import numpy as np
+
+# Arquivos auxiliares
+from routes.ranking import IndiceRanking
+from routes import sem_acento
+
+
+
+# PUZZLE DE UM DIA
+class PuzzleDoDia:
+    """
+    Tudo o que o jogo precisa para uma data: palavra secreta, vetor, ranking
+    e a constante de normalização (max_sim = similaridade da palavra mais
+    próxima aceita).
+
+    consulta_secreta é o vetor secreto já no espaço da similaridade e com
+    norma 1 (jogo.preparar_consulta): pontuar uma palavra fora do ranking
+    é um produto escalar com ele. secreta_sem_acento é a forma comparada
+    com cada tentativa na checagem de vitória.
+
+    O objeto não é alterado depois de construído: a troca de dia é feita
+    substituindo a referência inteira (uma atribuição, atômica no Python).
+    """
+
+    def __init__(self, palavra_secreta, data, indice_secreto=None, vetor_secreto=None,
+                 indice_ranking=None, ordem=None, max_sim=None, consulta_secreta=None):
+        self.palavra_secreta = palavra_secreta
+        self.secreta_sem_acento = sem_acento.dobrar(palavra_secreta)
+        self.data = data
+        self.indice_secreto = indice_secreto
+        self.vetor_secreto = vetor_secreto
+        self.consulta_secreta = consulta_secreta
+        self.indice_ranking = indice_ranking
+        self.ordem = ordem
+        self.max_sim = max_sim
+
+    def __repr__(self):
+        return f"PuzzleDoDia({self.palavra_secreta!r}, {self.data})"
+
+
+
+# ARMAZÉM DE PUZZLES EM DISCO (um arquivo binário por data)
+class ArmazemPuzzles:
+    """
+    Guarda cada puzzle em '<diretorio>/AAAA-MM-DD.npz' com a palavra secreta,
+    o id dela no vocabulário, max_sim e o ranking (ids int32 em ordem +
+    similaridades float32). Carregar um dia é ler esse arquivo: nada é recalculado.
+
+    O diretório identifica o modelo (ver jogo.chave_puzzles), não as listas
+    de palavras: um puzzle salvo é o publicado naquela data e continua valendo
+    depois de uma recarga das listas.
+    """
+
+    def __init__(self, diretorio):
+        self.diretorio = diretorio
+
+    def caminho(self, data):
+        return os.path.join(self.diretorio, f"{data.isoformat()}.npz")
+
+    def existe(self, data):
+        return os.path.exists(self.caminho(data))
+
+    def datas(self):
+        """Datas disponíveis, em ordem"""
+        if not os.path.isdir(self.diretorio):
+            return []
+
+        datas = []
+        for nome in os.listdir(self.diretorio):
+            if nome.endswith(".npz"):
+                try:
+                    datas.append(date.fromisoformat(nome[:-4]))
+                except ValueError:
+                    continue
+        return sorted(datas)
+
+    def salvar(self, puzzle):
+        os.makedirs(self.diretorio, exist_ok=True)
+        caminho = self.caminho(puzzle.data)
+        temporario = caminho + ".tmp"
+
+        ordem = np.asarray(puzzle.ordem, dtype=np.int32)
+        with open(temporario, "wb") as f:
+            np.savez(
+                f,
+                palavra_secreta=np.array(puzzle.palavra_secreta),
+                indice_secreto=np.int64(-1 if puzzle.indice_secreto is None else puzzle.indice_secreto),
+                max_sim=np.float64(puzzle.max_sim if puzzle.max_sim is not None else np.nan),
+                ordem=ordem,
+                similaridades=puzzle.indice_ranking.similaridades[ordem],
+            )
+        os.replace(temporario, caminho)
+
+    def carregar(self, data, chave_para_indice, vetores, preparar_consulta=None):
+        """
+        Lê o puzzle da data (ou None se ele não foi pré-calculado).
+        preparar_consulta(vetor) monta a consulta_secreta (jogo.preparar_consulta).
+        """
+        caminho = self.caminho(data)
+        if not os.path.exists(caminho):
+            return None
+
+        with np.load(caminho, allow_pickle=False) as dados:
+            palavra_secreta = str(dados["palavra_secreta"])
+            indice_secreto = int(dados["indice_secreto"])
+            max_sim = float(dados["max_sim"])
+            ordem = dados["ordem"]
+            similaridades_ordem = dados["similaridades"]
+
+        indice_secreto = None if indice_secreto < 0 else indice_secreto
+
+        similaridades = np.zeros(len(vetores), dtype=np.float32)
+        similaridades[ordem] = similaridades_ordem
+        indice_ranking = IndiceRanking.a_partir_da_ordem(
+            chave_para_indice, len(vetores), ordem, similaridades, indice_secreto
+        )
+
+        vetor_secreto = vetores[indice_secreto] if indice_secreto is not None else None
+        consulta_secreta = None
+        if vetor_secreto is not None and preparar_consulta is not None:
+            consulta_secreta = preparar_consulta(vetor_secreto)
+
+        return PuzzleDoDia(
+            palavra_secreta, data,
+            indice_secreto=indice_secreto,
+            vetor_secreto=vetor_secreto,
+            consulta_secreta=consulta_secreta,
+            indice_ranking=indice_ranking,
+            ordem=ordem,
+            max_sim=None if np.isnan(max_sim) else max_sim,
+        )
@@ -0,0 +1,168 @@
+import numpy as np
+
+
+
+# ÍNDICE DE RANKING DA PALAVRA DO DIA
+class IndiceRanking:
+    """
+    Guarda a posição (estilo Contexto) e a similaridade de cada palavra aceita
+    em relação à palavra secreta do dia.
+
+    Em vez de um dicionário de strings, usa dois arrays indexados pelo id da
+    palavra no vocabulário do modelo (int32 para a posição e float32 para a
+    similaridade). Consulta: uma busca no dicionário do vocabulário + O(1).
+    """
+
+    SEM_POSICAO = -1
+
+    def __init__(self, chave_para_indice, tamanho_vocab):
+        # Dicionário palavra -> id já mantido pelo KeyedVectors (não é copiado)
+        self.chave_para_indice = chave_para_indice
+        self.posicoes = np.full(tamanho_vocab, self.SEM_POSICAO, dtype=np.int32)
+        self.similaridades = np.zeros(tamanho_vocab, dtype=np.float32)
+        self.total = 0
+
+    def __len__(self):
+        return self.total
+
+    def __contains__(self, palavra):
+        indice = self.chave_para_indice.get(palavra)
+        return indice is not None and self.posicoes[indice] != self.SEM_POSICAO
+
+    def adicionar(self, palavra, similaridade):
+        """
+        Registra a próxima posição do ranking para a palavra.
+        Retorna False se a palavra não está no vocabulário ou já foi registrada.
+        """
+        indice = self.chave_para_indice.get(palavra)
+        if indice is None or self.posicoes[indice] != self.SEM_POSICAO:
+            return False
+
+        self.total += 1
+        self.posicoes[indice] = self.total
+        self.similaridades[indice] = similaridade
+        return True
+
+    def consultar(self, palavra):
+        """
+        Retorna (posição, similaridade) da palavra ou None se ela não está no ranking.
+        A posição 1 é a própria palavra secreta.
+        """
+        indice = self.chave_para_indice.get(palavra)
+        if indice is None:
+            return None
+
+        posicao = int(self.posicoes[indice])
+        if posicao == self.SEM_POSICAO:
+            return None
+
+        return posicao, float(self.similaridades[indice])
+
+    def consultar_id(self, indice):
+        """consultar() com o id já resolvido (ex.: pelo índice sem acento); -1 = fora do vocabulário"""
+        if indice < 0:
+            return None
+
+        posicao = int(self.posicoes[indice])
+        if posicao == self.SEM_POSICAO:
+            return None
+
+        return posicao, float(self.similaridades[indice])
+
+    def consultar_lote(self, palavras):
+        """
+        (posições, similaridades) de várias palavras, como arrays alinhados
+        com a entrada. Palavras fora do ranking ficam com SEM_POSICAO.
+        """
+        ids = np.fromiter((self.chave_para_indice.get(p, -1) for p in palavras), dtype=np.int64, count=len(palavras))
+        return self.consultar_ids(ids)
+
+    def consultar_ids(self, ids):
+        """consultar_lote() com os ids já resolvidos (int64, -1 = fora do vocabulário)"""
+        conhecidas = ids >= 0
+
+        posicoes = np.full(len(ids), self.SEM_POSICAO, dtype=np.int32)
+        similaridades = np.zeros(len(ids), dtype=np.float32)
+        posicoes[conhecidas] = self.posicoes[ids[conhecidas]]
+        similaridades[conhecidas] = self.similaridades[ids[conhecidas]]
+        return posicoes, similaridades
+
+    def memoria_bytes(self):
+        """Memória ocupada pelos arrays do índice (sem contar o vocabulário)."""
+        return self.posicoes.nbytes + self.similaridades.nbytes
+
+    @classmethod
+    def a_partir_da_ordem(cls, chave_para_indice, tamanho_vocab, ordem, similaridades, indice_secreto=None):
+        """
+        Monta o índice de uma vez a partir dos ids já ordenados (do mais próximo
+        para o mais distante). Se informado, o id da palavra secreta fica na posição 1.
+        """
+        indice = cls(chave_para_indice, tamanho_vocab)
+        inicio = 1
+
+        if indice_secreto is not None:
+            indice.posicoes[indice_secreto] = 1
+            indice.similaridades[indice_secreto] = 1.0
+            inicio = 2
+
+        indice.posicoes[ordem] = np.arange(inicio, inicio + len(ordem), dtype=np.int32)
+        indice.similaridades[ordem] = similaridades[ordem]
+        indice.total = len(ordem) + inicio - 1
+        return indice
+
+
+
+# CONSTRUÇÃO VETORIZADA DO RANKING
+def ordenar_candidatos(similaridades, mascara_validos, indice_secreto=None, topn=None):
+    """
+    Retorna os ids válidos ordenados da maior para a menor similaridade.
+    Com topn, usa argpartition para ordenar apenas as melhores posições.
+    """
+    mascara = mascara_validos
+    if indice_secreto is not None and mascara[indice_secreto]:
+        mascara = mascara.copy()
+        mascara[indice_secreto] = False
+
+    candidatos = np.flatnonzero(mascara)
+    valores = -similaridades[candidatos]
+
+    if topn is not None and topn < len(candidatos):
+        melhores = np.argpartition(valores, topn)[:topn]
+        candidatos = candidatos[melhores]
+        valores = valores[melhores]
+
+    # Ordenação estável: empates mantêm a ordem do vocabulário
+    return candidatos[np.argsort(valores, kind="stable")]
+
+def calcular_similaridades(vetores_normalizados, indice):
+    """
+    Similaridade de todas as palavras com a palavra de id 'indice'.
+    Aceita a matriz float32 ou uma representação comprimida (routes/compressao.py).
+    """
+    if hasattr(vetores_normalizados, "similaridades_com"):
+        return vetores_normalizados.similaridades_com(indice)
+    return vetores_normalizados @ vetores_normalizados[indice]
+
+def construir_ranking(vetores_normalizados, indice_secreto, mascara_validos, chave_para_indice, topn=None):
+    """
+    Monta o ranking do dia com um único produto matriz-vetor.
+
+    vetores_normalizados: matriz (N, D) com linhas de norma 1 (ou comprimida).
+    Retorna (indice_ranking, similaridades, ordem), onde similaridades é o
+    cosseno de todas as palavras com a secreta e ordem são os ids aceitos.
+    """
+    similaridades = calcular_similaridades(vetores_normalizados, indice_secreto)
+    ordem = ordenar_candidatos(similaridades, mascara_validos, indice_secreto, topn)
+
+    indice = IndiceRanking.a_partir_da_ordem(
+        chave_para_indice, len(vetores_normalizados), ordem, similaridades, indice_secreto
+    )
+    return indice, similaridades, ordem
+
+def salvar_ranking(caminho, vocabulario, similaridades, ordem, max_sim):
+    """Grava o ranking no formato 'palavra, porcentagem' com uma única escrita."""
+    porcentagens = similaridades[ordem] / max_sim * 100
+    linhas = [f"{vocabulario[i]}, {p:.2f}\n" for i, p in zip(ordem.tolist(), porcentagens.tolist())]
+
+    with open(caminho, "w", encoding="utf8") as f:
+        f.write("".join(linhas))
@@ -0,0 +1,134 @@
+
+
+
+# Planos já calculados, por motor (chave: as últimas letras da palavra)
+MAX_PLANOS = 100000
+
+
+
+# REGRAS DE SUFIXO COMO DADOS
+class GrupoRegras:
+    """
+    Um bloco de regras (um 'if original.endswith(...)' das funções antigas).
+
+    sufixos      {sufixo: [substituições]}: o candidato é radical + substituição,
+                 onde radical é a palavra sem o sufixo. Só o sufixo MAIS LONGO
+                 que casar dentro do grupo é usado (ex.: 'azinho' antes de 'zinho').
+    terminal     se o grupo casou e nenhum candidato existe, devolve a palavra
+                 original sem olhar os grupos seguintes
+    base_minima  tamanho mínimo do radical para o grupo valer
+    """
+
+    __slots__ = ("sufixos", "terminal", "base_minima")
+
+    def __init__(self, sufixos, terminal=False, base_minima=0):
+        self.sufixos = sufixos
+        self.terminal = terminal
+        self.base_minima = base_minima
+
+class _No:
+    __slots__ = ("filhos", "regras", "plano")
+
+    def __init__(self):
+        self.filhos = {}
+        self.regras = {}  # {índice do grupo: substituições} dos sufixos que terminam neste nó
+        self.plano = ()   # Regras de todos os sufixos até aqui, prontas para aplicar
+
+
+
+# MOTOR: TRIE DE SUFIXOS INVERTIDOS
+class MotorSufixos:
+    """
+    Compila os grupos (em ordem de prioridade) em uma trie dos sufixos
+    lidos de trás para frente. Cada nó já guarda o 'plano' das palavras
+    que terminam no sufixo dele: o sufixo mais longo de cada grupo que
+    casa, em ordem de grupo. Aplicar = uma varredura da direita para a
+    esquerda até o nó mais fundo + testar os candidatos do plano dele.
+
+    Antes da trie, um único endswith com a última letra de todos os sufixos
+    (como o 'if not original.endswith('s')' do plural antigo) descarta as
+    palavras em que nenhuma regra pode casar. O plano de cada final de
+    palavra (as últimas 'maior' letras) é guardado depois da primeira
+    varredura, até MAX_PLANOS por motor.
+    """
+
+    def __init__(self, grupos, tamanho_minimo=0, protegidas=frozenset()):
+        self.grupos = [g if isinstance(g, GrupoRegras) else GrupoRegras(g) for g in grupos]
+        self.tamanho_minimo = tamanho_minimo
+        self.protegidas = protegidas
+
+        self.finais = tuple(sorted({sufixo[-1:] for g in self.grupos for sufixo in g.sufixos}))
+
+        self.raiz = _No()
+        for indice, grupo in enumerate(self.grupos):
+            for sufixo, substituicoes in grupo.sufixos.items():
+                no = self.raiz
+                for letra in reversed(sufixo):
+                    no = no.filhos.setdefault(letra, _No())
+                no.regras[indice] = tuple(substituicoes)
+
+        self._compilar(self.raiz, 0, {})
+        self.maior = max((len(s) for g in self.grupos for s in g.sufixos), default=0) or 1
+        self._planos = {}
+
+    def _compilar(self, no, profundidade, herdadas):
+        """Sufixo mais fundo (mais longo) substitui o mais curto do mesmo grupo"""
+        regras = dict(herdadas)
+        for indice, substituicoes in no.regras.items():
+            regras[indice] = (profundidade, substituicoes)
+
+        # (tamanho do sufixo, tamanho mínimo da palavra, substituições, terminal)
+        no.plano = tuple(
+            (tamanho, tamanho + self.grupos[indice].base_minima, substituicoes, self.grupos[indice].terminal)
+            for indice, (tamanho, substituicoes) in sorted(regras.items())
+        )
+        for letra, filho in no.filhos.items():
+            self._compilar(filho, profundidade + 1, regras)
+
+    def plano(self, palavra):
+        """Regras que casam com a palavra, na ordem em que serão testadas"""
+        no = self.raiz
+        plano = no.plano
+        for letra in reversed(palavra):
+            no = no.filhos.get(letra)
+            if no is None:
+                break
+            plano = no.plano
+        return plano
+
+    def aplicar(self, palavra, existe):
+        """Forma base da palavra segundo as regras, ou a própria palavra (minúscula)"""
+        original = palavra.lower().strip()
+
+        if not original.endswith(self.finais):
+            return original
+        return self.aplicar_normalizada(original, existe)
+
+    def aplicar_normalizada(self, original, existe):
+        """aplicar() para uma palavra já minúscula e sem espaços nas pontas"""
+        tamanho_palavra = len(original)
+        if tamanho_palavra < self.tamanho_minimo or original in self.protegidas:
+            return original
+
+        # O plano só depende das últimas letras (até o sufixo mais longo)
+        cauda = original[-self.maior:]
+        plano = self._planos.get(cauda)
+        if plano is None:
+            plano = self.plano(cauda)
+            if len(self._planos) < MAX_PLANOS:
+                self._planos[cauda] = plano
+
+        for tamanho, minimo, substituicoes, terminal in plano:
+            if tamanho_palavra < minimo:
+                continue
+
+            radical = original[:-tamanho]
+            for substituicao in substituicoes:
+                candidato = radical + substituicao
+                if existe(candidato):
+                    return candidato
+
+            if terminal:
+                return original
+
+        return original
@@ -1,358 +1,24 @@
-from flask import Blueprint, render_template, request, jsonify
-import numpy as np
-from gensim.models import KeyedVectors
-import unicodedata
-from datetime import datetime, timedelta
-import hashlib
-from wordfreq import zipf_frequency
-from spellchecker import SpellChecker
-import hunspell
+import os
+from flask import Blueprint, render_template, request, jsonify, g
+from datetime import date, datetime, timedelta
 
 # Arquivos auxiliares
-from routes import input_filter
-from routes.model_loader import word2vec
-
-"""
-===========================================================
-🔍 COMO O WORD2VEC É USADO NESTE JOGO (EXPLICAÇÃO TÉCNICA)
-===========================================================
-
-Este jogo funciona comparando a palavra que o jogador digita
-com a palavra secreta usando vetores gerados pelo modelo
-Word2Vec especializado em TECNOLOGIA.
-
-📌 1. VETORIZAÇÃO DAS PALAVRAS
---------------------------------
-Quando uma palavra é enviada pelo jogador, chamamos a função:
-
-    obter_vetor_word2vec(palavra)
-
-Essa função tenta encontrar o vetor da palavra dentro do modelo
-Word2Vec (word2vec_tecnologia.kv).
-
-• Se a palavra existe no modelo → retornamos o vetor real treinado
-• Se NÃO existe → criamos um vetor aleatório normalizado
-  (isso impede erro e mantém o jogo funcionando)
-
-Cada palavra vira um vetor de 300 dimensões, por exemplo:
-[0.12, -0.88, 0.03, ..., 0.54]
-
-Esses vetores representam o *significado* das palavras com base
-nos textos de tecnologia usados durante o treinamento.
-
-📌 2. COMPARAÇÃO ENTRE AS PALAVRAS
-------------------------------------
-A similaridade é calculada por:
-
-    calcular_similaridade_cosseno(vetor_tentativa, vetor_secreto)
-
-Esse cálculo gera um valor entre 0% e 100%, baseado no quanto
-os vetores apontam para a mesma direção no espaço vetorial.
-
-Quanto mais parecidas no "contexto tecnológico", maior a
-similaridade.
-
-Exemplos:
-• “computador” x “processador” → alta similaridade
-• “computador” x “bluetooth”   → média
-• “computador” x “ransomware”  → baixa
-
-📌 3. PALAVRA DO DIA
------------------------
-A função:
-
-    obter_palavra_do_dia()
-
-usa um seed baseado na data atual para escolher SEMPRE a mesma
-palavra durante aquele dia, impedindo que o jogador reinicie a
-partida.
-
-📌 4. FILTRO DE PALAVRAS
----------------------------
-A função:
-
-    filtrar_palavras_no_modelo()
-
-garante que só usamos:
-    ✔ palavras únicas (sem espaço)
-    ✔ palavras que EXISTEM dentro do Word2Vec
-
-Isso melhora a qualidade do jogo, pois só comparamos vetores reais.
-
-📌 5. POR QUE ISSO TUDO?
----------------------------
-Porque o jogo funciona como o famoso “Contexto”: o jogador não
-recebe letras, e sim um grau de proximidade semântica.
-
-Exemplo:
-Se a palavra secreta é "python" e você tenta “programação”,
-o Word2Vec calcula que esses vetores são próximos → similaridade
-alta. Isso orienta o jogador até acertar a palavra.
-
-============================================================
-RESUMO TÉCNICO FINAL
-------------------------------------------------------------
-• Word2Vec gera vetores que representam significados.
-• A tentativa e a palavra secreta são convertidas em vetores.
-• A similaridade entre eles diz o "quão perto" o jogador está.
-• O jogo usa apenas palavras únicas e válidas do modelo.
-• O desafio só reinicia à meia-noite (não pode reiniciar antes).
-
-============================================================
-"""
-
-main_bp = Blueprint('main', __name__)
-
-# 📚 Lista de palavras ÚNICAS de tecnologia (sem espaços)
-PALAVRAS_TECNOLOGIA = [
-    "algoritmo",
-    "programação",
-    "computador",
-    "processador",
-    "internet",
-    "servidor",
-    "blockchain",
-    "criptomoeda",
-    "automação",
-    "cibersegurança",
-    "firewall",
-    "streaming",
-    "drone",
-    "smartphone",
-    "wifi",
-    "bluetooth",
-    "sensor",
-    "microcontrolador",
-    "compilador",
-    "framework",
-    "biblioteca",
-    "virtualização",
-    "devops",
-    "software",
-    "hardware",
-    "firmware",
-    "malware",
-    "antivirus",
-    "backup",
-    "cache",
-    "cookie",
-    "debug",
-    "download",
-    "upload",
-    "firewall",
-    "gateway",
-    "hosting",
-    "javascript",
-    "python",
-    "java",
-    "kernel",
-    "linux",
-    "windows",
-    "android",
-    "mac",
-    "interface",
-    "database",
-    "api",
-    "Json",
-    "xml",
-    "html",
-    "css",
-    "pixel",
-    "render",
-    "router",
-    "switch",
-    "modem",
-    "protocolo",
-    "ethernet",
-    "laptop",
-    "tablet",
-    "monitor",
-    "teclado",
-    "mouse",
-    "webcam",
-    "scanner",
-    "impressora",
-    "pendrive",
-    "memória",
-    "disco",
-    "chipset",
-    "transistor",
-    "capacitor",
-    "resistor",
-    "diodo",
-    "circuito",
-    "eletrônica",
-    "digital",
-    "analógico",
-    "binário",
-    "hexadecimal",
-    "byte",
-    "megabyte",
-    "gigabyte",
-    "terabyte",
-    "bandwidth",
-    "latência",
-    "throughput",
-    "firewall",
-    "antivírus",
-    "malware",
-    "phishing",
-    "ransomware",
-    "trojan",
-    "spyware",
-    "adware",
-    "rootkit",
-    "botnet",
-    "ddos",
-    "encryption",
-    "decryption",
-    "hash",
-    "token",
-    "autenticação",
-    "autorização",
-    "certificado",
-    "ssl",
-    "https",
-    "firewall",
-    "proxy",
-    "vpn",
-    "dns",
-    "ip",
-    "tcp",
-    "udp",
-    "http",
-    "ftp",
-    "smtp",
-    "pop",
-    "imap",
-    "ssh",
-    "telnet",
-    "ping",
-    "traceroute",
-    "subnet",
-    "gateway",
-    "broadcast",
-    "multicast",
-    "unicast"
-]
-
-spell = SpellChecker(language="pt")
-h = hunspell.HunSpell(
-    "base_palavras/pt_BR.dic",
-    "base_palavras/pt_BR.aff"
+from routes import jogo
+from routes import sessoes
+from routes import medicao
+from routes import cache_lru
+from routes import dicionario
+from routes.agendador import AgendadorPuzzles
+from routes.aquecimento import Aquecimento
+from routes.listas_palavras import VigiaArquivos
+from routes.jogo import (
+    construir_puzzle, gravar_saida, validar_palavra, pontuar_tentativa, pontuar_tentativas, carregar_puzzle_salvo,
 )
 
-def esta_em_dicionario(palavra):
-    p = palavra.lower().strip()
-
-    # 1. wordfreq: aparece em corpora?
-    if zipf_frequency(p, "pt") > 0:
-        return p
-
-    # 2. pyspellchecker: está no dicionário interno?
-    if p in spell.word_frequency:
-        return p
-
-    # 3. hunspell: verificação ortográfica completa
-    if h.spell(p):
-        return p
-
-    return False
-
-def normalizar_texto(texto):
-    """Remove acentos e normaliza o texto para comparação"""
-    texto = texto.lower().strip()
-    # Remove acentos
-    texto_norm = ''.join(
-        c for c in unicodedata.normalize('NFD', texto)
-        if unicodedata.category(c) != 'Mn'
-    )
-    return texto_norm
-
-def obter_vetor_word2vec(palavra):
-    """Obtém o vetor de uma palavra usando Word2Vec"""
-    if word2vec is None:
-        # Retorna vetor aleatório se modelo não carregou
-        vetor = np.random.randn(300)
-        return vetor / np.linalg.norm(vetor)
-    
-    palavra_norm = normalizar_texto(palavra)
-    
-    # Tenta diferentes variações da palavra
-    variantes = [
-        palavra_norm,
-        palavra.lower().strip()
-    ]
-    
-    for variante in variantes:
-        try:
-            if variante in word2vec:
-                return word2vec[variante]
-        except:
-            continue
-    
-    # Se não encontrar no modelo, retorna vetor aleatório normalizado
-    print(f"⚠️ Palavra '{palavra}' não encontrada no modelo")
-    vetor = np.random.randn(300)
-    return vetor / np.linalg.norm(vetor)
-
-def calcular_similaridade_cosseno(vetor1, vetor2):
-    """Calcula a similaridade do cosseno entre dois vetores"""
-    # Normaliza os vetores
-    norma1 = np.linalg.norm(vetor1)
-    norma2 = np.linalg.norm(vetor2)
-    
-    if norma1 == 0 or norma2 == 0:
-        return 0.0
-    
-    # Produto escalar normalizado
-    similaridade = np.dot(vetor1, vetor2) / (norma1 * norma2)
-    
-    similaridade = (similaridade / max_sim)
-    # Converte para porcentagem e limita entre 0 e 100
-    similaridade_pct = max(0, min(100, similaridade * 100))
-    
-    return round(float(similaridade_pct), 2)
+main_bp = Blueprint('main', __name__)
 
-def filtrar_palavras_no_modelo():
-    """Filtra apenas palavras ÚNICAS que existem no modelo Word2Vec"""
-    if word2vec is None:
-        # Filtra apenas palavras sem espaço
-        return [p for p in PALAVRAS_TECNOLOGIA if ' ' not in p]
-    
-    palavras_validas = []
-    for palavra in PALAVRAS_TECNOLOGIA:
-        # Ignora palavras compostas (com espaço)
-        if ' ' in palavra:
-            continue
-            
-        variantes = [
-            normalizar_texto(palavra),
-            palavra.lower().strip()
-        ]
-        
-        for variante in variantes:
-            if variante in word2vec:
-                palavras_validas.append(palavra)
-                break
-    
-    print(f"📊 {len(palavras_validas)} palavras únicas válidas no modelo")
-    return palavras_validas if palavras_validas else [p for p in PALAVRAS_TECNOLOGIA if ' ' not in p]
-
-def obter_palavra_do_dia():
-    """Gera a palavra do dia baseada na data atual"""
-    # Obtém a data de hoje
-    hoje = datetime.now().date()
-    
-    # Cria um seed determinístico baseado na data
-    seed_str = f"{hoje.year}-{hoje.month:02d}-{hoje.day:02d}"
-    seed_hash = int(hashlib.md5(seed_str.encode()).hexdigest(), 16)
-    
-    # Usa o seed para escolher a palavra
-    palavras_validas = filtrar_palavras_no_modelo()
-    indice = seed_hash % len(palavras_validas)
-    
-    return palavras_validas[indice], hoje
+# Máximo de palavras por requisição em /tentar/lote
+MAX_TENTATIVAS_LOTE = int(os.environ.get("CONTEXTO_TENTATIVAS_LOTE_MAX", 100))
 
 def obter_proximo_reset():
     """Retorna quando será o próximo reset (meia-noite do dia seguinte)"""
@@ -371,65 +37,113 @@ def formatar_tempo_restante(tempo_reset):
     
     return f"{horas}h {minutos}min"
 
-# 🔒 Estado global do jogo
-palavra_secreta = ""
-data_palavra = None
-vetor_secreto = None
-jogo_finalizado = False
-tentativas_historico = []
-max_sim = None
-
-def inicializar_jogo():
-    """Inicializa o jogo com a palavra do dia"""
-    global palavra_secreta, data_palavra, vetor_secreto, jogo_finalizado, tentativas_historico
-    
-    # Obtém palavra do dia
-    palavra_secreta, data_palavra = obter_palavra_do_dia()
-    vetor_secreto = obter_vetor_word2vec(palavra_secreta)
-    jogo_finalizado = False
-    tentativas_historico = []
-    
-    print(f"🎮 Palavra do dia: {palavra_secreta} (Data: {data_palavra})")
-    i = 0
-    
-    palavras = set()
-
-    global max_sim
-
-    for palavra, similaridade in word2vec.most_similar(palavra_secreta, topn=100):
-        print(f'{similaridade} - {palavra}')
-
-    with open("saida.txt", "w", encoding="utf8") as f:
-        i = 0
-        for palavra, similaridade in word2vec.most_similar(palavra_secreta, topn=720000):
-            tentativa = input_filter.palavra_existe(palavra)
-            if tentativa != False:
-                tentativa = esta_em_dicionario(tentativa)
-
-            if tentativa != False and tentativa not in palavras:
-                if (max_sim is None):
-                    max_sim = similaridade
-
-                i += 1
-                palavras.add(tentativa)
-
-                linha = f"{tentativa}, {(similaridade/max_sim) * 100:.2f}\n"
-                f.write(linha)
-
-                # print(linha, end="")
-
+# 🔒 Puzzle do dia: construído em segundo plano e trocado à meia-noite
+agendador = AgendadorPuzzles(construir_puzzle, ao_publicar=gravar_saida)
 
 def verificar_reset_diario():
-    """Verifica se precisa resetar o jogo para um novo dia"""
-    global data_palavra
-    
-    hoje = datetime.now().date()
-    if data_palavra != hoje:
-        print(f"🔄 Novo dia detectado! Resetando jogo...")
-        inicializar_jogo()
+    """Retorna o puzzle de hoje (a troca de dia é feita pelo agendador)"""
+    return agendador.obter_atual(datetime.now().date())
+
+# 📝 Listas de palavras: recarregadas a quente quando os arquivos mudam
+def recarregar_listas():
+    """Sob a trava de construção: um puzzle nunca é calculado no meio da troca"""
+    with agendador.trava_construcao:
+        jogo.recarregar_listas()
+
+vigia_listas = VigiaArquivos(jogo.caminhos_listas(), recarregar_listas)
+
+# 👥 Sessões dos jogadores (uma por cookie)
+armazem_sessoes = sessoes.ArmazemSessoes()
+
+def obter_sessao(puzzle):
+    """Sessão do jogador desta requisição (cria uma nova se preciso)"""
+    if "sessao" not in g:
+        token_cookie = request.cookies.get(sessoes.NOME_COOKIE)
+        g.token_sessao, g.sessao = armazem_sessoes.obter(token_cookie, puzzle.data)
+        g.token_novo = g.token_sessao != token_cookie
+    return g.sessao
+
+# Erro de cada resultado de SessaoJogador.registrar que não grava a tentativa
+MENSAGENS_REGISTRO = {
+    sessoes.REPETIDA: "Você já tentou essa palavra!",
+    sessoes.LIMITE: "Limite de tentativas atingido para hoje!",
+    sessoes.FINALIZADA: "Você já completou o desafio de hoje!",
+}
+
+def chave_historico(palavra):
+    """
+    Id da palavra no vocabulário, o mesmo usado na pontuação ('memoria' e
+    'memória' são a mesma tentativa); fora dele, um id negativo derivado da palavra
+    """
+    indice = jogo.id_no_vocabulario(palavra)
+    return indice if indice >= 0 else sessoes.chave_fora_do_vocabulario(palavra)
+
+@main_bp.after_request
+def gravar_cookie_sessao(response):
+    """Envia o cookie quando a sessão acabou de ser criada"""
+    if g.get("token_novo"):
+        response.set_cookie(
+            sessoes.NOME_COOKIE, g.token_sessao,
+            max_age=sessoes.TTL_SESSAO, httponly=True, samesite="Lax"
+        )
+    return response
+
+# 🔥 Aquecimento: carrega o jogo e agenda os próximos dias (disparado pelo create_app)
+def aquecer():
+    try:
+        jogo.inicializar()
+        with medicao.fase("puzzle_do_dia"):
+            agendador.inicializar(datetime.now().date())
+        agendador.iniciar()
+        vigia_listas.iniciar()
+    finally:
+        medicao.relatorio.concluir()
+
+aquecimento = Aquecimento(aquecer)
+
+ROTAS_SEM_AQUECIMENTO = {"main.healthz", "main.readyz", "main.inicializacao", "main.caches", "main.dicionarios"}
+
+@main_bp.before_request
+def exigir_aquecimento():
+    """Enquanto o jogo carrega, só as rotas de saúde respondem"""
+    if not aquecimento.pronto and request.endpoint not in ROTAS_SEM_AQUECIMENTO:
+        response = jsonify({"erro": "Servidor iniciando, tente novamente em instantes."})
+        response.headers["Retry-After"] = "5"
+        return response, 503
+
+@main_bp.route('/healthz', methods=['GET'])
+def healthz():
+    """Liveness: o processo está de pé (não depende do modelo)"""
+    return jsonify({"status": "ok"})
+
+@main_bp.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness: modelo carregado e ranking de hoje pronto"""
+    puzzle = agendador.atual
+    modelo_carregado = jogo.word2vec is not None
+    pronto = aquecimento.pronto and modelo_carregado and puzzle is not None
 
-# Inicializa o jogo ao importar o módulo
-inicializar_jogo()
+    return jsonify({
+        "pronto": pronto,
+        "aquecimento": aquecimento.resumo(),
+        "modelo_carregado": modelo_carregado,
+        "data_palavra": str(puzzle.data) if puzzle else None,
+    }), 200 if pronto else 503
+
+@main_bp.route('/inicializacao', methods=['GET'])
+def inicializacao():
+    """Tempo de parede, CPU e variação de RSS de cada fase da inicialização"""
+    return jsonify(medicao.relatorio.registro())
+
+@main_bp.route('/caches', methods=['GET'])
+def caches():
+    """Acertos, faltas e remoções dos caches de normalização de palavras"""
+    return jsonify(cache_lru.estatisticas_caches())
+
+@main_bp.route('/dicionarios', methods=['GET'])
+def dicionarios():
+    """Consultas e tempo da tabela de aceitação e de cada dicionário ao vivo"""
+    return jsonify(dicionario.estatisticas_dicionarios())
 
 @main_bp.route('/')
 def index():
@@ -440,11 +154,10 @@ def index():
 @main_bp.route('/tentar', methods=['POST'])
 def tentar():
     """Processa uma tentativa do jogador"""
-    global jogo_finalizado, tentativas_historico
-    
-    verificar_reset_diario()
+    puzzle = verificar_reset_diario()
+    sessao = obter_sessao(puzzle)
 
-    if jogo_finalizado:
+    if sessao.finalizado:
         tempo_reset = obter_proximo_reset()
         tempo_restante = formatar_tempo_restante(tempo_reset)
         return jsonify({
@@ -454,41 +167,29 @@ def tentar():
     # Obtém a palavra tentada
     tentativa = request.json.get('palavra', '').lower().strip()
 
-    tentativa = input_filter.palavra_existe(tentativa)
-    if tentativa != False:
-        tentativa = esta_em_dicionario(tentativa)
+    tentativa = validar_palavra(tentativa)
 
     if tentativa == False:
         return jsonify({"erro": "Palavra desconhecida ou inválida! Verifique a ortografia."})
     
     
-    # Verifica se já tentou essa palavra
-    if tentativa in tentativas_historico:
-        return jsonify({"erro": "Você já tentou essa palavra!"})
-    
-    # Obtém vetor da tentativa
-    vetor_tentativa = obter_vetor_word2vec(tentativa)
-    
-    # Calcula similaridade
-    similaridade = calcular_similaridade_cosseno(vetor_tentativa, vetor_secreto)
-    
-    # Verifica vitória
-    venceu = normalizar_texto(tentativa) == normalizar_texto(palavra_secreta)
-    
-    if venceu:
-        jogo_finalizado = True
-    
-    # Adiciona ao histórico
-    tentativas_historico.append(tentativa)
+    # Consulta o ranking do dia (uma busca no vocabulário)
+    posicao, similaridade, venceu = pontuar_tentativa(puzzle, tentativa)
+
+    # Confere se já tentou essa palavra e adiciona ao histórico (uma operação só)
+    resultado = sessao.registrar(chave_historico(tentativa), venceu)
+    if resultado != sessoes.REGISTRADA:
+        return jsonify({"erro": MENSAGENS_REGISTRO[resultado]})
     
-    print(f"🎯 Tentativa: '{tentativa}' | Similaridade: {similaridade}% | Venceu: {venceu}")
+    print(f"🎯 Tentativa: '{tentativa}' | Posição: {posicao} | Similaridade: {similaridade}% | Venceu: {venceu}")
 
     response = {
         "similaridade": similaridade,
+        "posicao": posicao,
         "venceu": venceu,
         "palavra_exibida": tentativa,
-        "palavra_secreta": palavra_secreta if venceu else None,
-        "total_tentativas": len(tentativas_historico)
+        "palavra_secreta": puzzle.palavra_secreta if venceu else None,
+        "total_tentativas": len(sessao)
     }
     
     if venceu:
@@ -498,6 +199,85 @@ def tentar():
     
     return jsonify(response)
 
+@main_bp.route('/tentar/lote', methods=['POST'])
+def tentar_lote():
+    """
+    Processa várias tentativas de uma vez ({"palavras": [...]}), com as mesmas
+    regras do /tentar aplicadas na ordem recebida. Validação, pontuação e
+    histórico (uma trava só na sessão) são feitos em lote; os resultados
+    voltam na ordem da entrada.
+    """
+    puzzle = verificar_reset_diario()
+    sessao = obter_sessao(puzzle)
+
+    dados = request.get_json(silent=True)
+    palavras = dados.get('palavras') if isinstance(dados, dict) else None
+    if not isinstance(palavras, list) or not palavras:
+        return jsonify({"erro": "Envie uma lista de palavras em 'palavras'."}), 400
+    if len(palavras) > MAX_TENTATIVAS_LOTE:
+        return jsonify({"erro": f"Envie no máximo {MAX_TENTATIVAS_LOTE} palavras por vez."}), 413
+
+    if sessao.finalizado:
+        tempo_reset = obter_proximo_reset()
+        tempo_restante = formatar_tempo_restante(tempo_reset)
+        return jsonify({
+            "erro": f"Você já completou o desafio de hoje! Volte em {tempo_restante} para uma nova palavra."
+        })
+
+    entradas = [p.lower().strip() if isinstance(p, str) else "" for p in palavras]
+    formas = jogo.validar_palavras(entradas)
+    aceitas = list(dict.fromkeys(f for f in formas.values() if f != False))
+    pontuacoes = dict(zip(aceitas, pontuar_tentativas(puzzle, aceitas)))
+
+    # Histórico: todas as tentativas aceitas conferidas e gravadas em ordem, sob uma trava só
+    validas = [formas[entrada] for entrada in entradas if formas[entrada] != False]
+    registros = iter(sessao.registrar_lote(
+        [(chave_historico(tentativa), pontuacoes[tentativa][2]) for tentativa in validas]
+    ))
+
+    resultados = []
+    finalizou = False
+    for palavra, entrada in zip(palavras, entradas):
+        tentativa = formas[entrada]
+        exibida = entrada if isinstance(palavra, str) else palavra  # Valor não textual volta como veio
+
+        if tentativa == False:
+            erro = MENSAGENS_REGISTRO[sessoes.FINALIZADA] if finalizou else "Palavra desconhecida ou inválida! Verifique a ortografia."
+            resultados.append({"palavra": exibida, "erro": erro})
+            continue
+
+        resultado = next(registros)
+        if resultado != sessoes.REGISTRADA:
+            finalizou = finalizou or resultado == sessoes.FINALIZADA
+            resultados.append({"palavra": exibida, "erro": MENSAGENS_REGISTRO[resultado]})
+            continue
+
+        posicao, similaridade, venceu = pontuacoes[tentativa]
+        finalizou = finalizou or venceu
+        resultados.append({
+            "palavra": exibida,
+            "similaridade": similaridade,
+            "posicao": posicao,
+            "venceu": venceu,
+            "palavra_exibida": tentativa,
+            "palavra_secreta": puzzle.palavra_secreta if venceu else None,
+        })
+
+    venceu = sessao.finalizado
+    print(f"🎯 Lote: {len(entradas)} tentativas | Venceu: {venceu}")
+
+    response = {
+        "resultados": resultados,
+        "venceu": venceu,
+        "total_tentativas": len(sessao)
+    }
+
+    if venceu:
+        tempo_reset = obter_proximo_reset()
+        response["tempo_proximo"] = formatar_tempo_restante(tempo_reset)
+
+    return jsonify(response)
+
 @main_bp.route('/reiniciar', methods=['POST'])
 def reiniciar():
     """Não permite reiniciar - apenas no dia seguinte"""
@@ -514,31 +294,95 @@ def reiniciar():
 @main_bp.route('/stats', methods=['GET'])
 def stats():
     """Retorna estatísticas do jogo atual"""
-    verificar_reset_diario()
+    puzzle = verificar_reset_diario()
+    sessao = obter_sessao(puzzle)
     
     tempo_reset = obter_proximo_reset()
     tempo_restante = formatar_tempo_restante(tempo_reset)
     
     return jsonify({
-        "total_tentativas": len(tentativas_historico),
-        "jogo_finalizado": jogo_finalizado,
-        "palavras_no_modelo": len(word2vec) if word2vec else 0,
-        "data_palavra": str(data_palavra),
+        "total_tentativas": len(sessao),
+        "jogo_finalizado": sessao.finalizado,
+        "palavras_no_modelo": len(jogo.word2vec) if jogo.word2vec else 0,
+        "data_palavra": str(puzzle.data),
         "proximo_reset": tempo_restante
     })
 
 @main_bp.route('/desistir', methods=['POST'])
 def desistir():
     """Revela a palavra secreta quando o jogador desiste"""
-    global jogo_finalizado
-    verificar_reset_diario()
+    puzzle = verificar_reset_diario()
+    sessao = obter_sessao(puzzle)
     
-    jogo_finalizado = True
+    sessao.finalizado = True
     tempo_reset = obter_proximo_reset()
     tempo_restante = formatar_tempo_restante(tempo_reset)
     
     return jsonify({
-        "palavra_secreta": palavra_secreta,
-        "total_tentativas": len(tentativas_historico),
+        "palavra_secreta": puzzle.palavra_secreta,
+        "total_tentativas": len(sessao),
         "tempo_proximo": tempo_restante
-    })
\ No newline at end of file
+    })
+
+# 🗄️ Arquivo: puzzles de dias anteriores (lidos do disco, sem recalcular)
+MAX_PUZZLES_ARQUIVO = 8
+puzzles_arquivo = cache_lru.novo_cache("puzzles_arquivo", MAX_PUZZLES_ARQUIVO)
+
+def carregar_arquivo(data):
+    """
+    Puzzle de um dia anterior. Um puzzle salvo não muda (nem quando as
+    listas são recarregadas, ver jogo.chave_puzzles), então a chave é só a
+    data; datas ainda não pré-calculadas não são guardadas, para aparecerem
+    assim que existirem.
+    """
+    puzzle = puzzles_arquivo.obter(data, None)
+    if puzzle is None:
+        puzzle = carregar_puzzle_salvo(data)
+        if puzzle is not None:
+            puzzles_arquivo.guardar(data, puzzle)
+    return puzzle
+
+def obter_data_arquivo(texto):
+    """Converte 'AAAA-MM-DD' em data. Hoje e datas futuras não fazem parte do arquivo"""
+    try:
+        data = date.fromisoformat(texto)
+    except ValueError:
+        return None
+
+    if data >= datetime.now().date():
+        return None
+    return data
+
+@main_bp.route('/arquivo', methods=['GET'])
+def arquivo():
+    """Lista as datas anteriores disponíveis no arquivo"""
+    hoje = datetime.now().date()
+    datas = jogo.armazem_puzzles.datas() if jogo.armazem_puzzles else []
+
+    return jsonify({
+        "datas": [d.isoformat() for d in datas if d < hoje]
+    })
+
+@main_bp.route('/arquivo/<data>/tentar', methods=['POST'])
+def tentar_arquivo(data):
+    """Processa uma tentativa para o puzzle de um dia anterior"""
+    data = obter_data_arquivo(data)
+    puzzle = carregar_arquivo(data) if data else None
+
+    if puzzle is None:
+        return jsonify({"erro": "Puzzle não disponível no arquivo."}), 404
+
+    tentativa = validar_palavra(request.json.get('palavra', '').lower().strip())
+    if tentativa == False:
+        return jsonify({"erro": "Palavra desconhecida ou inválida! Verifique a ortografia."})
+
+    posicao, similaridade, venceu = pontuar_tentativa(puzzle, tentativa)
+
+    return jsonify({
+        "similaridade": similaridade,
+        "posicao": posicao,
+        "venceu": venceu,
+        "palavra_exibida": tentativa,
+        "palavra_secreta": puzzle.palavra_secreta if venceu else None,
+        "data_palavra": str(puzzle.data)
+    })
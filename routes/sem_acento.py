@@ -0,0 +1,148 @@
+import os
+import sys
+import unicodedata
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+from routes import indice_palavras
+
+
+
+# REMOÇÃO DE ACENTOS (mesmo resultado do NFD + filtro de marcas, sem o custo por letra)
+def _remover_marcas(texto):
+    return "".join(c for c in unicodedata.normalize("NFD", texto) if unicodedata.category(c) != "Mn")
+
+# Letras latinas acentuadas (Latin-1 e Latin Extended A/B) -> sem acento, calculado uma vez
+TABELA_SEM_ACENTO = str.maketrans({
+    chr(c): _remover_marcas(chr(c))
+    for c in range(0x80, 0x250)
+    if _remover_marcas(chr(c)) != chr(c)
+})
+
+def dobrar(texto):
+    """Minúsculas, sem espaços nas pontas e sem acentos ('Memória ' -> 'memoria')"""
+    texto = texto.lower().strip()
+    if texto.isascii():
+        return texto
+
+    texto = texto.translate(TABELA_SEM_ACENTO)
+    if texto.isascii():
+        return texto
+
+    # Outros alfabetos ou marcas soltas: caminho completo
+    return _remover_marcas(texto)
+
+
+
+# ÍNDICE FORMA SEM ACENTO -> ID NO VOCABULÁRIO
+class IndiceSemAcento:
+    """
+    Resolve uma palavra digitada para o id dela no vocabulário do modelo:
+
+    indice     IndicePalavras com as formas sem acento das entradas do vocabulário
+    canonicos  int32: id da forma sem acento -> id da entrada escolhida
+
+    Colisões ('memória' e 'memoria' viram 'memoria'): vence a entrada já sem
+    acento; se não houver, a mais frequente (menor id, o vocabulário vem
+    ordenado por frequência). Entradas com maiúsculas ou espaços nas pontas
+    ficam de fora (nunca foram aceitas como tentativa).
+    """
+
+    def __init__(self, indice, canonicos, chave_para_indice=None, chave=None):
+        self.indice = indice
+        self.canonicos = canonicos
+        self.chave_para_indice = chave_para_indice if chave_para_indice is not None else {}
+        self.chave = chave
+
+        self._canonicos = memoryview(canonicos)
+
+    def __len__(self):
+        return len(self.canonicos)
+
+    def id_de(self, palavra):
+        """
+        Id no vocabulário ou -1. A forma digitada, se estiver no vocabulário,
+        vence a forma sem acento (quem digitou 'memória' recebe 'memória').
+        """
+        id_palavra = self.chave_para_indice.get(palavra)
+        if id_palavra is not None:
+            return id_palavra
+
+        id_forma = self.indice.id_de(dobrar(palavra))
+        return self._canonicos[id_forma] if id_forma >= 0 else -1
+
+    def ids(self, palavras):
+        """id_de de várias palavras (int64, -1 para as desconhecidas)"""
+        return np.fromiter((self.id_de(p) for p in palavras), dtype=np.int64, count=len(palavras))
+
+def construir_indice(vocabulario):
+    """Uma passada pelo vocabulário; a primeira entrada de cada forma é a mais frequente"""
+    escolhidos = {}
+    for id_palavra, palavra in enumerate(vocabulario):
+        if palavra != palavra.lower().strip():
+            continue
+
+        # A entrada sem acento substitui uma acentuada vista antes
+        forma = dobrar(palavra)
+        if forma == palavra or forma not in escolhidos:
+            escolhidos[forma] = id_palavra
+
+    indice = indice_palavras.IndicePalavras.a_partir_de_palavras(escolhidos)
+    canonicos = np.fromiter((escolhidos[f] for f in indice), dtype=np.int32, count=len(indice))
+    return IndiceSemAcento(indice, canonicos)
+
+
+
+# PERSISTÊNCIA EM DISCO
+def salvar(diretorio, indice_sem_acento):
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    indice_palavras.salvar(os.path.join(temporario, "formas"), indice_sem_acento.indice)
+    np.save(os.path.join(temporario, "canonicos.npy"), indice_sem_acento.canonicos)
+
+    os.replace(temporario, diretorio)
+
+def carregar(diretorio, chave_para_indice=None, chave=None):
+    indice = indice_palavras.carregar(os.path.join(diretorio, "formas"))
+    canonicos = np.load(os.path.join(diretorio, "canonicos.npy"), mmap_mode="r")
+    return IndiceSemAcento(indice, canonicos, chave_para_indice, chave)
+
+def obter_indice_sem_acento(vocabulario, chave_para_indice, chave_modelo):
+    """Índice em artefatos/ (chave: modelo e esta regra); calculado só na primeira vez"""
+    chave = artefatos.calcular_hash(caminhos=[__file__], textos=[chave_modelo])
+    diretorio = artefatos.caminho_artefato("sem_acento", chave)
+
+    if os.path.isdir(diretorio):
+        indice = carregar(diretorio, chave_para_indice, chave)
+        print(f"🔡 Índice sem acento carregado: {len(indice)} formas")
+        return indice
+
+    print("🔡 Calculando índice sem acento do vocabulário (passo único)...")
+    indice = construir_indice(vocabulario)
+    indice.chave_para_indice = chave_para_indice
+    indice.chave = chave
+
+    try:
+        salvar(diretorio, indice)
+        artefatos.remover_versoes_antigas("sem_acento", diretorio)
+        indice = carregar(diretorio, chave_para_indice, chave)
+        print(f"💾 Índice sem acento salvo em {diretorio}: {len(indice)} formas")
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar o índice sem acento: {e}")
+
+    return indice
+
+
+
+# PASSO OFFLINE: python -m routes.sem_acento
+if __name__ == "__main__":
+    from routes import model_loader
+    word2vec = model_loader.carregar_modelo()
+
+    if word2vec is None:
+        print("❌ Modelo não carregado; nada a fazer.")
+        sys.exit(1)
+
+    obter_indice_sem_acento(word2vec.index_to_key, word2vec.key_to_index, model_loader.chave_modelo_compilado())
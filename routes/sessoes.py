@@ -0,0 +1,341 @@
+import os
+import secrets
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+import numpy as np
+
+try:
+    import fcntl  # Trava entre processos (gunicorn); no Windows só há um processo
+except ImportError:
+    fcntl = None
+
+# Arquivos auxiliares
+from routes import artefatos
+
+
+
+# CONFIGURAÇÃO (pode ser trocada por variáveis de ambiente)
+TTL_SESSAO = int(os.environ.get("CONTEXTO_SESSOES_TTL", 24 * 3600))   # segundos sem uso
+MAX_TENTATIVAS = int(os.environ.get("CONTEXTO_SESSOES_MAX_TENTATIVAS", 2000))
+MEMORIA_SESSOES = int(os.environ.get("CONTEXTO_SESSOES_MEMORIA_MB", 64)) * 1024 * 1024  # bytes
+
+# Arquivo compartilhado por todos os workers (precisa estar em disco local)
+CAMINHO_SESSOES = os.environ.get(
+    "CONTEXTO_SESSOES_ARQUIVO", os.path.join(artefatos.DIRETORIO_ARTEFATOS, "sessoes.bin")
+)
+
+NOME_COOKIE = "contexto_sessao"
+
+# Tabela de espalhamento do histórico: potência de 2 com ao menos o dobro de
+# MAX_TENTATIVAS (ocupação <= 50%, poucas sondagens). Guarda posição + 1 no
+# histórico (0 = vazio), então cabe em uint16 enquanto MAX_TENTATIVAS < 65535.
+TAMANHO_TABELA = 1 << (2 * MAX_TENTATIVAS - 1).bit_length()
+MASCARA_TABELA = TAMANHO_TABELA - 1
+TIPO_TABELA = np.uint16 if MAX_TENTATIVAS < 0xFFFF else np.uint32
+
+# Um registro de tamanho fixo por sessão
+REGISTRO = np.dtype([
+    ("token", np.uint8, (16,)),                     # Bytes aleatórios (o cookie leva o hex)
+    ("data", "<i4"),                                # Data da palavra do dia (ordinal)
+    ("finalizado", np.uint8),
+    ("total", "<i4"),                               # Tentativas usadas no histórico
+    ("ultimo_acesso", "<f8"),                       # time.time(): o mesmo relógio em todos os processos
+    ("anterior", "<i4"),                            # Lista LRU (-1 = ponta)
+    ("proximo", "<i4"),
+    ("historico", "<i4", (MAX_TENTATIVAS,)),        # Chaves em ordem de tentativa
+    ("tabela", TIPO_TABELA, (TAMANHO_TABELA,)),     # chave -> posição no histórico
+])
+BYTES_POR_SESSAO = REGISTRO.itemsize
+
+# Cabeçalho (int64): identificação do formato + contadores e lista LRU compartilhados
+MAGICO = 0x53455353  # 'SESS'
+TAMANHO_CABECALHO = 16
+CRIADAS, REMOVIDAS_TTL, REMOVIDAS_LRU = 4, 5, 6
+MAIS_RECENTE, MENOS_RECENTE, USADOS = 7, 8, 9
+
+# Resultado de SessaoJogador.registrar
+REGISTRADA = "registrada"
+REPETIDA = "repetida"
+LIMITE = "limite"
+FINALIZADA = "finalizada"
+
+
+
+# SESSÃO DE UM JOGADOR (visão de um registro do armazém)
+class SessaoJogador:
+    """
+    Estado de um jogador para a palavra do dia, lido e escrito direto no
+    registro do armazém (todos os workers veem a mesma sessão).
+
+    historico: int32 com espaço para MAX_TENTATIVAS chaves, das quais as
+    'total' primeiras são as tentativas em ordem. A chave é o id da palavra no
+    vocabulário ou, fora dele, um id negativo (chave_fora_do_vocabulario).
+    tabela: endereçamento aberto chave -> posição no histórico, para saber se
+    a palavra já foi tentada em O(1). Se o registro for reaproveitado por
+    outra sessão (LRU), esta passa a ficar vazia e não grava mais nada.
+    """
+
+    __slots__ = ("armazem", "slot", "token")
+
+    def __init__(self, armazem, slot, token):
+        self.armazem = armazem
+        self.slot = slot
+        self.token = token
+
+    def __len__(self):
+        with self.armazem.travar() as registros:
+            return int(registros["total"][self.slot]) if self._valida(registros) else 0
+
+    def _valida(self, registros):
+        return registros["token"][self.slot].tobytes() == self.token
+
+    @property
+    def finalizado(self):
+        with self.armazem.travar() as registros:
+            return self._valida(registros) and bool(registros["finalizado"][self.slot])
+
+    @finalizado.setter
+    def finalizado(self, valor):
+        with self.armazem.travar() as registros:
+            if self._valida(registros):
+                registros["finalizado"][self.slot] = bool(valor)
+
+    def ja_tentou(self, chave):
+        with self.armazem.travar() as registros:
+            if not self._valida(registros):
+                return False
+            registro = registros[self.slot]
+            return _procurar(registro["tabela"], registro["historico"], chave)[1]
+
+    def registrar(self, chave, venceu=False):
+        """
+        Confere e grava a tentativa sob uma única trava (dois pedidos ao mesmo
+        tempo não gravam a mesma palavra duas vezes). Retorna REGISTRADA,
+        REPETIDA, LIMITE ou FINALIZADA; com venceu, finaliza o jogo.
+        """
+        return self.registrar_lote([(chave, venceu)])[0]
+
+    def registrar_lote(self, tentativas):
+        """registrar para [(chave, venceu), ...] em ordem, tudo sob uma única trava"""
+        with self.armazem.travar() as registros:
+            if not self._valida(registros):
+                return [LIMITE] * len(tentativas)
+
+            registro = registros[self.slot]
+            tabela, historico = registro["tabela"], registro["historico"]
+            finalizado = bool(registro["finalizado"])
+            total = int(registro["total"])
+
+            resultados = []
+            for chave, venceu in tentativas:
+                if finalizado:
+                    resultados.append(FINALIZADA)
+                    continue
+
+                posicao, repetida = _procurar(tabela, historico, chave)
+                if repetida:
+                    resultados.append(REPETIDA)
+                elif total >= MAX_TENTATIVAS:
+                    resultados.append(LIMITE)
+                else:
+                    historico[total] = chave
+                    total += 1
+                    tabela[posicao] = total
+                    finalizado = bool(venceu)
+                    resultados.append(REGISTRADA)
+
+            registro["total"] = total
+            registro["finalizado"] = finalizado
+            return resultados
+
+def _procurar(tabela, historico, chave):
+    """(posição na tabela, já existe): sondagem linear a partir do hash da chave"""
+    posicao = ((chave * 0x9E3779B1) >> 16) & MASCARA_TABELA
+    while True:
+        indice = int(tabela[posicao])
+        if indice == 0:
+            return posicao, False
+        if historico[indice - 1] == chave:
+            return posicao, True
+        posicao = (posicao + 1) & MASCARA_TABELA
+
+def chave_fora_do_vocabulario(palavra):
+    """Chave int32 negativa para uma palavra sem id no vocabulário (crc32 de 31 bits)"""
+    return -(zlib.crc32(palavra.encode("utf-8")) & 0x7FFFFFFF) - 1
+
+
+
+# ARMAZÉM DE SESSÕES (arquivo via mmap, compartilhado entre os workers)
+class ArmazemSessoes:
+    """
+    Registros de tamanho fixo em um arquivo aberto via mmap por cada processo:
+    os workers do gunicorn (e as threads de cada um) veem as mesmas sessões,
+    então uma requisição pode cair em qualquer worker. Cada operação roda sob
+    uma trava de thread + flock no arquivo.
+
+    O cookie é '<registro>.<token em hex>': achar a sessão é O(1). Os registros
+    em uso formam uma lista duplamente ligada em ordem de acesso (anterior /
+    proximo + pontas no cabeçalho): uma sessão nova ocupa um registro nunca
+    usado ou, com tudo ocupado, o da ponta menos recente (expirado pelo TTL ou
+    não), também em O(1). Memória: o número de registros sai de
+    memoria_maxima / BYTES_POR_SESSAO e o arquivo nunca passa disso.
+    """
+
+    def __init__(self, caminho=CAMINHO_SESSOES, memoria_maxima=MEMORIA_SESSOES, ttl=TTL_SESSAO):
+        self.caminho = caminho
+        self.memoria_maxima = memoria_maxima
+        self.max_sessoes = max(1, memoria_maxima // BYTES_POR_SESSAO)
+        self.ttl = ttl
+
+        self.trava = threading.Lock()
+        self._pid = None
+        self._arquivo = None
+        self._cabecalho = None
+        self._registros = None
+
+    def __len__(self):
+        return self.estatisticas()["ativas"]
+
+    def _abrir(self):
+        """Abre o arquivo uma vez por processo (depois do fork o flock precisa de um descritor próprio)"""
+        if self._pid == os.getpid():
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+        arquivo = os.open(self.caminho, os.O_RDWR | os.O_CREAT, 0o600)
+        tamanho = TAMANHO_CABECALHO * 8 + self.max_sessoes * BYTES_POR_SESSAO
+        formato = [MAGICO, BYTES_POR_SESSAO, self.max_sessoes, MAX_TENTATIVAS]
+
+        if fcntl is not None:
+            fcntl.flock(arquivo, fcntl.LOCK_EX)
+        try:
+            cabecalho = np.fromfile(self.caminho, dtype="<i8", count=TAMANHO_CABECALHO)
+            if os.fstat(arquivo).st_size != tamanho or cabecalho[:4].tolist() != formato:
+                # Arquivo novo ou de outra configuração: começa vazio
+                os.ftruncate(arquivo, 0)
+                os.ftruncate(arquivo, tamanho)
+                # Pelo mmap (os.pwrite não existe no Windows)
+                novo = np.memmap(self.caminho, dtype="<i8", mode="r+", shape=(TAMANHO_CABECALHO,))
+                novo[:4] = formato
+                novo[MAIS_RECENTE] = novo[MENOS_RECENTE] = -1
+                novo.flush()
+                del novo
+        finally:
+            if fcntl is not None:
+                fcntl.flock(arquivo, fcntl.LOCK_UN)
+
+        self._cabecalho = np.memmap(self.caminho, dtype="<i8", mode="r+", shape=(TAMANHO_CABECALHO,))
+        self._registros = np.memmap(
+            self.caminho, dtype=REGISTRO, mode="r+", offset=TAMANHO_CABECALHO * 8, shape=(self.max_sessoes,)
+        )
+        self._arquivo = arquivo
+        self._pid = os.getpid()
+
+    @contextmanager
+    def travar(self):
+        """Acesso exclusivo aos registros (entre threads e entre processos)"""
+        with self.trava:
+            self._abrir()
+            if fcntl is not None:
+                fcntl.flock(self._arquivo, fcntl.LOCK_EX)
+            try:
+                yield self._registros
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._arquivo, fcntl.LOCK_UN)
+
+    def obter(self, token, data):
+        """
+        Retorna (token, sessão). Cria uma sessão nova se o token não existir
+        (ou tiver expirado) e reinicia a sessão se a palavra do dia mudou.
+        """
+        agora = time.time()
+
+        with self.travar() as registros:
+            slot, chave = self._localizar(registros, token, agora)
+            if slot is None:
+                slot = self._liberar_registro(registros, agora)
+                chave = secrets.token_bytes(16)
+                registros["token"][slot] = np.frombuffer(chave, dtype=np.uint8)
+                self._reiniciar(registros, slot, data)
+                self._cabecalho[CRIADAS] += 1
+                token = f"{slot}.{chave.hex()}"
+            else:
+                self._desligar(registros, slot)
+                if registros["data"][slot] != data.toordinal():
+                    # Nova palavra do dia: zera histórico e resultado
+                    self._reiniciar(registros, slot, data)
+
+            registros["ultimo_acesso"][slot] = agora
+            self._ligar_no_inicio(registros, slot)
+            return token, SessaoJogador(self, slot, chave)
+
+    def _reiniciar(self, registros, slot, data):
+        registros["data"][slot] = data.toordinal()
+        registros["finalizado"][slot] = 0
+        registros["total"][slot] = 0
+        registros["tabela"][slot] = 0
+
+    def _localizar(self, registros, token, agora):
+        """(registro, bytes do token) da sessão do cookie, ou (None, None)"""
+        try:
+            texto_slot, texto_chave = (token or "").split(".", 1)
+            slot, chave = int(texto_slot), bytes.fromhex(texto_chave)
+        except ValueError:
+            return None, None
+
+        if not 0 <= slot < min(len(registros), self._cabecalho[USADOS]) or len(chave) != 16:
+            return None, None
+        if registros["token"][slot].tobytes() != chave or agora - registros["ultimo_acesso"][slot] > self.ttl:
+            return None, None
+        return slot, chave
+
+    def _liberar_registro(self, registros, agora):
+        """Registro nunca usado ou, com todos ocupados, o da ponta menos recente (fora da lista)"""
+        usados = int(self._cabecalho[USADOS])
+        if usados < len(registros):
+            self._cabecalho[USADOS] = usados + 1
+            return usados
+
+        slot = int(self._cabecalho[MENOS_RECENTE])
+        self._desligar(registros, slot)
+        acesso = registros["ultimo_acesso"][slot]
+        self._cabecalho[REMOVIDAS_TTL if agora - acesso > self.ttl else REMOVIDAS_LRU] += 1
+        return slot
+
+    def _desligar(self, registros, slot):
+        anterior, proximo = int(registros["anterior"][slot]), int(registros["proximo"][slot])
+        if anterior >= 0:
+            registros["proximo"][anterior] = proximo
+        else:
+            self._cabecalho[MAIS_RECENTE] = proximo
+        if proximo >= 0:
+            registros["anterior"][proximo] = anterior
+        else:
+            self._cabecalho[MENOS_RECENTE] = anterior
+
+    def _ligar_no_inicio(self, registros, slot):
+        primeiro = int(self._cabecalho[MAIS_RECENTE])
+        registros["anterior"][slot] = -1
+        registros["proximo"][slot] = primeiro
+        if primeiro >= 0:
+            registros["anterior"][primeiro] = slot
+        else:
+            self._cabecalho[MENOS_RECENTE] = slot
+        self._cabecalho[MAIS_RECENTE] = slot
+
+    def estatisticas(self):
+        agora = time.time()
+        with self.travar() as registros:
+            ativas = int(np.count_nonzero(registros["ultimo_acesso"] >= agora - self.ttl))
+            return {
+                "ativas": ativas,
+                "max_sessoes": self.max_sessoes,
+                "memoria_bytes": self.max_sessoes * BYTES_POR_SESSAO,
+                "memoria_maxima": self.memoria_maxima,
+                "criadas": int(self._cabecalho[CRIADAS]),
+                "removidas_ttl": int(self._cabecalho[REMOVIDAS_TTL]),
+                "removidas_lru": int(self._cabecalho[REMOVIDAS_LRU]),
+            }
@@ -0,0 +1,195 @@
+import os
+import sys
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+from routes import medicao
+
+
+
+# CONFIGURAÇÃO (pode ser trocada por variáveis de ambiente)
+# Modelo fastText binário (.bin) com a matriz de n-gramas original, se houver uma cópia local
+CAMINHO_FASTTEXT_BIN = os.environ.get("CONTEXTO_FASTTEXT_BIN", "")
+
+# Sem o .bin, a matriz é derivada do vocabulário (menos buckets que os 2 milhões do fastText)
+BUCKETS = int(os.environ.get("CONTEXTO_NGRAMAS_BUCKETS", 1 << 17))
+MIN_N = 3
+MAX_N = 6
+PALAVRAS_POR_BLOCO = 2000  # Palavras somadas por vez na derivação (limita o pico de memória)
+
+
+
+# N-GRAMAS DE CARACTERES (mesmo hash e mesmos n-gramas do fastText / gensim)
+def hash_fasttext(ngrama):
+    """FNV-1a de 32 bits sobre os bytes UTF-8, com o byte lido como char com sinal (como no fastText)"""
+    h = 2166136261
+    for byte in ngrama.encode("utf-8"):
+        h ^= byte if byte < 128 else byte | 0xFFFFFF00
+        h = (h * 16777619) & 0xFFFFFFFF
+    return h
+
+def ngramas(palavra, min_n=MIN_N, max_n=MAX_N):
+    """'<casa>' -> '<ca', 'cas', 'asa', 'sa>', '<cas', ..., '<casa>'"""
+    estendida = f"<{palavra}>"
+    return [
+        estendida[i:i + n]
+        for n in range(min_n, min(len(estendida), max_n) + 1)
+        for i in range(len(estendida) - n + 1)
+    ]
+
+
+
+# VETORES POR SUBPALAVRAS (palavras fora do vocabulário)
+class VetoresSubpalavras:
+    """
+    Matriz de n-gramas (buckets x dimensões, aberta via mmap): o vetor de
+    uma palavra é a soma das linhas dos buckets dos seus n-gramas, normalizada.
+    """
+
+    def __init__(self, vetores, min_n=MIN_N, max_n=MAX_N, origem=""):
+        self.vetores = vetores
+        self.min_n = min_n
+        self.max_n = max_n
+        self.origem = origem
+
+    def ids(self, palavra):
+        buckets = len(self.vetores)
+        return sorted({hash_fasttext(n) % buckets for n in ngramas(palavra, self.min_n, self.max_n)})
+
+    def vetor(self, palavra):
+        """Vetor normalizado (float32) ou None se nenhum n-grama tem vetor"""
+        ids = self.ids(palavra)
+        if not ids:
+            return None
+
+        vetor = self.vetores[ids].astype(np.float32).sum(axis=0)
+        norma = np.linalg.norm(vetor)
+        if norma == 0:
+            return None
+        return vetor / norma
+
+def derivar_de_palavras(palavras, vetores, buckets=BUCKETS, min_n=MIN_N, max_n=MAX_N):
+    """
+    Passo offline sem o .bin: cada bucket recebe a média dos vetores das
+    palavras do vocabulário que têm um n-grama nele. Palavras novas herdam
+    o sentido das palavras com as mesmas subpalavras.
+    """
+    dimensoes = vetores.shape[1]
+    somas = np.zeros((buckets, dimensoes), dtype=np.float32)
+    contagens = np.zeros(buckets, dtype=np.int64)
+
+    for inicio in range(0, len(palavras), PALAVRAS_POR_BLOCO):
+        ids_bucket, ids_palavra = [], []
+        for i, palavra in enumerate(palavras[inicio:inicio + PALAVRAS_POR_BLOCO], start=inicio):
+            for bucket in {hash_fasttext(n) % buckets for n in ngramas(palavra, min_n, max_n)}:
+                ids_bucket.append(bucket)
+                ids_palavra.append(i)
+
+        if not ids_bucket:
+            continue
+
+        # Soma em rodadas: na rodada r entra a r-ésima ocorrência de cada bucket,
+        # então os índices de uma rodada não se repetem e o '+=' vetorizado é seguro
+        ids_bucket = np.array(ids_bucket, dtype=np.int64)
+        ids_palavra = np.array(ids_palavra, dtype=np.int64)
+        ordem = np.argsort(ids_bucket, kind="stable")
+        ids_bucket, ids_palavra = ids_bucket[ordem], ids_palavra[ordem]
+
+        unicos, comecos, quantidades = np.unique(ids_bucket, return_index=True, return_counts=True)
+        rodada = np.arange(len(ids_bucket)) - np.repeat(comecos, quantidades)
+        for r in range(int(rodada.max()) + 1):
+            selecionados = rodada == r
+            somas[ids_bucket[selecionados]] += vetores[ids_palavra[selecionados]]
+        contagens[unicos] += quantidades
+
+    usados = contagens > 0
+    somas[usados] /= contagens[usados, None]
+    normas = np.linalg.norm(somas, axis=1, keepdims=True)
+    normas[normas == 0] = 1
+    somas /= normas
+
+    return VetoresSubpalavras(somas.astype(np.float16), min_n, max_n, "derivado do vocabulário")
+
+def importar_fasttext_bin(caminho):
+    """Matriz de n-gramas original de um modelo fastText binário (ex.: NILC skip-gram .bin)"""
+    from gensim.models.fasttext import load_facebook_vectors
+
+    modelo = load_facebook_vectors(caminho)
+    return VetoresSubpalavras(
+        np.asarray(modelo.vectors_ngrams, dtype=np.float32), modelo.min_n, modelo.max_n, "fastText .bin"
+    )
+
+
+
+# PERSISTÊNCIA EM DISCO
+def salvar(diretorio, subpalavras):
+    temporario = diretorio + ".tmp"
+    os.makedirs(temporario, exist_ok=True)
+
+    np.save(os.path.join(temporario, "ngramas.npy"), subpalavras.vetores)
+    with open(os.path.join(temporario, "parametros.txt"), "w", encoding="utf-8") as f:
+        f.write(f"{subpalavras.min_n}\n{subpalavras.max_n}\n{subpalavras.origem}")
+
+    os.replace(temporario, diretorio)
+
+def carregar(diretorio):
+    with open(os.path.join(diretorio, "parametros.txt"), "r", encoding="utf-8") as f:
+        min_n, max_n, origem = f.read().split("\n")
+
+    vetores = np.load(os.path.join(diretorio, "ngramas.npy"), mmap_mode="r")
+    return VetoresSubpalavras(vetores, int(min_n), int(max_n), origem)
+
+def obter_vetores_subpalavras(palavras, vetores, chave_modelo, construir=True):
+    """
+    Matriz de n-gramas em artefatos/: importada do .bin local (CONTEXTO_FASTTEXT_BIN)
+    ou derivada do vocabulário (passo offline, python -m routes.subpalavras);
+    depois só aberta via mmap. Com construir=False só abre uma matriz já gerada
+    (None se não houver): o jogo não paga a derivação na inicialização.
+    """
+    if CAMINHO_FASTTEXT_BIN and os.path.exists(CAMINHO_FASTTEXT_BIN):
+        estado = os.stat(CAMINHO_FASTTEXT_BIN)
+        textos = [os.path.abspath(CAMINHO_FASTTEXT_BIN), estado.st_size, estado.st_mtime_ns]
+    else:
+        textos = [chave_modelo, BUCKETS, MIN_N, MAX_N]
+
+    # __file__: uma mudança no hash ou nos n-gramas gera outra matriz
+    diretorio = artefatos.caminho_artefato("ngramas", artefatos.calcular_hash(caminhos=[__file__], textos=textos))
+    if os.path.isdir(diretorio):
+        subpalavras = carregar(diretorio)
+        print(f"🧩 N-gramas carregados ({subpalavras.origem}): {len(subpalavras.vetores)} buckets")
+        return subpalavras
+
+    if not construir:
+        return None
+
+    if CAMINHO_FASTTEXT_BIN and os.path.exists(CAMINHO_FASTTEXT_BIN):
+        with medicao.fase("subpalavras.importar_bin"):
+            subpalavras = importar_fasttext_bin(CAMINHO_FASTTEXT_BIN)
+    else:
+        print("🧩 Derivando a matriz de n-gramas do vocabulário (passo único)...")
+        with medicao.fase("subpalavras.derivar"):
+            subpalavras = derivar_de_palavras(palavras, vetores)
+
+    try:
+        salvar(diretorio, subpalavras)
+        artefatos.remover_versoes_antigas("ngramas", diretorio)
+        subpalavras = carregar(diretorio)
+        print(f"💾 N-gramas salvos em {diretorio} ({subpalavras.origem})")
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar a matriz de n-gramas: {e}")
+
+    return subpalavras
+
+
+
+# PASSO OFFLINE: python -m routes.subpalavras
+if __name__ == "__main__":
+    from routes import model_loader
+    word2vec = model_loader.carregar_modelo()
+
+    if word2vec is None:
+        print("❌ Modelo não carregado; nada a fazer.")
+        sys.exit(1)
+
+    obter_vetores_subpalavras(word2vec.index_to_key, word2vec.vectors, model_loader.chave_modelo_compilado())
@@ -0,0 +1,151 @@
+import os
+import sys
+import numpy as np
+
+# Arquivos auxiliares
+from routes import artefatos
+from routes import input_filter
+
+
+
+# MAPA DE VALIDADE DO VOCABULÁRIO
+class MapaValidade:
+    """
+    Resultado pré-computado de palavra_existe + esta_em_dicionario para cada
+    palavra do vocabulário do modelo.
+
+    mascara: array booleano (uma posição por id do vocabulário).
+    excecoes: {id: forma aceita} apenas para as palavras cuja forma aceita é
+    diferente da palavra do vocabulário (nas demais a forma é a própria palavra).
+    """
+
+    def __init__(self, chave_para_indice, mascara, excecoes=None, chave=None):
+        self.chave_para_indice = chave_para_indice
+        self.mascara = mascara
+        self.excecoes = excecoes or {}
+        self.chave = chave  # Hash das entradas (identifica a versão do mapa)
+
+    def __len__(self):
+        return len(self.mascara)
+
+    def consultar(self, palavra):
+        """
+        Retorna a forma aceita, False se a palavra do vocabulário foi recusada
+        ou None se a palavra não está no vocabulário (precisa da validação ao vivo).
+        """
+        indice = self.chave_para_indice.get(palavra)
+        if indice is None:
+            return None
+
+        if not self.mascara[indice]:
+            return False
+
+        return self.excecoes.get(indice, palavra)
+
+def calcular_validade(vocabulario, validar, em_lote=False):
+    """
+    Aplica a validação a todo o vocabulário (passo offline e lento).
+    validar recebe uma palavra ou, com em_lote=True, a lista inteira.
+    """
+    mascara = np.zeros(len(vocabulario), dtype=bool)
+    excecoes = {}
+
+    formas = validar(vocabulario) if em_lote else map(validar, vocabulario)
+    for i, (palavra, forma) in enumerate(zip(vocabulario, formas)):
+        if forma != False:
+            mascara[i] = True
+            if forma != palavra:
+                excecoes[i] = forma
+
+    return mascara, excecoes
+
+
+
+# PERSISTÊNCIA EM DISCO
+def chave_validade(vocabulario):
+    """Hash do vocabulário, das listas de palavras e das versões dos dicionários"""
+    return artefatos.calcular_hash(
+        caminhos=[
+            input_filter.CAMINHO_ARQUIVO,
+            input_filter.CAMINHO_TECH,
+            input_filter.CAMINHO_DIC,
+            input_filter.CAMINHO_AFF,
+        ],
+        textos=[
+            "\n".join(vocabulario),
+            artefatos.versao_pacote("wordfreq"),
+            artefatos.versao_pacote("pyspellchecker"),
+            artefatos.versao_pacote("hunspell"),
+        ],
+    )
+
+def salvar_validade(caminho, mascara, excecoes):
+    """Grava a máscara como bitmap (1 bit por palavra) + lista de exceções"""
+    ids = np.array(sorted(excecoes), dtype=np.int32)
+    formas = np.array([excecoes[i] for i in ids.tolist()], dtype=str)
+
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as f:
+        np.savez(
+            f,
+            bitmap=np.packbits(mascara),
+            tamanho=np.int64(len(mascara)),
+            excecoes_ids=ids,
+            excecoes_formas=formas,
+        )
+    os.replace(temporario, caminho)
+
+def carregar_validade(caminho):
+    """Lê o bitmap salvo e devolve (mascara, excecoes)"""
+    with np.load(caminho, allow_pickle=False) as dados:
+        tamanho = int(dados["tamanho"])
+        mascara = np.unpackbits(dados["bitmap"], count=tamanho).astype(bool)
+        excecoes = dict(zip(dados["excecoes_ids"].tolist(), dados["excecoes_formas"].tolist()))
+    return mascara, excecoes
+
+def obter_mapa_validade(vocabulario, chave_para_indice=None, validar=None, validar_lote=None):
+    """
+    Carrega o mapa de validade do disco. Se ele não existir (ou se o vocabulário,
+    as listas de palavras ou os dicionários mudaram), recalcula e salva.
+    validar valida uma palavra; validar_lote, uma lista (padrão: dicionario.validar_lote).
+    """
+    if chave_para_indice is None:
+        chave_para_indice = {p: i for i, p in enumerate(vocabulario)}
+
+    chave = chave_validade(vocabulario)
+    caminho = artefatos.caminho_artefato("validade", chave, "npz")
+
+    if os.path.exists(caminho):
+        mascara, excecoes = carregar_validade(caminho)
+        if len(mascara) == len(vocabulario):
+            print(f"🧮 Mapa de validade carregado: {int(mascara.sum())} de {len(mascara)} palavras aceitas")
+            return MapaValidade(chave_para_indice, mascara, excecoes, chave)
+
+    em_lote = validar is None
+    if em_lote and validar_lote is None:
+        # Só carrega os dicionários (wordfreq, pyspellchecker, hunspell) se precisar recalcular
+        from routes import dicionario
+        validar_lote = dicionario.validar_lote
+    if em_lote:
+        validar = validar_lote
+
+    print("🧮 Calculando mapa de validade do vocabulário (passo único)...")
+    mascara, excecoes = calcular_validade(vocabulario, validar, em_lote)
+    salvar_validade(caminho, mascara, excecoes)
+    artefatos.remover_versoes_antigas("validade", caminho)
+
+    print(f"💾 Mapa de validade salvo em {caminho}: {int(mascara.sum())} de {len(mascara)} palavras aceitas")
+    return MapaValidade(chave_para_indice, mascara, excecoes, chave)
+
+
+
+# PASSO OFFLINE: python -m routes.validade
+if __name__ == "__main__":
+    from routes.model_loader import carregar_modelo
+    word2vec = carregar_modelo()
+
+    if word2vec is None:
+        print("❌ Modelo não carregado; nada a fazer.")
+        sys.exit(1)
+
+    obter_mapa_validade(word2vec.index_to_key, word2vec.key_to_index)
@@ -56,7 +56,7 @@ document.addEventListener('DOMContentLoaded', () => {
             contador.textContent = totalTentativas;
 
             // Adiciona ao histórico
-            adicionarTentativa(data.palavra_exibida || palavra, data.similaridade);
+            adicionarTentativa(data.palavra_exibida || palavra, data.similaridade, data.posicao);
 
             // Atualiza barra de progresso
             atualizarProgressBar(data.similaridade);
@@ -67,7 +67,8 @@ document.addEventListener('DOMContentLoaded', () => {
                 mostrarVitoria(data.palavra_secreta, data.tempo_proximo);
             } else {
                 const emoji = getEmojiTemperatura(data.similaridade);
-                mostrarFeedback(`${emoji} ${data.similaridade}% de similaridade`, '#00d4ff');
+                const textoPosicao = data.posicao ? ` (posição ${data.posicao})` : '';
+                mostrarFeedback(`${emoji} ${data.similaridade}% de similaridade${textoPosicao}`, '#00d4ff');
             }
 
             input.value = '';
@@ -86,7 +87,7 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // Adicionar tentativa ao histórico
-    function adicionarTentativa(palavra, similaridade) {
+    function adicionarTentativa(palavra, similaridade, posicao) {
         const div = document.createElement('div');
         div.className = 'tentativa-item';
         
@@ -95,11 +96,12 @@ document.addEventListener('DOMContentLoaded', () => {
 
         const classe = getClasseScore(similaridade);
         const emoji = getEmojiTemperatura(similaridade);
+        const textoPosicao = posicao ? ` · #${posicao}` : '';
 
         div.innerHTML = `
             <span class="tentativa-palavra">${palavra}</span>
             <div class="tentativa-score">
-                <span class="score-badge ${classe}">${emoji} ${similaridade}%</span>
+                <span class="score-badge ${classe}">${emoji} ${similaridade}%${textoPosicao}</span>
             </div>
         `;
 